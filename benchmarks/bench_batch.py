@@ -0,0 +1,47 @@
+"""Batched SAW/WP engine vs. the per-call loop.
+
+Run from the repository root as a module, so that the dss package is importable::
+
+    python -m benchmarks.bench_batch --help
+"""
+import argparse
+import time
+
+import numpy as np
+
+from dss.batch import batch_saw, batch_wp
+from dss.saw import saw_method
+from dss.wp import wp_method
+
+
+def _time(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batched SAW/WP engine vs. the per-call loop")
+    parser.add_argument('--alternatives', type=int, default=50)
+    parser.add_argument('--criteria', type=int, default=8)
+    parser.add_argument('--scenarios', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    decision_matrix = rng.uniform(1, 100, size=(args.alternatives, args.criteria))
+    criteria_types = np.array(['benefit', 'cost'] * args.criteria)[:args.criteria]
+    weight_matrix = rng.dirichlet(np.ones(args.criteria), size=args.scenarios)
+
+    print(f"{args.scenarios} scenarios x {args.alternatives} alternatives x {args.criteria} criteria")
+    for name, method, batched in (('SAW', saw_method, batch_saw), ('WP', wp_method, batch_wp)):
+        loop_time, loop_scores = _time(
+            lambda: np.array([method(decision_matrix, w, criteria_types)[1] for w in weight_matrix]))
+        batch_time, (batch_scores, _) = _time(batched, decision_matrix, weight_matrix, criteria_types)
+        max_diff = np.abs(loop_scores - batch_scores).max()
+        print(f"{name}: loop {loop_time * 1e3:9.1f} ms | batch {batch_time * 1e3:8.1f} ms | "
+              f"speedup {loop_time / batch_time:6.1f}x | max |diff| {max_diff:.2e}")
+
+
+if __name__ == '__main__':
+    main()
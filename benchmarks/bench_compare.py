@@ -0,0 +1,65 @@
+"""Shared-normalization comparison run vs. one method at a time.
+
+Run from the repository root as a module, so that the dss package is importable::
+
+    python -m benchmarks.bench_compare --help
+"""
+import argparse
+import time
+
+import numpy as np
+
+from dss.compare import compare_methods, compare_scores, rank_correlations
+from dss.saw import saw_method
+from dss.topsis import topsis_scores
+from dss.wp import wp_method
+
+
+def _best_time(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shared-normalization comparison run vs. one method at a time")
+    parser.add_argument('--alternatives', type=int, default=1_000_000)
+    parser.add_argument('--criteria', type=int, default=8)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    matrix = rng.uniform(1, 100, size=(args.alternatives, args.criteria))
+    weights = rng.dirichlet(np.ones(args.criteria))
+    criteria_types = np.where(np.arange(args.criteria) % 2 == 0, 'benefit', 'cost')
+    is_benefit_criteria = criteria_types == 'benefit'
+    print(f"{args.alternatives} alternatives x {args.criteria} criteria")
+
+    singles = {
+        'saw_method': lambda: saw_method(matrix, weights, criteria_types),
+        'wp_method': lambda: wp_method(matrix, weights, criteria_types),
+        'topsis_scores': lambda: topsis_scores(matrix, weights, is_benefit_criteria),
+    }
+    times = {name: _best_time(func, args.repeat) for name, func in singles.items()}
+    for name, elapsed in times.items():
+        print(f"{name:>22}: {elapsed * 1e3:9.2f} ms")
+    print(f"{'three separate runs':>22}: {sum(times.values()) * 1e3:9.2f} ms")
+
+    shared = _best_time(lambda: compare_scores(matrix, weights, criteria_types), args.repeat)
+    ratio = shared / min(times.values())
+    print(f"{'compare_scores':>22}: {shared * 1e3:9.2f} ms = {ratio:.2f}x the fastest "
+          f"and {shared / max(times.values()):.2f}x the slowest single method "
+          f"(target 1.3x the fastest: {'met' if ratio <= 1.3 else 'MISSED'})")
+    consensus = _best_time(lambda: compare_methods(matrix, weights, criteria_types), args.repeat)
+    print(f"{'+ ranks and Borda':>22}: {consensus * 1e3:9.2f} ms")
+    scores = compare_scores(matrix, weights, criteria_types)
+    correlations = _best_time(lambda: rank_correlations(scores), 1)
+    print(f"{'rank correlations':>22}: {correlations * 1e3:9.2f} ms (Kendall tau and Spearman rho, 3 pairs)")
+
+
+if __name__ == '__main__':
+    main()
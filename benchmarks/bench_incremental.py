@@ -0,0 +1,67 @@
+"""Incremental top-k re-ranking vs. a full recompute.
+
+Run from the repository root as a module, so that the dss package is importable::
+
+    python -m benchmarks.bench_incremental --help
+"""
+import argparse
+import time
+
+import numpy as np
+
+from dss.incremental import IncrementalRanking
+from dss.saw import saw_method
+from dss.wp import wp_method
+
+
+def _median_ms(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return np.median(times) * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental top-k re-ranking vs. a full recompute")
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--criteria', type=int, default=6)
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    matrix = rng.uniform(1, 100, size=(args.rows, args.criteria))
+    weights = rng.dirichlet(np.ones(args.criteria))
+    criteria_types = np.where(np.arange(args.criteria) % 2 == 0, 'benefit', 'cost')
+    # Rows strictly inside the column ranges leave every max/min where it is
+    inner_rows = rng.uniform(2, 99, size=(args.repeat, args.criteria))
+    outer_rows = rng.uniform(100, 101, size=(args.repeat, args.criteria))
+    print(f"{args.rows} rows x {args.criteria} criteria, k={args.k}")
+
+    cases = (
+        ('saw', lambda m: saw_method(m, weights, criteria_types)[1]),
+        ('wp', lambda m: wp_method(m, weights, criteria_types)[1]),
+    )
+    for method, full in cases:
+        ranking = IncrementalRanking(method, weights, criteria_types, k=args.k, capacity=args.rows + 4 * args.repeat)
+        ranking.append(matrix)
+        ranking.top_k()
+        full_ms = _median_ms(lambda: np.argsort(-full(matrix), kind='stable')[:args.k], 3)
+        query_ms = _median_ms(ranking.top_k, args.repeat)
+        rows = iter(inner_rows)
+        append_ms = _median_ms(lambda: (ranking.append(next(rows)), ranking.top_k()), args.repeat)
+        indices = iter(rng.integers(args.rows, size=args.repeat))
+        rows = iter(inner_rows)
+        update_ms = _median_ms(lambda: (ranking.update(int(next(indices)), next(rows)), ranking.top_k()), args.repeat)
+        rows = iter(outer_rows)
+        rescale_ms = _median_ms(lambda: (ranking.append(next(rows)), ranking.top_k()), min(args.repeat, 5))
+        print(f"{method:>6}: full recompute {full_ms:9.3f} ms | top-k query {query_ms:7.3f} ms | "
+              f"append+query {append_ms:7.3f} ms | update+query {update_ms:7.3f} ms | "
+              f"stat-moving append+query {rescale_ms:9.3f} ms | full re-scores {ranking.full_rescores}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""Batch runner throughput by worker count and chunk size.
+
+Run from the repository root as a module, so that the dss package is importable::
+
+    python -m benchmarks.bench_runner --help
+"""
+import argparse
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from dss.runner import METHODS, run_batch
+
+
+# Function to write `count` random problem files, cycling through SAW, WP, TOPSIS and AHP
+def write_problems(directory, count, n_alternatives, n_criteria, seed):
+    rng = np.random.default_rng(seed)
+
+    def comparison_matrix(n):
+        judgments = np.exp(rng.normal(0.0, 0.5, size=(n, n)))
+        return np.triu(judgments, k=1) + np.triu(1 / judgments, k=1).T + np.eye(n)
+
+    for k in range(count):
+        method = METHODS[k % len(METHODS)]
+        if method == 'ahp':
+            problem = {'method': 'ahp', 'criteria_matrix': comparison_matrix(n_criteria).tolist(),
+                       'alternative_matrices': [comparison_matrix(min(n_alternatives, 20)).tolist()
+                                                for _ in range(n_criteria)]}
+        else:
+            problem = {'method': method, 'matrix': rng.uniform(1, 100, size=(n_alternatives, n_criteria)).tolist(),
+                       'weights': rng.dirichlet(np.ones(n_criteria)).tolist(),
+                       'criteria_types': np.where(np.arange(n_criteria) % 2 == 0, 'benefit', 'cost').tolist()}
+        with open(os.path.join(directory, f'unit_{k:06d}.json'), 'w') as handle:
+            json.dump(problem, handle)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch runner throughput by worker count and chunk size")
+    parser.add_argument('--problems', type=int, default=2_000)
+    parser.add_argument('--alternatives', type=int, default=100)
+    parser.add_argument('--criteria', type=int, default=6)
+    parser.add_argument('--workers', type=int, nargs='+', default=sorted({0, os.cpu_count() or 1}))
+    parser.add_argument('--chunk-sizes', type=int, nargs='+', default=[1, 16, 128])
+    parser.add_argument('--format', choices=['parquet', 'csv'], default='parquet')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        problems = os.path.join(directory, 'problems')
+        os.makedirs(problems)
+        write_problems(problems, args.problems, args.alternatives, args.criteria, args.seed)
+        print(f"{args.problems:,} problems of {args.alternatives} alternatives x {args.criteria} criteria, "
+              f"{os.cpu_count()} CPUs")
+        for workers in args.workers:
+            for chunk_size in args.chunk_sizes:
+                output = os.path.join(directory, f'results.{args.format}')
+                summary, errors = run_batch(problems, output, workers=workers, chunk_size=chunk_size, resume=False)
+                print(f"workers {workers:2d}, chunk {chunk_size:4d}: {summary['elapsed_s']:7.2f} s, "
+                      f"{summary['problems_per_s']:8,.1f} problems/s, {summary['rows_per_s']:10,.0f} rows/s, "
+                      f"p50 {summary['p50_ms']:6.2f} ms, p99 {summary['p99_ms']:6.2f} ms, {len(errors)} failed")
+
+
+if __name__ == '__main__':
+    main()
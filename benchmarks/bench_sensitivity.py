@@ -0,0 +1,82 @@
+"""Analytic weight-sensitivity thresholds vs. grid search.
+
+Run from the repository root as a module, so that the dss package is importable::
+
+    python -m benchmarks.bench_sensitivity --help
+"""
+import argparse
+import time
+
+import numpy as np
+
+from dss.saw import saw_method
+from dss.sensitivity import rank_reversal_thresholds, weight_sensitivity
+from dss.topsis import topsis_scores
+
+
+# Function to find the critical weight changes the brute-force way: re-run the method for
+# every grid value of one weight at a time and report the nearest grid value below and above
+# the current weight at which the best alternative changes (-inf / inf when it never does)
+def grid_search(score, weights, n_grid, span):
+    best = np.argmax(score(weights))
+    decrease = np.full(len(weights), -np.inf)
+    increase = np.full(len(weights), np.inf)
+    for k in range(len(weights)):
+        for values, bound, direction in ((np.linspace(weights[k], 0.0, n_grid), decrease, -1),
+                                         (np.linspace(weights[k], weights[k] + span, n_grid), increase, 1)):
+            for value in values[1:]:
+                trial = weights.copy()
+                trial[k] = value
+                if np.argmax(score(trial)) != best:
+                    bound[k] = value - weights[k]
+                    break
+    return decrease, increase
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analytic weight-sensitivity thresholds vs. grid search")
+    parser.add_argument('--rows', type=int, default=10_000)
+    parser.add_argument('--criteria', type=int, default=6)
+    parser.add_argument('--grid', type=int, default=100, help="grid points per weight and direction")
+    parser.add_argument('--pairs-rows', type=int, default=1_000, help="alternatives for the all-pairs table")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    matrix = rng.uniform(1, 100, size=(args.rows, args.criteria))
+    weights = rng.dirichlet(np.ones(args.criteria))
+    criteria_types = np.where(np.arange(args.criteria) % 2 == 0, 'benefit', 'cost')
+    print(f"{args.rows} alternatives x {args.criteria} criteria, grid of {args.grid} points per weight and direction")
+
+    scorers = {
+        'saw': lambda w: saw_method(matrix, w, criteria_types)[1],
+        'topsis': lambda w: topsis_scores(matrix, w, criteria_types == 'benefit'),
+    }
+    for method, score in scorers.items():
+        start = time.perf_counter()
+        result = weight_sensitivity(method, matrix, weights, criteria_types)
+        analytic_s = time.perf_counter() - start
+        start = time.perf_counter()
+        decrease, increase = grid_search(score, weights, args.grid, span=weights.sum())
+        grid_s = time.perf_counter() - start
+        # The grid overshoots each threshold by at most one step, and misses those in its last step or beyond
+        step = weights.sum() / (args.grid - 1)
+        down_step = weights / (args.grid - 1)
+        with np.errstate(invalid='ignore'):
+            overshoot_up = increase - result.increase
+            overshoot_down = result.decrease - decrease
+            agrees = (np.where(np.isfinite(increase), (overshoot_up >= 0) & (overshoot_up <= step),
+                               result.increase > weights.sum() - step).all()
+                      and np.where(np.isfinite(decrease), (overshoot_down >= 0) & (overshoot_down <= down_step),
+                                   result.decrease < -weights + down_step).all())
+        start = time.perf_counter()
+        rank_reversal_thresholds(method, matrix[:args.pairs_rows], weights, criteria_types)
+        pairs_s = time.perf_counter() - start
+        n_pairs = args.pairs_rows * (args.pairs_rows - 1) // 2
+        print(f"{method:>6}: analytic {analytic_s * 1e3:9.2f} ms | grid search {grid_s * 1e3:10.1f} ms "
+              f"({grid_s / analytic_s:,.0f}x slower, resolution {step:.1e}, grid agrees: {bool(agrees)}) | "
+              f"all {n_pairs:,} pairs x {args.criteria} criteria {pairs_s * 1e3:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
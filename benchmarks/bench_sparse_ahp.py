@@ -0,0 +1,57 @@
+"""Incomplete-comparison AHP vs. the dense complete-matrix path.
+
+Run from the repository root as a module, so that the dss package is importable::
+
+    python -m benchmarks.bench_sparse_ahp --help
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from dss.ahp import ahp_attributes
+from dss.sparse_ahp import incomplete_priorities, simulate_judgments, suggest_comparisons
+
+
+def _time(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+# Function to build the full reciprocal comparison matrix of noisy judgments of `truth`
+def complete_matrix(truth, sigma, rng):
+    n = len(truth)
+    noise = np.triu(rng.normal(0.0, sigma, size=(n, n)), k=1)
+    return truth[:, None] / truth[None, :] * np.exp(noise - noise.T)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incomplete-comparison AHP vs. the dense complete-matrix path")
+    parser.add_argument('--items', type=int, nargs='+', default=[100, 500, 2_000, 10_000])
+    parser.add_argument('--extra', type=float, default=2.0, help="comparisons per item beyond a spanning tree")
+    parser.add_argument('--sigma', type=float, default=0.2)
+    parser.add_argument('--dense-limit', type=int, default=2_000, help="largest n for the complete matrix")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    for n in args.items:
+        first, second, values, truth = simulate_judgments(n, args.extra, args.sigma, args.seed)
+        result, solve_s = _time(lambda: incomplete_priorities(n, first, second, values))
+        _, suggest_s = _time(lambda: suggest_comparisons(n, first, second, count=10))
+        error = np.abs(np.log(result.priorities / truth)).max()
+        line = (f"n={n:6d}: {len(values):7,} judgments ({len(values) / (n * (n - 1) / 2):6.2%} of pairs) | "
+                f"CG solve {solve_s * 1e3:8.1f} ms in {result.iterations:3d} iterations, GCI {result.consistency_index:.3f}, "
+                f"max |log error| {error:.2f} | 10 suggestions {suggest_s * 1e3:8.1f} ms")
+        if n <= args.dense_limit:
+            matrix = complete_matrix(truth, args.sigma, np.random.default_rng(args.seed))
+            dense, dense_s = _time(lambda: ahp_attributes(pd.DataFrame(matrix)))
+            dense_error = np.abs(np.log(dense['priority index'].to_numpy() / truth)).max()
+            line += (f" | dense ahp_attributes on all {n * (n - 1) // 2:,} pairs {dense_s * 1e3:8.1f} ms, "
+                     f"max |log error| {dense_error:.2f}")
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""Cold-start import time, time to first paint and rerun latency per page.
+
+Run from the repository root as a module, so that the dss package is importable::
+
+    python -m benchmarks.bench_startup --help
+"""
+import argparse
+import ast
+import glob
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ('numpy', 'pandas', 'pyarrow')
+
+
+# Function to time a page's module-level import statements, in order, in this (fresh) process
+def import_time(page):
+    with open(page) as handle:
+        tree = ast.parse(handle.read(), page)
+    imports = ast.Module([node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))], [])
+    code = compile(imports, page, 'exec')
+    start = time.perf_counter()
+    exec(code, {'__name__': '__bench__'})
+    return time.perf_counter() - start
+
+
+# Function to run a page cold with AppTest: time to the first rendered element, the whole first
+# run and the median rerun, and which heavy libraries were loaded when the first element was sent
+def page_timings(page, reruns):
+    from streamlit.runtime.scriptrunner_utils.script_run_context import ScriptRunContext
+    from streamlit.testing.v1 import AppTest
+
+    first_paint = {}
+    enqueue = ScriptRunContext.enqueue
+
+    def timed_enqueue(self, msg):
+        if not first_paint and msg.WhichOneof('type') == 'delta':
+            first_paint['at'] = time.perf_counter()
+            first_paint['heavy'] = [name for name in HEAVY_MODULES if name in sys.modules]
+        return enqueue(self, msg)
+
+    ScriptRunContext.enqueue = timed_enqueue
+    app = AppTest.from_file(page, default_timeout=120)
+    run_start = time.perf_counter()
+    app.run()
+    first_run = time.perf_counter() - run_start
+    rerun_times = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        app.run()
+        rerun_times.append(time.perf_counter() - start)
+    return {'first_paint_s': first_paint['at'] - run_start,
+            'first_run_s': first_run, 'rerun_s': statistics.median(rerun_times),
+            'loaded_at_paint': first_paint['heavy'], 'exceptions': len(app.exception)}
+
+
+def child(page, mode, reruns):
+    sys.path.insert(0, ROOT)
+    result = {'import_s': import_time(page)} if mode == 'imports' else page_timings(page, reruns)
+    print(json.dumps(result))
+
+
+def run_child(page, mode, reruns):
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', page, '--mode', mode,
+                             '--reruns', str(reruns)], capture_output=True, text=True, check=True, cwd=ROOT)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-start import time, time to first paint and rerun latency per page")
+    parser.add_argument('pages', nargs='*', help="page files (default: main.py and pages/*.py)")
+    parser.add_argument('--reruns', type=int, default=5)
+    parser.add_argument('--child')
+    parser.add_argument('--mode', choices=['imports', 'run'], default='run')
+    args = parser.parse_args()
+    if args.child:
+        child(args.child, args.mode, args.reruns)
+        return
+
+    pages = args.pages or [os.path.join(ROOT, 'main.py')] + sorted(glob.glob(os.path.join(ROOT, 'pages', '*.py')))
+    print(f"{'page':<20} {'imports':>9} {'1st paint':>10} {'1st run':>9} {'rerun':>9}  loaded at first paint")
+    for page in pages:
+        imports = run_child(page, 'imports', args.reruns)
+        timings = run_child(page, 'run', args.reruns)
+        loaded = ', '.join(timings['loaded_at_paint']) or '-'
+        failed = f"  ({timings['exceptions']} exceptions)" if timings['exceptions'] else ''
+        print(f"{os.path.basename(page):<20} {imports['import_s'] * 1e3:7.0f}ms {timings['first_paint_s'] * 1e3:8.0f}ms "
+              f"{timings['first_run_s'] * 1e3:7.0f}ms {timings['rerun_s'] * 1e3:7.0f}ms  {loaded}{failed}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Streaming top-k vs. in-memory ranking on a CSV file.
+
+Run from the repository root as a module, so that the dss package is importable::
+
+    python -m benchmarks.bench_streaming --help
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from dss.saw import saw_method
+from dss.streaming import stream_saw, stream_topsis, stream_wp
+from dss.topsis import topsis_scores
+from dss.wp import wp_method
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming top-k vs. in-memory ranking on a CSV file")
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--criteria', type=int, default=6)
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--chunk-size', type=int, default=100_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    matrix = rng.uniform(1, 100, size=(args.rows, args.criteria))
+    weights = rng.dirichlet(np.ones(args.criteria))
+    criteria_types = np.where(rng.random(args.criteria) > 0.5, 'benefit', 'cost')
+    is_benefit_criteria = criteria_types == 'benefit'
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'matrix.csv')
+        pd.DataFrame(matrix, columns=[f'C{j + 1}' for j in range(args.criteria)]).to_csv(path, index=False)
+        print(f"{args.rows} rows x {args.criteria} criteria, k={args.k}, chunk size {args.chunk_size}")
+
+        cases = (
+            ('SAW', stream_saw, criteria_types, lambda: saw_method(matrix, weights, criteria_types)[1]),
+            ('WP', stream_wp, criteria_types, lambda: wp_method(matrix, weights, criteria_types)[1]),
+            ('TOPSIS', stream_topsis, is_benefit_criteria, lambda: topsis_scores(matrix, weights, is_benefit_criteria)),
+        )
+        for name, stream, types, in_memory in cases:
+            start = time.perf_counter()
+            rows, scores = stream(path, weights, types, k=args.k, chunk_size=args.chunk_size)
+            elapsed = time.perf_counter() - start
+            expected = in_memory()
+            expected_rows = np.argsort(-expected, kind='stable')[:args.k]
+            same = np.array_equal(rows, expected_rows) and np.allclose(scores, expected[expected_rows])
+            print(f"{name:>6}: streamed in {elapsed:6.2f} s | matches in-memory top-k: {same}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""TOPSIS kernel benchmark grid.
+
+Run from the repository root as a module, so that the dss package is importable::
+
+    python -m benchmarks.bench_topsis --help
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from dss.topsis import topsis, topsis_scores
+
+
+def _best_of(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TOPSIS kernel benchmark grid")
+    parser.add_argument('--alternatives', type=int, nargs='+', default=[1000, 10000, 50000])
+    parser.add_argument('--criteria', type=int, nargs='+', default=[5, 20, 40])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'alternatives':>12} {'criteria':>8} {'DataFrame':>10} {'float64':>9} {'float32':>9} {'in-place':>9}  (ms)")
+    for n_alternatives in args.alternatives:
+        for n_criteria in args.criteria:
+            matrix = rng.uniform(1, 10, size=(n_alternatives, n_criteria))
+            weights = rng.dirichlet(np.ones(n_criteria))
+            is_benefit_criteria = rng.random(n_criteria) > 0.5
+            alternative_data = pd.DataFrame(matrix, columns=[f'C{j + 1}' for j in range(n_criteria)])
+            alternative_data.insert(0, 'index', [f'A{i + 1}' for i in range(n_alternatives)])
+            matrix32 = matrix.astype(np.float32)
+            closeness = np.empty(n_alternatives)
+
+            timings = (
+                _best_of(lambda: topsis(alternative_data.copy(), weights, is_benefit_criteria), args.repeat),
+                _best_of(lambda: topsis_scores(matrix, weights, is_benefit_criteria), args.repeat),
+                _best_of(lambda: topsis_scores(matrix32, weights, is_benefit_criteria, dtype=np.float32), args.repeat),
+                _best_of(lambda: topsis_scores(matrix.copy(), weights, is_benefit_criteria,
+                                               overwrite_input=True, out=closeness), args.repeat),
+            )
+            print(f"{n_alternatives:>12} {n_criteria:>8} " + " ".join(f"{t * 1e3:>9.2f}" for t in timings))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+"""Load test for the MCDM scoring service.
+
+Run from the repository root as a module, so that the dss package is importable::
+
+    python -m benchmarks.load_test --help
+"""
+import argparse
+import http.client
+import json
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import numpy as np
+import pandas as pd
+
+from dss.ahp import ahp_attributes, consistency_check
+from dss.saw import saw_method
+from dss.topsis import topsis
+from dss.wp import wp_method
+
+ARROW_STREAM = 'application/vnd.apache.arrow.stream'
+
+
+# Function to build random problems for an endpoint (same shape, so the service can coalesce them)
+def make_problems(method, n_problems, n_alternatives, n_criteria, seed=0):
+    rng = np.random.default_rng(seed)
+    problems = []
+    for _ in range(n_problems):
+        if method == 'ahp':
+            priorities = rng.uniform(1, 9, size=n_criteria)
+            matrix = priorities[:, None] / priorities[None, :]
+            problems.append({'matrix': matrix.tolist()})
+        else:
+            problems.append({
+                'matrix': rng.uniform(1, 100, size=(n_alternatives, n_criteria)).tolist(),
+                'weights': rng.dirichlet(np.ones(n_criteria)).tolist(),
+                'criteria_types': ['benefit' if j % 2 == 0 else 'cost' for j in range(n_criteria)],
+            })
+    return problems
+
+
+# Function to score a problem with the library functions used by the Streamlit pages
+def expected_result(method, problem):
+    matrix = np.asarray(problem['matrix'], dtype=np.float64)
+    if method == 'ahp':
+        frame = pd.DataFrame(matrix)
+        priority_df = ahp_attributes(frame)
+        return priority_df['priority index'].to_numpy(), consistency_check(priority_df, frame)[1]
+    criteria_types = np.array(problem['criteria_types'])
+    if method == 'saw':
+        return saw_method(matrix, problem['weights'], criteria_types)[1]
+    if method == 'wp':
+        return wp_method(matrix, problem['weights'], criteria_types)[1]
+    frame = pd.DataFrame(matrix)
+    frame.insert(0, 'index', range(len(matrix)))
+    return topsis(frame, problem['weights'], criteria_types == 'benefit')['Closeness Coefficient'].to_numpy()
+
+
+def matches(method, problem, response, rtol=1e-9):
+    expected = expected_result(method, problem)
+    if method == 'ahp':
+        return (np.allclose(response['priorities'], expected[0], rtol=rtol)
+                and np.isclose(response['consistency_ratio'], expected[1], rtol=rtol, atol=1e-12))
+    return np.allclose(response['scores'], expected, rtol=rtol)
+
+
+def arrow_body(problem):
+    import pyarrow as pa
+
+    matrix = np.asarray(problem['matrix'])
+    table = pa.table({f'C{j + 1}': matrix[:, j] for j in range(matrix.shape[1])})
+    fields = {key: value for key, value in problem.items() if key != 'matrix'}
+    table = table.replace_schema_metadata({'dss': json.dumps(fields)})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+# Function to send one request per problem from `concurrency` threads (one keep-alive
+# connection each); returns the client-side latencies, responses and wall time
+def run_load(url, method, problems, concurrency, use_arrow=False):
+    parts = urlsplit(url)
+    bodies = [arrow_body(problem) if use_arrow else json.dumps(problem).encode() for problem in problems]
+    content_type = ARROW_STREAM if use_arrow else 'application/json'
+
+    def worker(indices):
+        connection = http.client.HTTPConnection(parts.hostname, parts.port)
+        results = []
+        for i in indices:
+            start = time.perf_counter()
+            connection.request('POST', f'/{method}', bodies[i], {'Content-Type': content_type})
+            response = connection.getresponse()
+            payload = response.read()
+            results.append((i, time.perf_counter() - start, response.status, payload))
+        connection.close()
+        return results
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        chunks = executor.map(worker, [range(k, len(problems), concurrency) for k in range(concurrency)])
+        results = sorted(result for chunk in chunks for result in chunk)
+    elapsed = time.perf_counter() - start
+    latencies = np.array([latency for _, latency, _, _ in results])
+    responses = [json.loads(payload) if status == 200 else None for _, _, status, payload in results]
+    return latencies, responses, elapsed
+
+
+def fetch_metrics(url):
+    parts = urlsplit(url)
+    connection = http.client.HTTPConnection(parts.hostname, parts.port)
+    connection.request('GET', '/metrics')
+    return json.loads(connection.getresponse().read())
+
+
+def wait_until_ready(url, timeout=30.0):
+    parts = urlsplit(url)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=1)
+            connection.request('GET', '/health')
+            if connection.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Scoring service at {url} did not start within {timeout:.0f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test for the MCDM scoring service")
+    parser.add_argument('--url', help="running service to test (default: start a local instance)")
+    parser.add_argument('--port', type=int, default=8765, help="port of the local instance")
+    parser.add_argument('--workers', type=int, default=None, help="scoring processes of the local instance")
+    parser.add_argument('--window-ms', type=float, default=5.0)
+    parser.add_argument('--methods', nargs='+', default=['saw', 'wp', 'topsis', 'ahp'])
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--alternatives', type=int, default=50)
+    parser.add_argument('--criteria', type=int, default=8)
+    parser.add_argument('--arrow', action='store_true', help="send Arrow IPC instead of JSON")
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        url = f'http://127.0.0.1:{args.port}'
+        command = [sys.executable, '-m', 'dss.service', '--port', str(args.port), '--window-ms', str(args.window_ms)]
+        if args.workers is not None:
+            command += ['--workers', str(args.workers)]
+        server = subprocess.Popen(command)
+    failed = False
+    try:
+        wait_until_ready(url)
+        for method in args.methods:
+            problems = make_problems(method, args.requests, args.alternatives, args.criteria)
+            latencies, responses, elapsed = run_load(url, method, problems, args.concurrency, args.arrow)
+            errors = sum(response is None for response in responses)
+            mismatches = sum(response is not None and not matches(method, problem, response)
+                             for problem, response in zip(problems, responses))
+            failed = failed or bool(errors or mismatches)
+            p50, p99 = np.percentile(latencies * 1e3, [50, 99])
+            print(f"{method:>7}: {len(problems)} requests in {elapsed:.2f} s = {len(problems) / elapsed:8.1f} req/s, "
+                  f"p50 {p50:7.2f} ms, p99 {p99:7.2f} ms, {errors} errors, {mismatches} mismatches")
+        metrics = fetch_metrics(url)
+        print(f"server: {metrics['batches']['count']} batches, mean size {metrics['batches']['mean_size']:.1f}")
+        for path, stats in metrics['endpoints'].items():
+            print(f"server {path:>8}: p50 {stats['p50_ms']:7.2f} ms, p99 {stats['p99_ms']:7.2f} ms, "
+                  f"{stats['throughput_rps']:8.1f} req/s over uptime")
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
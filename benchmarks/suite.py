@@ -0,0 +1,446 @@
+"""MCDM benchmark and regression suite.
+
+Run from the repository root as a module, so that the dss package is importable::
+
+    python -m benchmarks.suite --help
+"""
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from dss.ahp import EigenSolver, ahp_attributes, consistency_ratio
+from dss.analysis import saw_analysis, topsis_analysis
+from dss.batch import batch_saw, batch_wp
+from dss.compare import compare_scores, kendall_tau
+from dss.electre import electre_matrices, electre_method
+from dss.group_ahp import evaluator_consistency, group_ahp, simulate_evaluators
+from dss.incremental import IncrementalRanking
+from dss.memo import Memo, normalize_matrix_cached
+from dss.promethee import promethee_flows
+from dss.saw import normalize_matrix, saw_method
+from dss.sensitivity import weight_sensitivity
+from dss.sparse_ahp import incomplete_priorities, simulate_judgments, suggest_comparisons
+from dss.store import PACKAGE_SOURCES, ResultStore, source_fingerprint
+from dss.streaming import stream_saw
+from dss.topsis import topsis, topsis_scores
+from dss.vikor import vikor_method
+from dss.wp import wp_method
+
+PROFILES = {
+    'quick': {'alternatives': [10, 1000, 100_000], 'criteria': [3, 20], 'ahp': [3, 10, 20]},
+    'full': {'alternatives': [10, 1000, 100_000, 1_000_000], 'criteria': [3, 10, 100], 'ahp': [3, 5, 10, 15, 20]},
+}
+
+
+def _decision_problem(rng, n_alternatives, n_criteria):
+    matrix = rng.uniform(1, 100, size=(n_alternatives, n_criteria))
+    weights = rng.dirichlet(np.ones(n_criteria))
+    criteria_types = np.where(np.arange(n_criteria) % 2 == 0, 'benefit', 'cost')
+    return matrix, weights, criteria_types
+
+
+def _topsis_frame(matrix):
+    frame = pd.DataFrame(matrix, columns=[f'C{j + 1}' for j in range(matrix.shape[1])])
+    frame.insert(0, 'index', [f'A{i + 1}' for i in range(matrix.shape[0])])
+    return frame
+
+
+def _comparison_matrix(rng, n):
+    # Reciprocal matrix built from a random priority vector with multiplicative noise
+    priorities = rng.uniform(1, 9, size=n)
+    matrix = priorities[:, None] / priorities[None, :] * np.exp(rng.normal(0, 0.1, size=(n, n)))
+    upper = np.triu_indices(n, k=1)
+    matrix[upper[1], upper[0]] = 1 / matrix[upper]
+    np.fill_diagonal(matrix, 1.0)
+    return matrix
+
+
+# Function to POST one body to the ASGI scoring service in process; returns the HTTP status
+def _service_status(method, body, content_type='application/json'):
+    from dss.service import ScoringService
+
+    messages = [{'type': 'http.request', 'body': body}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {'type': 'http', 'method': 'POST', 'path': f'/{method}', 'query_string': b'',
+             'headers': [(b'content-type', content_type.encode())]}
+    service = ScoringService(n_workers=0)
+    asyncio.run(service(scope, receive, send))
+    service.shutdown()
+    return sent[0]['status']
+
+
+def _arrow_stream(table):
+    import pyarrow as pa
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+# Benchmark cases as (name, params, zero-argument callable)
+def benchmark_cases(profile, max_cells, seed=0):
+    rng = np.random.default_rng(seed)
+    for n_alternatives in profile['alternatives']:
+        for n_criteria in profile['criteria']:
+            if n_alternatives * n_criteria > max_cells:
+                continue
+            matrix, weights, criteria_types = _decision_problem(rng, n_alternatives, n_criteria)
+            is_benefit_criteria = criteria_types == 'benefit'
+            frame = _topsis_frame(matrix)
+            params = {'alternatives': n_alternatives, 'criteria': n_criteria}
+            yield 'saw_method', params, lambda m=matrix, w=weights, t=criteria_types: saw_method(m, w, t)
+            yield 'wp_method', params, lambda m=matrix, w=weights, t=criteria_types: wp_method(m, w, t)
+            yield 'topsis', params, lambda f=frame, w=weights, b=is_benefit_criteria: topsis(f.copy(), w, b)
+            yield 'topsis_scores', params, lambda m=matrix, w=weights, b=is_benefit_criteria: topsis_scores(m, w, b)
+    for n in profile['ahp']:
+        matrix = _comparison_matrix(rng, n)
+        names = [f'X{i + 1}' for i in range(n)]
+        ahp_df = pd.DataFrame(matrix, index=names, columns=names)
+        priority_index = ahp_attributes(ahp_df)
+        params = {'n': n}
+        yield 'ahp_attributes', params, lambda d=ahp_df: ahp_attributes(d)
+        yield 'consistency_ratio', params, lambda p=priority_index, d=ahp_df: consistency_ratio(p, d)
+        yield 'ahp_eigen', params, lambda m=matrix: EigenSolver().solve(m)
+
+
+def _best_time(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# Function to measure peak traced memory and the number of allocated blocks of one call
+def _memory_profile(func):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocations = sum(stat.count_diff for stat in after.compare_to(before, 'lineno') if stat.count_diff > 0)
+    return peak, allocations
+
+
+def run_suite(profile, repeat, max_cells):
+    results = []
+    for name, params, func in benchmark_cases(profile, max_cells):
+        func()  # warm-up
+        elapsed = _best_time(func, repeat)
+        peak, allocations = _memory_profile(func)
+        results.append({'name': name, 'params': params, 'time_s': elapsed,
+                        'peak_bytes': peak, 'allocations': allocations})
+        print(f"{name:>18} {json.dumps(params):<40} {elapsed * 1e3:10.3f} ms "
+              f"{peak / 2**20:9.2f} MiB {allocations:8d} allocs")
+    return results
+
+
+# Function to append and update rows of an IncrementalRanking in random order, comparing
+# its top-k and scores with a full recompute by `reference` along the way. Updates copy
+# existing rows, so exact ties are compared by score: rows scored one at a time may
+# differ from the full recompute in the last bit and swap places with their twins.
+def _check_incremental(rng, method, matrix, weights, criteria_types, reference, rtol, k=10):
+    ranking = IncrementalRanking(method, weights, criteria_types, k=k)
+    current = matrix[:50].copy()
+    ranking.append(current)
+    passed = True
+    for step, i in enumerate(range(50, len(matrix), 5)):
+        if step % 2:
+            row = int(rng.integers(len(current)))
+            current[row] = matrix[rng.integers(len(matrix))]
+            ranking.update(row, current[row])
+        ranking.append(matrix[i:i + 5])
+        current = np.vstack([current, matrix[i:i + 5]])
+        expected = reference(current)
+        rows, scores = ranking.top_k()
+        order = np.argsort(-expected, kind='stable')[:k]
+        passed = passed and np.allclose(expected[rows], expected[order], rtol=rtol) \
+            and np.allclose(scores, expected[order], rtol=rtol)
+    return passed and np.allclose(ranking.scores(), reference(current), rtol=rtol)
+
+
+# Function to check that the optimized paths reproduce the reference implementations
+def check_equivalence(seed=0, rtol=1e-10):
+    rng = np.random.default_rng(seed)
+    matrix, weights, criteria_types = _decision_problem(rng, 500, 7)
+    is_benefit_criteria = criteria_types == 'benefit'
+    weight_matrix = rng.dirichlet(np.ones(7), size=20)
+    checks = {}
+
+    reference = np.array([saw_method(matrix, w, criteria_types)[1] for w in weight_matrix])
+    checks['batch_saw == saw_method'] = np.allclose(batch_saw(matrix, weight_matrix, criteria_types)[0], reference, rtol=rtol)
+    reference = np.array([wp_method(matrix, w, criteria_types)[1] for w in weight_matrix])
+    checks['batch_wp == wp_method'] = np.allclose(batch_wp(matrix, weight_matrix, criteria_types)[0], reference, rtol=rtol)
+
+    frame = topsis(_topsis_frame(matrix), weights, is_benefit_criteria)
+    checks['topsis_scores == topsis'] = np.allclose(topsis_scores(matrix, weights, is_benefit_criteria),
+                                                    frame['Closeness Coefficient'], rtol=rtol)
+    checks['topsis_scores float32 ~ float64'] = np.allclose(
+        topsis_scores(matrix, weights, is_benefit_criteria, dtype=np.float32), frame['Closeness Coefficient'], atol=1e-5)
+
+    checks['normalize_matrix_cached == normalize_matrix'] = np.allclose(
+        normalize_matrix_cached(Memo(), matrix, criteria_types), normalize_matrix(matrix, criteria_types), rtol=rtol)
+
+    rows, _ = stream_saw(matrix, weights, criteria_types, k=10, chunk_size=64)
+    in_memory = saw_method(matrix, weights, criteria_types)[1]
+    checks['stream_saw top-k == saw_method'] = np.array_equal(rows, np.argsort(-in_memory, kind='stable')[:10])
+    # Few distinct values, so many rows tie at the k-th score within and across chunks
+    tied = rng.integers(1, 4, size=(20_000, 2)).astype(np.float64)
+    tied_types = np.array(['benefit', 'cost'])
+    rows, _ = stream_saw(tied, [0.5, 0.5], tied_types, k=100, chunk_size=5000)
+    checks['stream_saw top-k with ties == stable sort'] = np.array_equal(
+        rows, np.argsort(-saw_method(tied, [0.5, 0.5], tied_types)[1], kind='stable')[:100])
+
+    shared = compare_scores(matrix, weights, criteria_types)
+    checks['compare_scores == saw_method/wp_method/topsis_scores'] = (
+        np.allclose(shared['saw'], saw_method(matrix, weights, criteria_types)[1], rtol=rtol)
+        and np.allclose(shared['wp'], wp_method(matrix, weights, criteria_types)[1], rtol=rtol)
+        and np.allclose(shared['topsis'], topsis_scores(matrix, weights, is_benefit_criteria), rtol=rtol))
+    x, y = rng.integers(0, 6, size=(2, 60))
+    pairs = [(np.sign(x[i] - x[j]), np.sign(y[i] - y[j])) for i in range(60) for j in range(i + 1, 60)]
+    concordant = sum(a * b for a, b in pairs)
+    expected_tau = concordant / np.sqrt(sum(a != 0 for a, _ in pairs) * sum(b != 0 for _, b in pairs))
+    checks['kendall_tau == pairwise tau-b'] = np.isclose(kendall_tau(x, y), expected_tau)
+
+    for method, reference in (('saw', lambda m: saw_method(m, weights, criteria_types)[1]),
+                              ('wp', lambda m: wp_method(m, weights, criteria_types)[1])):
+        checks[f'IncrementalRanking({method}) == full recompute'] = _check_incremental(
+            rng, method, matrix, weights, criteria_types, reference, rtol)
+
+    comparison = _comparison_matrix(rng, 8)
+    eigenvalues, eigenvectors = np.linalg.eig(comparison)
+    principal = np.argmax(eigenvalues.real)
+    expected = np.abs(eigenvectors[:, principal].real)
+    result = EigenSolver().solve(comparison)
+    checks['ahp_eigen == numpy.linalg.eig'] = (np.allclose(result.priorities, expected / expected.sum(), rtol=1e-8)
+                                               and np.isclose(result.lambda_max, eigenvalues.real[principal]))
+
+    panel = simulate_evaluators(40, 6, sigma=0.4, seed=seed)
+    priorities, ratios = evaluator_consistency(panel)
+    solved = [EigenSolver(maxsize=0).solve(matrix) for matrix in panel]
+    checks['evaluator_consistency == EigenSolver per matrix'] = (
+        np.allclose(priorities, [result.priorities for result in solved], atol=1e-9)
+        and np.allclose(ratios, [result.consistency_ratio for result in solved], atol=1e-9))
+
+    # One solver shared by threads, with a small cache that keeps evicting
+    shared = EigenSolver(maxsize=8)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        threaded = list(executor.map(lambda k: shared.solve(panel[k % len(panel)], slot=k % 3), range(400)))
+    checks['EigenSolver shared by threads == per matrix'] = all(
+        np.allclose(result.priorities, solved[k % len(panel)].priorities, atol=1e-9) for k, result in enumerate(threaded))
+    group = group_ahp(panel, 'aij', exclude_inconsistent=True)
+    expected_matrix = np.exp(np.mean([np.log(matrix) for matrix, keep in zip(panel, group.included) if keep], axis=0))
+    checks['group_ahp AIJ == geometric mean loop'] = np.allclose(group.aggregated_matrix, expected_matrix, rtol=rtol)
+
+    upper = np.triu_indices(len(comparison), k=1)
+    geometric_mean = np.exp(np.log(comparison).mean(axis=1))
+    checks['incomplete_priorities(complete) == row geometric mean'] = np.allclose(
+        incomplete_priorities(len(comparison), *upper, comparison[upper]).priorities,
+        geometric_mean / geometric_mean.sum(), rtol=1e-8)
+    first, second, values, _ = simulate_judgments(150, extra=2, sigma=0.3, seed=seed)
+    incidence = np.zeros((len(values), 150))
+    incidence[np.arange(len(values)), first] = 1.0
+    incidence[np.arange(len(values)), second] = -1.0
+    expected_log = np.linalg.lstsq(incidence, np.log(values), rcond=None)[0]
+    incomplete = incomplete_priorities(150, first, second, values)
+    checks['incomplete_priorities == dense least squares'] = np.allclose(
+        incomplete.log_priorities, expected_log - expected_log.mean(), atol=1e-7)
+    laplacian = incidence.T @ incidence
+    pseudo_inverse = np.linalg.pinv(laplacian)
+    suggested_first, suggested_second, resistance = suggest_comparisons(150, first, second, count=1)
+    missing = np.ones((150, 150), dtype=bool)
+    missing[first, second] = missing[second, first] = False
+    resistances = np.diag(pseudo_inverse)[:, None] + np.diag(pseudo_inverse)[None, :] - 2 * pseudo_inverse
+    checks['suggest_comparisons == largest missing resistance'] = np.isclose(
+        resistance[0], resistances[np.triu(missing, k=1)].max())
+
+    small, small_types = matrix[:120].round(), criteria_types
+    oriented = np.where(small_types == 'cost', -small, small)
+    differences = oriented[:, None, :] - oriented[None, :, :]
+    unit = weights / weights.sum()
+    functions, q, p = np.array(['linear', 'usual', 'gaussian'] * 2 + ['linear']), np.full(7, 1.0), np.full(7, 3.0)
+    gaussian = 1 - np.exp(-np.maximum(differences, 0) ** 2 / (2 * small.std(axis=0) ** 2))
+    linear = np.clip((differences - q) / (p - q), 0, 1)
+    tensor = np.where(functions == 'usual', differences > 0, np.where(functions == 'gaussian', gaussian, linear)) @ unit
+    expected_net = (tensor.sum(axis=1) - tensor.sum(axis=0)) / (len(small) - 1)
+    checks['promethee_flows == (n x n x m) tensor'] = all(
+        np.allclose(promethee_flows(small, weights, small_types, functions, q, p, method=method, block_cells=1000,
+                                    n_jobs=n_jobs)[2], expected_net, rtol=rtol, atol=1e-12)
+        for method, n_jobs in (('auto', 1), ('pairwise', 1), ('pairwise', 3)))
+    concordance, discordance = electre_matrices(small, weights, small_types)
+    pairs = ~np.eye(len(small), dtype=bool)
+    outranking = (concordance >= concordance[pairs].mean()) & (discordance <= discordance[pairs].mean()) & pairs
+    outranks, outranked, _ = electre_method(small, weights, small_types, block_cells=1000, n_jobs=3)
+    checks['electre_method == full outranking matrix'] = (np.array_equal(outranks, outranking.sum(axis=1))
+                                                         and np.array_equal(outranked, outranking.sum(axis=0)))
+    regret = (oriented.max(axis=0) - oriented) / (oriented.max(axis=0) - oriented.min(axis=0)) * unit
+    utility, worst_regret, _ = vikor_method(small, weights, small_types)
+    checks['vikor_method == regret loop'] = (np.allclose(utility, regret.sum(axis=1), rtol=rtol)
+                                            and np.allclose(worst_regret, regret.max(axis=1), rtol=rtol))
+
+    for method, score in (('saw', lambda w: saw_method(small, w, small_types)[1]),
+                          ('topsis', lambda w: topsis_scores(small, w, small_types == 'benefit'))):
+        sensitivity = weight_sensitivity(method, small, weights, small_types)
+        crossings = []
+        for k in range(len(weights)):
+            for change, new_best in ((sensitivity.decrease[k], sensitivity.decrease_by[k]),
+                                     (sensitivity.increase[k], sensitivity.increase_by[k])):
+                if np.isfinite(change):
+                    before, after = weights.copy(), weights.copy()
+                    before[k] += change * (1 - 1e-6)
+                    after[k] += change * (1 + 1e-6)
+                    crossings.append(np.argmax(score(before)) == sensitivity.best and np.argmax(score(after)) == new_best)
+        checks[f'weight_sensitivity({method}) == re-scored weights'] = all(crossings)
+
+    with tempfile.TemporaryDirectory() as directory:
+        stored = ResultStore(directory).fetch('saw', lambda: saw_method(matrix, weights, criteria_types), matrix, weights,
+                                              criteria_types)
+        # A second store on the same directory reads the memory-mapped arrays back from disk
+        reopened = ResultStore(directory)
+        reloaded = reopened.get(reopened.key('saw', matrix, weights, criteria_types))
+        checks['ResultStore round trip == saw_method'] = (
+            reloaded is not None and all(np.array_equal(a, b) for a, b in zip(stored, reloaded))
+            and np.array_equal(reloaded[1], saw_method(matrix, weights, criteria_types)[1]))
+
+        # A result shared by two owners is listed in the history of each, and only theirs
+        reopened.fetch('saw', lambda: saw_method(matrix, weights, criteria_types), matrix, weights, criteria_types,
+                       label='saw', owner='alice')
+        reopened.fetch('wp', lambda: wp_method(matrix, weights, criteria_types), matrix, weights, criteria_types,
+                       label='wp', owner='bob')
+        reopened.fetch('saw', lambda: saw_method(matrix, weights, criteria_types), matrix, weights, criteria_types,
+                       label='saw', owner='bob')
+        checks['ResultStore history == per owner'] = (
+            [entry['method'] for entry in reopened.history('alice')] == ['saw']
+            and sorted(entry['method'] for entry in reopened.history('bob')) == ['saw', 'wp']
+            and reopened.history('carol') == [])
+        reopened.close()
+
+        # Editing a source file changes its fingerprint, and with it every result key
+        source = os.path.join(directory, 'scoring.py')
+        fingerprints = []
+        for text in ('SCALE = 1\n', 'SCALE = 10\n'):
+            with open(source, 'w') as handle:
+                handle.write(text)
+            fingerprints.append(source_fingerprint(source, *PACKAGE_SOURCES))
+        checks['ResultStore key changes with the source'] = fingerprints[0] != fingerprints[1]
+
+        # The batch runner must reproduce the page analyses bit for bit
+        from dss.runner import run_batch
+
+        problems = os.path.join(directory, 'problems')
+        os.makedirs(problems)
+        for method in ('saw', 'topsis'):
+            with open(os.path.join(problems, f'{method}.json'), 'w') as handle:
+                json.dump({'method': method, 'matrix': small.tolist(), 'weights': weights.tolist(),
+                           'criteria_types': small_types.tolist()}, handle)
+        output = os.path.join(directory, 'results.csv')
+        run_batch(problems, output, workers=0, chunk_size=1)
+        batch = pd.read_csv(output, float_precision='round_trip').set_index(['problem', 'alternative'])['score']
+        decision_df = pd.DataFrame(small, index=[f'Alternative {i+1}' for i in range(len(small))],
+                                   columns=[f'Criteria {j+1}' for j in range(small.shape[1])])
+        saw_page = saw_analysis(decision_df, weights, small_types)['Final Scores and Rankings']
+        topsis_page = topsis_analysis(decision_df, weights, small_types == 'benefit')['TOPSIS Ranking Results']
+        checks['run_batch == page analyses'] = (
+            np.array_equal(batch.loc['saw.json'].loc[saw_page['Alternative']].to_numpy(), saw_page['Final Score'])
+            and np.array_equal(batch.loc['topsis.json'].loc[topsis_page.index].to_numpy(),
+                               topsis_page['Closeness Coefficient']))
+
+        # A rerun after a failed problem only scores that problem again
+        with open(os.path.join(problems, 'wp.json'), 'w') as handle:
+            json.dump({'method': 'wp', 'matrix': small.tolist(), 'weights': weights[:-1].tolist()}, handle)
+        retry_output = os.path.join(directory, 'retry.csv')
+        _, first_errors = run_batch(problems, retry_output, workers=0, chunk_size=1)
+        with open(os.path.join(problems, 'wp.json'), 'w') as handle:
+            json.dump({'method': 'wp', 'matrix': small.tolist(), 'weights': weights.tolist()}, handle)
+        summary, retry_errors = run_batch(problems, retry_output, workers=0, chunk_size=1)
+        checks['run_batch rerun == failed problems only'] = (
+            list(first_errors) == ['wp.json'] and not retry_errors and summary['problems'] == 1
+            and summary['skipped'] == 2 and sorted(pd.read_csv(retry_output)['problem'].unique()) == [
+                'saw.json', 'topsis.json', 'wp.json'])
+    # Malformed problems are client errors (400), not server errors
+    body = json.dumps({'matrix': small.tolist(), 'weights': weights.tolist(), 'criteria_types': 3}).encode()
+    checks['service: int criteria_types == 400'] = _service_status('saw', body) == 400
+    if importlib.util.find_spec('pyarrow') is not None:
+        import pyarrow as pa
+
+        table = pa.table({'c1': small[:, 0]}).replace_schema_metadata({'dss': '[1, 2]'})
+        checks['service: Arrow metadata not an object == 400'] = (
+            _service_status('saw', _arrow_stream(table), 'application/vnd.apache.arrow.stream') == 400)
+    return {name: bool(passed) for name, passed in checks.items()}
+
+
+# Function to list results that are slower or use more memory than the baseline by more than `threshold`
+def find_regressions(results, baseline, threshold):
+    previous = {(item['name'], json.dumps(item['params'], sort_keys=True)): item for item in baseline['results']}
+    regressions = []
+    for item in results:
+        old = previous.get((item['name'], json.dumps(item['params'], sort_keys=True)))
+        if old is None:
+            continue
+        for metric in ('time_s', 'peak_bytes'):
+            if old[metric] > 0 and item[metric] / old[metric] > 1 + threshold:
+                regressions.append((item['name'], item['params'], metric, old[metric], item[metric]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MCDM benchmark and regression suite")
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='quick')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--max-cells', type=int, default=20_000_000,
+                        help="skip decision matrices with more alternatives x criteria cells than this")
+    parser.add_argument('--output', default='benchmark_results.json', help="where to write this run's results")
+    parser.add_argument('--baseline', help="results JSON from an earlier run to compare against")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="allowed relative slowdown / memory growth before a case counts as a regression")
+    args = parser.parse_args()
+
+    checks = check_equivalence()
+    for name, passed in checks.items():
+        print(f"[{'ok' if passed else 'FAIL'}] {name}")
+
+    results = run_suite(PROFILES[args.profile], args.repeat, args.max_cells)
+    report = {
+        'meta': {'python': platform.python_version(), 'numpy': np.__version__, 'pandas': pd.__version__,
+                 'machine': platform.machine(), 'profile': args.profile},
+        'equivalence': checks,
+        'results': results,
+    }
+    with open(args.output, 'w') as handle:
+        json.dump(report, handle, indent=2)
+    print(f"Results written to {args.output}")
+
+    failed = not all(checks.values())
+    if args.baseline:
+        with open(args.baseline) as handle:
+            regressions = find_regressions(results, json.load(handle), args.threshold)
+        for name, params, metric, old, new in regressions:
+            print(f"REGRESSION {name} {json.dumps(params)} {metric}: {old:.6g} -> {new:.6g} ({new / old - 1:+.0%})")
+        failed = failed or bool(regressions)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+# Headless scoring library behind the Streamlit pages. Nothing here imports Streamlit,
+# and submodules are only loaded on first attribute access to keep `import dss` cheap.
+import importlib
+
+_EXPORTS = {
+    'normalize_matrix': 'dss.saw',
+    'saw_method': 'dss.saw',
+    'normalize_matrix_wp': 'dss.wp',
+    'wp_method': 'dss.wp',
+    'topsis': 'dss.topsis',
+    'topsis_scores': 'dss.topsis',
+    'ahp_attributes': 'dss.ahp',
+    'ahp_eigen': 'dss.ahp',
+    'EigenSolver': 'dss.ahp',
+    'consistency_check': 'dss.ahp',
+    'consistency_ratio': 'dss.ahp',
+    'is_consistent': 'dss.ahp',
+    'batch_saw': 'dss.batch',
+    'batch_wp': 'dss.batch',
+    'normalize_columns': 'dss.batch',
+    'rank_scores': 'dss.batch',
+    'batch_topsis': 'dss.batch',
+    'rank_stability': 'dss.montecarlo',
+    'ahp_rank_stability': 'dss.montecarlo',
+    'stream_saw': 'dss.streaming',
+    'stream_wp': 'dss.streaming',
+    'stream_topsis': 'dss.streaming',
+    'IncrementalRanking': 'dss.incremental',
+    'compare_scores': 'dss.compare',
+    'compare_methods': 'dss.compare',
+    'rank_correlations': 'dss.compare',
+    'group_ahp': 'dss.group_ahp',
+    'evaluator_consistency': 'dss.group_ahp',
+    'ResultStore': 'dss.store',
+    'vikor_method': 'dss.vikor',
+    'promethee_flows': 'dss.promethee',
+    'electre_method': 'dss.electre',
+    'weight_sensitivity': 'dss.sensitivity',
+    'rank_reversal_thresholds': 'dss.sensitivity',
+    'incomplete_priorities': 'dss.sparse_ahp',
+    'suggest_comparisons': 'dss.sparse_ahp',
+    'run_batch': 'dss.runner',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'dss' has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
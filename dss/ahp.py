@@ -0,0 +1,171 @@
+import hashlib
+import threading
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+from dss.profiling import stage
+
+RANDOM_INDEX = {1: 0, 2: 0, 3: 0.58, 4: 0.9, 5: 1.12, 6: 1.24, 7: 1.32,
+                8: 1.41, 9: 1.45, 10: 1.49, 11: 1.51, 12: 1.48, 13: 1.56,
+                14: 1.57, 15: 1.59, 16: 1.605, 17: 1.61, 18: 1.615, 19: 1.62, 20: 1.625}
+
+# Consistency ratios below this threshold are considered acceptable
+CONSISTENCY_THRESHOLD = 0.1
+
+
+# Function to average the column-normalized comparison matrix into priorities; a leading
+# axis stacks several matrices
+def priority_vectors(matrices):
+    matrices = np.asarray(matrices, dtype=np.float64)
+    return (matrices / matrices.sum(axis=-2, keepdims=True)).mean(axis=-1)
+
+
+# Function to calculate the consistency index and ratio of (stacked) matrices from their
+# priorities; like EigenSolver, both are 0 where they are undefined (n <= 2)
+def consistency_indices(matrices, priorities):
+    n = matrices.shape[-1]
+    lambda_max = (np.matmul(matrices, priorities[..., None])[..., 0] / priorities).mean(axis=-1)
+    consistency_index = (lambda_max - n) / (n - 1) if n > 1 else np.zeros_like(lambda_max)
+    index = random_index(n)
+    return consistency_index, consistency_index / index if index else np.zeros_like(consistency_index)
+
+
+# Function to calculate the priority index for the criteria or alternatives
+def ahp_attributes(ahp_df):
+    import pandas as pd
+
+    with stage('ahp: priority index'):
+        priorities = priority_vectors(ahp_df.select_dtypes('number').to_numpy(dtype=np.float64))
+        priority_df = pd.DataFrame(priorities, index=ahp_df.index, columns=['priority index'])
+    return priority_df
+
+
+# Function to calculate the consistency index and consistency ratio
+def consistency_check(priority_index, ahp_df):
+    with stage('ahp: consistency'):
+        consistency_index, consistency_ratio_value = consistency_indices(
+            ahp_df.to_numpy(dtype=np.float64), priority_index['priority index'].to_numpy(dtype=np.float64))
+    return float(consistency_index), float(consistency_ratio_value)
+
+
+# Function to check the consistency ratio
+def consistency_ratio(priority_index, ahp_df):
+    return consistency_check(priority_index, ahp_df)[1]
+
+
+# Function to tell whether a consistency ratio is acceptable
+def is_consistent(consistency_ratio_value):
+    return consistency_ratio_value < CONSISTENCY_THRESHOLD
+
+
+# Function to look up the Random Index; beyond n=20 use the Alonso & Lamata (2006) fit
+# lambda_max ~ 2.7699 n - 4.3513 of random reciprocal matrices
+def random_index(n):
+    if n in RANDOM_INDEX:
+        return RANDOM_INDEX[n]
+    return (1.7699 * n - 4.3513) / (n - 1)
+
+
+EigenResult = namedtuple('EigenResult', ['priorities', 'lambda_max', 'consistency_index', 'consistency_ratio', 'iterations'])
+
+
+# Function to hash a comparison matrix by content (shape and float64 bytes)
+def matrix_key(matrix):
+    matrix = np.ascontiguousarray(matrix, dtype=np.float64)
+    digest = hashlib.blake2b(matrix.tobytes(), digest_size=16)
+    digest.update(repr(matrix.shape).encode())
+    return digest.hexdigest()
+
+
+# Function to find the principal eigenvector by power iteration, starting from `start` when given
+def power_iteration(matrix, tol=1e-12, max_iter=1000, start=None):
+    n = matrix.shape[0]
+    priorities = np.full(n, 1.0 / n) if start is None or len(start) != n else np.asarray(start, dtype=np.float64) / np.sum(start)
+    for iteration in range(1, max_iter + 1):
+        product = matrix @ priorities
+        updated = product / product.sum()
+        if np.abs(updated - priorities).sum() < tol:
+            return updated, iteration
+        priorities = updated
+    return priorities, max_iter
+
+
+# Eigenvector AHP solver; results are memoized by matrix content, and `slot` names the
+# matrix (e.g. 'criteria' or a criterion name) so that an edited matrix warm-starts from
+# the previous solution of the same slot. The cache is guarded by a lock so one solver can
+# serve several threads, but slots are shared by every caller: give each session or batch
+# problem its own solver so that unrelated matrices do not warm-start from each other.
+class EigenSolver:
+    def __init__(self, tol=1e-12, max_iter=1000, maxsize=256):
+        self.tol = tol
+        self.max_iter = max_iter
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()
+        self._last = {}
+        self._lock = threading.Lock()
+
+    def solve(self, matrix, slot=None):
+        key = matrix_key(matrix)
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+                start = self._last.get(slot)
+        if result is None:
+            with stage('ahp: eigenvector'):
+                result = self._compute(np.asarray(matrix, dtype=np.float64), start)
+            with self._lock:
+                self._results[key] = result
+                if len(self._results) > self.maxsize:
+                    self._results.popitem(last=False)
+        if slot is not None:
+            with self._lock:
+                self._last[slot] = result.priorities
+        return result
+
+    def _compute(self, matrix, start):
+        n = matrix.shape[0]
+        priorities, iterations = power_iteration(matrix, self.tol, self.max_iter, start)
+        priorities.flags.writeable = False
+        lambda_max = float((matrix @ priorities).sum())
+        consistency_index = (lambda_max - n) / (n - 1) if n > 1 else 0.0
+        index = random_index(n)
+        consistency_ratio_value = consistency_index / index if index else 0.0
+        return EigenResult(priorities, lambda_max, consistency_index, consistency_ratio_value, iterations)
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+            self._last.clear()
+            self.hits = self.misses = 0
+
+
+_default_solver = EigenSolver()
+
+
+# Function to calculate eigenvector priorities, lambda_max, CI and CR in one pass, with
+# `solver` or else the process-wide default solver
+def ahp_eigen(matrix, slot=None, solver=None):
+    return (solver or _default_solver).solve(matrix, slot)
+
+
+# Function to run power iteration on a (k, n, n) stack of comparison matrices at once;
+# returns (k, n) priorities and the (k,) lambda_max values
+def batch_power_iteration(matrices, tol=1e-12, max_iter=1000):
+    matrices = np.asarray(matrices, dtype=np.float64)
+    priorities = np.full(matrices.shape[:2], 1.0 / matrices.shape[1])
+    for _ in range(max_iter):
+        product = np.einsum('kij,kj->ki', matrices, priorities)
+        updated = product / product.sum(axis=1, keepdims=True)
+        converged = np.abs(updated - priorities).sum(axis=1).max() < tol
+        priorities = updated
+        if converged:
+            break
+    lambda_max = np.einsum('kij,kj->k', matrices, priorities)
+    return priorities, lambda_max
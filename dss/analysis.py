@@ -0,0 +1,107 @@
+# The analyses behind the Calculate buttons of the SAW, WP, TOPSIS and AHP pages, as
+# headless functions returning titled tables. The pages and the batch runner both call
+# these, so a problem scored from the command line matches the UI exactly. `memo` is the
+# page's session Memo; without one every step is computed directly.
+from dss.ahp import ahp_attributes, ahp_eigen, consistency_check
+from dss.memo import normalize_matrix_cached
+from dss.profiling import stage
+from dss.saw import saw_scores
+from dss.topsis import topsis_report
+from dss.wp import wp_scores
+
+AHP_PRIORITY_METHODS = ['Column average (approximate)', 'Eigenvector (power iteration)']
+
+TOPSIS_RESULTS_TITLE = 'TOPSIS Ranking Results'
+
+
+# Function to call `func` without memoizing it; the default `memo` of every analysis
+def call_directly(func, *args):
+    return func(*args)
+
+
+# Function to rank final scores from highest to lowest as the SAW and WP pages show them
+def _score_table(candidate_names, final_scores):
+    import pandas as pd
+
+    # Create a dataframe for final results
+    result_df = pd.DataFrame({
+        'Alternative': candidate_names,
+        'Final Score': final_scores
+    })
+
+    # Sort the results by Final Score in descending order (highest rank first)
+    result_df = result_df.sort_values(by='Final Score', ascending=False).reset_index(drop=True)
+
+    # Add a new column 'Rank' starting from 1
+    result_df['Rank'] = result_df.index + 1
+    return result_df
+
+
+# Function to run SAW or WP on a decision matrix with named rows and columns; `revisions`
+# are the matrix editor's per-column tokens (see normalize_matrix_cached)
+def _weighted_analysis(method, scores, decision_df, weights, criteria_types, memo, revisions):
+    import pandas as pd
+
+    decision_matrix = decision_df.to_numpy()
+    with stage(f'{method}: normalize'):
+        normalized_matrix = normalize_matrix_cached(memo, decision_matrix, criteria_types, revisions)
+    with stage(f'{method}: weighting'):
+        final_scores = memo(scores, normalized_matrix, weights)
+    with stage(f'{method}: rank'):
+        result_df = _score_table(list(decision_df.index), final_scores)
+    return {'Initial Decision Matrix': decision_df,
+            'Normalized Decision Matrix': pd.DataFrame(normalized_matrix, columns=decision_df.columns,
+                                                       index=decision_df.index),
+            'Final Scores and Rankings': result_df}
+
+
+# Function to calculate the SAW analysis: initial and normalized matrices and the ranking
+def saw_analysis(decision_df, weights, criteria_types, memo=call_directly, revisions=None):
+    return _weighted_analysis('saw', saw_scores, decision_df, weights, criteria_types, memo, revisions)
+
+
+# Function to calculate the WP analysis: initial and normalized matrices and the ranking
+def wp_analysis(decision_df, weights, criteria_types, memo=call_directly, revisions=None):
+    return _weighted_analysis('wp', wp_scores, decision_df, weights, criteria_types, memo, revisions)
+
+
+# Function to run TOPSIS and collect its steps and ranking as titled tables
+def topsis_analysis(alternative_data, weights, is_benefit_criteria, memo=call_directly):
+    result, steps = memo(topsis_report, alternative_data.reset_index(), weights, is_benefit_criteria)
+    ranking_df = result[['index', 'Closeness Coefficient', 'Ranking', 'Conclusion']].rename(columns={'index': 'Alternative'})
+    return {**dict(steps), TOPSIS_RESULTS_TITLE: ranking_df.sort_values('Ranking', kind='stable').set_index('Alternative')}
+
+
+# Function to calculate the priority index, consistency index and consistency ratio of a comparison matrix;
+# `solver` is the EigenSolver of the caller's session or problem (default: the shared one)
+def priority_with_consistency(ahp_df, slot, method, solver=None):
+    import pandas as pd
+
+    if method == AHP_PRIORITY_METHODS[1]:
+        result = ahp_eigen(ahp_df.to_numpy(), slot=slot, solver=solver)
+        priority_df = pd.DataFrame(result.priorities, index=ahp_df.index, columns=['priority index'])
+        return priority_df, result.consistency_index, result.consistency_ratio
+    priority_df = ahp_attributes(ahp_df)
+    return (priority_df, *consistency_check(priority_df, ahp_df))
+
+
+# Function to weight the attribute priorities by the criteria priorities and collect the
+# whole AHP analysis as titled tables; `attribute_dfs` maps each criterion to the
+# comparison matrix of the alternatives under it
+def ahp_analysis(ahp_df, attribute_dfs, priority_method=AHP_PRIORITY_METHODS[0], memo=call_directly, solver=None):
+    import pandas as pd
+
+    priority_index_attr, consistency_index, consistency_ratio_value = memo(
+        priority_with_consistency, ahp_df, 'criteria', priority_method, solver)
+    combined_df = pd.concat({criterion: memo(priority_with_consistency, attribute_df, criterion, priority_method,
+                                             solver)[0]
+                             for criterion, attribute_df in attribute_dfs.items()}, axis=1)
+    with stage('ahp: final scores'):
+        weighted_scores = combined_df.multiply(priority_index_attr['priority index'].values, axis=1)
+        weighted_scores['Final Score'] = weighted_scores.sum(axis=1)
+    return {'Criteria Comparison Matrix': ahp_df,
+            'Priority Index for Criteria': priority_index_attr,
+            'Consistency Check': pd.DataFrame({'Consistency Index': [consistency_index],
+                                               'Consistency Ratio': [consistency_ratio_value]}),
+            'Final Scores for Alternatives': weighted_scores.sort_values(by='Final Score', ascending=False)}
+
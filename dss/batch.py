@@ -0,0 +1,105 @@
+import numpy as np
+
+from dss.topsis import closeness_coefficient, column_norms, ideal_solutions
+
+# Number of weight vectors scored per chunk; bounds the temporaries used for ranking
+DEFAULT_CHUNK_SIZE = 4096
+
+# log(0) replacement so that 0 ** 0 == 1 and 0 ** w == 0 still hold in log space
+_LOG_ZERO = np.finfo(np.float64).min
+
+
+# Function to normalize the decision matrix column-wise (benefit: x / max, cost: min / x)
+def normalize_columns(decision_matrix, criteria_types):
+    decision_matrix = np.asarray(decision_matrix, dtype=np.float64)
+    criteria_types = np.asarray(criteria_types)
+    benefit = criteria_types == 'benefit'
+    cost = criteria_types == 'cost'
+    normalized_matrix = decision_matrix.copy()
+    if benefit.any():
+        normalized_matrix[:, benefit] = decision_matrix[:, benefit] / decision_matrix[:, benefit].max(axis=0)
+    if cost.any():
+        normalized_matrix[:, cost] = decision_matrix[:, cost].min(axis=0) / decision_matrix[:, cost]
+    return normalized_matrix
+
+
+# Function to turn a (n_scenarios, n_alternatives) score block into 1-based ranks (highest
+# score first); ties share the smallest rank, as in dss.topsis.rank_descending
+def rank_scores(scores):
+    order = np.argsort(-scores, axis=1, kind='stable')
+    ordered = np.take_along_axis(scores, order, axis=1)
+    # Each run of equal scores takes the position of its first member (NaNs form one run)
+    starts = np.ones(ordered.shape, dtype=bool)
+    starts[:, 1:] = (ordered[:, 1:] != ordered[:, :-1]) & ~(np.isnan(ordered[:, 1:]) & np.isnan(ordered[:, :-1]))
+    positions = np.maximum.accumulate(np.where(starts, np.arange(1, scores.shape[1] + 1), 0), axis=1)
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, positions, axis=1)
+    return ranks
+
+
+def _check_weights(weight_matrix, n_criteria):
+    weight_matrix = np.atleast_2d(np.asarray(weight_matrix, dtype=np.float64))
+    if weight_matrix.ndim != 2 or weight_matrix.shape[1] != n_criteria:
+        raise ValueError(
+            f"weights must have shape (n_scenarios, {n_criteria}), got {weight_matrix.shape}")
+    return weight_matrix
+
+
+def _batch_scores(kernel, weight_matrix, n_alternatives, chunk_size, scores_out, ranks_out):
+    n_scenarios = weight_matrix.shape[0]
+    scores = scores_out if scores_out is not None else np.empty((n_scenarios, n_alternatives))
+    ranks = ranks_out if ranks_out is not None else np.empty((n_scenarios, n_alternatives), dtype=np.int64)
+    for start in range(0, n_scenarios, chunk_size):
+        stop = min(start + chunk_size, n_scenarios)
+        block = scores[start:stop]
+        kernel(weight_matrix[start:stop], block)
+        ranks[start:stop] = rank_scores(block)
+    return scores, ranks
+
+
+# Function to calculate SAW scores for many weight vectors at once: scores = norm @ W.T
+def batch_saw(decision_matrix, weight_matrix, criteria_types, chunk_size=DEFAULT_CHUNK_SIZE,
+              scores_out=None, ranks_out=None):
+    normalized_matrix = normalize_columns(decision_matrix, criteria_types)
+    weight_matrix = _check_weights(weight_matrix, normalized_matrix.shape[1])
+
+    def kernel(weights, out):
+        np.matmul(weights, normalized_matrix.T, out=out)
+
+    return _batch_scores(kernel, weight_matrix, normalized_matrix.shape[0], chunk_size, scores_out, ranks_out)
+
+
+# Function to calculate WP scores for many weight vectors at once: scores = exp(log(norm) @ W.T)
+def batch_wp(decision_matrix, weight_matrix, criteria_types, chunk_size=DEFAULT_CHUNK_SIZE,
+             scores_out=None, ranks_out=None):
+    normalized_matrix = normalize_columns(decision_matrix, criteria_types)
+    weight_matrix = _check_weights(weight_matrix, normalized_matrix.shape[1])
+    log_matrix = np.full_like(normalized_matrix, _LOG_ZERO)
+    np.log(normalized_matrix, out=log_matrix, where=normalized_matrix != 0)
+
+    def kernel(weights, out):
+        np.matmul(weights, log_matrix.T, out=out)
+        np.exp(out, out=out)
+
+    return _batch_scores(kernel, weight_matrix, normalized_matrix.shape[0], chunk_size, scores_out, ranks_out)
+
+
+# Function to calculate TOPSIS closeness for many non-negative weight vectors at once. With
+# w >= 0 the weighted ideal points are w times the ideal points of the normalized matrix,
+# so squared distances reduce to ((norm - ideal) ** 2) @ (W ** 2).T
+def batch_topsis(decision_matrix, weight_matrix, is_benefit_criteria, chunk_size=DEFAULT_CHUNK_SIZE,
+                 scores_out=None, ranks_out=None):
+    matrix = np.asarray(decision_matrix, dtype=np.float64)
+    normalized_matrix = matrix / column_norms(matrix)
+    weight_matrix = _check_weights(weight_matrix, normalized_matrix.shape[1])
+    if (weight_matrix < 0).any():
+        raise ValueError("batch_topsis requires non-negative weights.")
+    ideal_positive, ideal_negative = ideal_solutions(normalized_matrix, is_benefit_criteria)
+    positive_gap = ((normalized_matrix - ideal_positive) ** 2).T
+    negative_gap = ((normalized_matrix - ideal_negative) ** 2).T
+
+    def kernel(weights, out):
+        squared = weights ** 2
+        closeness_coefficient(np.sqrt(squared @ positive_gap), np.sqrt(squared @ negative_gap), out=out)
+
+    return _batch_scores(kernel, weight_matrix, normalized_matrix.shape[0], chunk_size, scores_out, ranks_out)
@@ -0,0 +1,208 @@
+import numpy as np
+
+from dss.profiling import stage
+from dss.saw import saw_scores
+from dss.streaming import normalize_with_statistics, topsis_ideals
+from dss.topsis import closeness_coefficient, ideal_distances, rank_descending
+
+METHODS = ('saw', 'wp', 'topsis')
+
+CONSENSUS_METHODS = ('borda', 'copeland')
+
+# log(0) replacement so that 0 ** 0 == 1 and 0 ** w == 0 still hold in log space
+_LOG_ZERO = np.finfo(np.float64).min
+
+# Pairwise comparisons held in memory at once by the Copeland consensus
+COPELAND_BLOCK_CELLS = 2**24
+
+
+# Function to take column max and min; a reduction down narrow columns is slow, so rows
+# are first folded into wider ones (groups of rows side by side), reduced, then unfolded
+def _column_extremes(matrix):
+    n_rows, n_columns = matrix.shape
+    group = max(1, 64 // max(n_columns, 1))
+    folded = n_rows - n_rows % group
+    extremes = []
+    for reduce in (np.max, np.min):
+        values = [reduce(matrix[folded:], axis=0)] if folded < n_rows else []
+        if folded:
+            values.append(reduce(reduce(matrix[:folded].reshape(-1, group * n_columns), axis=0)
+                                 .reshape(group, n_columns), axis=0))
+        extremes.append(reduce(values, axis=0))
+    return extremes
+
+
+# Function to score one decision matrix with several methods. The column max/min and
+# sums of squares are computed once, and every method works in the same float64 buffer.
+# For positive data the normalization is folded into the weights: SAW is the matrix and
+# its reciprocal times per-column coefficients, WP the exponential of its logarithm times
+# signed weights. Otherwise SAW uses the normalized matrix and WP its logarithm in place.
+# TOPSIS always works on the weighted matrix.
+def compare_scores(decision_matrix, weights, criteria_types, methods=METHODS):
+    unknown = set(methods) - set(METHODS)
+    if unknown:
+        raise ValueError(f"Unknown method(s) {', '.join(sorted(unknown))}; expected some of {', '.join(METHODS)}.")
+    matrix = np.asarray(decision_matrix, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    criteria_types = np.asarray(criteria_types)
+    with stage('compare: column statistics'):
+        column_max, column_min = _column_extremes(matrix)
+        stats = {'max': column_max, 'min': column_min, 'sum_of_squares': np.einsum('ij,ij->j', matrix, matrix)}
+    buffer = np.empty_like(matrix)
+    scores = {}
+    benefit, cost = criteria_types == 'benefit', criteria_types == 'cost'
+    if column_min.size and (column_min > 0).all():
+        # benefit: x / max; cost: min / x; any other type is left unchanged
+        if 'saw' in methods:
+            with stage('compare: saw'):
+                np.reciprocal(matrix, out=buffer)
+                linear = np.where(benefit, weights / column_max, np.where(cost, 0.0, weights))
+                scores['saw'] = matrix @ linear + buffer @ np.where(cost, weights * column_min, 0.0)
+        if 'wp' in methods:
+            with stage('compare: wp'):
+                np.log(matrix, out=buffer)
+                offset = np.where(benefit, -np.log(column_max), np.where(cost, np.log(column_min), 0.0))
+                scores['wp'] = np.exp(buffer @ np.where(cost, -weights, weights) + weights @ offset)
+    elif 'saw' in methods or 'wp' in methods:
+        with stage('compare: normalize'):
+            normalize_with_statistics(matrix, criteria_types, stats, out=buffer)
+        if 'saw' in methods:
+            with stage('compare: saw'):
+                scores['saw'] = saw_scores(buffer, weights)
+        if 'wp' in methods:
+            with stage('compare: wp'):
+                with np.errstate(divide='ignore'):
+                    np.log(buffer, out=buffer)
+                np.maximum(buffer, _LOG_ZERO, out=buffer)
+                scores['wp'] = np.exp(buffer @ weights)
+    if 'topsis' in methods:
+        with stage('compare: topsis'):
+            scale, ideal_positive, ideal_negative = topsis_ideals(stats, weights, benefit)
+            np.multiply(matrix, scale, out=buffer)
+            scores['topsis'] = closeness_coefficient(*ideal_distances(buffer, ideal_positive, ideal_negative))
+    return {method: scores[method] for method in methods}
+
+
+# Function to rank every method's scores; returns a (methods x alternatives) array of ranks
+def rank_matrix(scores):
+    return np.array([rank_descending(np.asarray(values))[0] for values in scores.values()])
+
+
+# Function to combine rankings by Borda count: an alternative gets n - rank points from
+# each method. Returns (points, consensus ranks).
+def borda_consensus(ranks):
+    points = (ranks.shape[1] - ranks).sum(axis=0)
+    return points, rank_descending(points)[0]
+
+
+# Function to combine rankings by Copeland's rule: an alternative scores +1 for every
+# other alternative a majority of the methods ranks it above, and -1 for every one it
+# loses to. O(n^2) pairs, compared in blocks. Returns (scores, consensus ranks).
+def copeland_consensus(ranks):
+    n_methods, n_alternatives = ranks.shape
+    block_size = max(1, COPELAND_BLOCK_CELLS // (n_methods * n_alternatives))
+    points = np.empty(n_alternatives, dtype=np.int64)
+    for start in range(0, n_alternatives, block_size):
+        block = ranks[:, start:start + block_size, None]
+        above = (block < ranks[:, None, :]).sum(axis=0)
+        below = (block > ranks[:, None, :]).sum(axis=0)
+        points[start:start + block_size] = (above > below).sum(axis=1) - (below > above).sum(axis=1)
+    return points, rank_descending(points)[0]
+
+
+# Function to rank values in ascending order, giving tied values their average rank
+def average_ranks(values):
+    values = np.asarray(values)
+    order = np.argsort(values, kind='stable')
+    ordered = values[order]
+    boundaries = np.flatnonzero(ordered[1:] != ordered[:-1]) + 1
+    starts = np.concatenate([[0], boundaries])
+    ends = np.concatenate([boundaries, [len(values)]])
+    ranks = np.empty(len(values))
+    ranks[order] = np.repeat((starts + ends + 1) / 2, ends - starts)
+    return ranks
+
+
+# Function to calculate Spearman's rank correlation (Pearson correlation of average ranks)
+def spearman_rho(x, y):
+    return float(np.corrcoef(average_ranks(x), average_ranks(y))[0, 1])
+
+
+# Function to count pairs tied in every key; the keys must be sorted so that ties are adjacent
+def _tied_pairs(*keys):
+    changed = np.zeros(max(len(keys[0]) - 1, 0), dtype=bool)
+    for key in keys:
+        changed |= key[1:] != key[:-1]
+    counts = np.diff(np.concatenate([[0], np.flatnonzero(changed) + 1, [len(keys[0])]]))
+    return int((counts * (counts - 1) // 2).sum())
+
+
+# Alternatives per block whose inversions are counted by direct pairwise comparison
+INVERSION_BLOCK = 32
+
+
+# Function to count pairs i < j with values[i] > values[j]. Small blocks are compared
+# pairwise and sorted; then each bottom-up merge level counts, for every right-half
+# element, the greater left-half elements of its pair, and merges with one stable sort
+def _count_inversions(values):
+    values = np.unique(values, return_inverse=True)[1].astype(np.int64)
+    n = len(values)
+    n_values = n + 1
+    # Pad with the largest value at the end, which adds no inversions
+    blocks = np.full(-(-n // INVERSION_BLOCK) * INVERSION_BLOCK, n, dtype=np.int64)
+    blocks[:n] = values
+    blocks = blocks.reshape(-1, INVERSION_BLOCK)
+    inversions = int(np.triu(blocks[:, :, None] > blocks[:, None, :], k=1).sum())
+    values = np.sort(blocks, axis=1).ravel()
+    positions = np.arange(len(values))
+    width = INVERSION_BLOCK
+    while width < len(values):
+        pair = positions // (2 * width)
+        right = (positions // width) % 2 == 1
+        keys = pair * n_values + values
+        # Left halves are full, so pair p's left elements end at index p * width + width
+        left_end = pair[right] * width + width
+        inversions += int((left_end - np.searchsorted(keys[~right], keys[right], side='right')).sum())
+        values = np.sort(keys, kind='stable') - pair * n_values
+        width *= 2
+    return inversions
+
+
+# Function to calculate Kendall's tau-b in O(n log n), accounting for ties
+def kendall_tau(x, y):
+    x = np.asarray(x)
+    y = np.asarray(y)
+    order = np.lexsort((y, x))
+    x, y = x[order], y[order]
+    n_pairs = len(x) * (len(x) - 1) // 2
+    x_ties = _tied_pairs(x)
+    y_ties = _tied_pairs(np.sort(y))
+    both_ties = _tied_pairs(x, y)
+    discordant = _count_inversions(y)
+    denominator = np.sqrt(float(n_pairs - x_ties) * float(n_pairs - y_ties))
+    if denominator == 0:
+        return float('nan')
+    return (n_pairs - x_ties - y_ties + both_ties - 2 * discordant) / denominator
+
+
+# Function to build (Kendall tau, Spearman rho) matrices between every pair of methods
+def rank_correlations(scores):
+    names = list(scores)
+    kendall = np.eye(len(names))
+    for i in range(len(names)):
+        for j in range(i + 1, len(names)):
+            kendall[i, j] = kendall[j, i] = kendall_tau(scores[names[i]], scores[names[j]])
+    spearman = np.corrcoef(np.array([average_ranks(scores[name]) for name in names]))
+    return kendall, np.atleast_2d(spearman)
+
+
+# Function to run several methods on one matrix and combine them; returns (scores by
+# method, (methods x alternatives) ranks, consensus points, consensus ranks)
+def compare_methods(decision_matrix, weights, criteria_types, methods=METHODS, consensus='borda'):
+    if consensus not in CONSENSUS_METHODS:
+        raise ValueError(f"Unknown consensus '{consensus}'; expected one of {', '.join(CONSENSUS_METHODS)}.")
+    scores = compare_scores(decision_matrix, weights, criteria_types, methods)
+    with stage('compare: consensus'):
+        ranks = rank_matrix(scores)
+        points, consensus_ranks = (borda_consensus if consensus == 'borda' else copeland_consensus)(ranks)
+    return scores, ranks, points, consensus_ranks
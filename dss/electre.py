@@ -0,0 +1,113 @@
+import numpy as np
+
+from dss.profiling import stage
+from dss.promethee import PAIRWISE_BLOCK_CELLS, accumulate_row_blocks, oriented_matrix, unit_weights
+
+
+# Function to divide every oriented column by its range, so that differences between
+# alternatives are range-normalized (columns with a single value are left as they are)
+def _scaled_matrix(decision_matrix, criteria_types):
+    matrix = oriented_matrix(decision_matrix, criteria_types)
+    ranges = matrix.max(axis=0) - matrix.min(axis=0)
+    return matrix / np.where(ranges > 0, ranges, 1.0)
+
+
+# Function to compare rows `rows` with rows `columns` one criterion at a time. Returns the
+# concordance c[a, b] (weight of the criteria on which a is at least as good as b) and the
+# discordance d[a, b] (largest range-normalized amount by which b beats a), and from the
+# same differences the transposed pair c[b, a], d[b, a] indexed [b, a]
+def _pair_indices(matrix, weights, rows, columns):
+    concordance = np.zeros((len(matrix[rows]), len(matrix[columns])))
+    reverse_concordance = np.zeros_like(concordance)
+    discordance = np.zeros_like(concordance)
+    reverse_discordance = np.zeros_like(concordance)
+    for j, weight in enumerate(weights):
+        # differences[a, b] = how much b beats a on criterion j
+        differences = matrix[None, columns, j] - matrix[rows, j, None]
+        concordance += weight * (differences <= 0)
+        reverse_concordance += weight * (differences >= 0)
+        np.maximum(discordance, differences, out=discordance)
+        np.maximum(reverse_discordance, np.negative(differences, out=differences), out=reverse_discordance)
+    return concordance, discordance, reverse_concordance.T, reverse_discordance.T
+
+
+# Function to build the full ELECTRE I concordance and discordance matrices. O(n^2) memory,
+# so for small problems only.
+def electre_matrices(decision_matrix, weights, criteria_types):
+    matrix = _scaled_matrix(decision_matrix, criteria_types)
+    weights = unit_weights(weights, matrix.shape[1])
+    everyone = slice(0, matrix.shape[0])
+    concordance, discordance = _pair_indices(matrix, weights, everyone, everyone)[:2]
+    np.fill_diagonal(concordance, 0.0)
+    return concordance, discordance
+
+
+# Function to calculate the mean concordance over all ordered pairs from sorted columns:
+# a criterion counts for (a, b) when a is at least as good, i.e. once per untied pair and
+# twice per tied pair
+def mean_concordance(matrix, weights):
+    n = matrix.shape[0]
+    if n < 2:
+        return 0.0
+    pairs = n * (n - 1) // 2
+    values = np.sort(matrix, axis=0)
+    counts = np.empty(matrix.shape[1])
+    for j in range(matrix.shape[1]):
+        runs = np.diff(np.flatnonzero(np.concatenate([[True], values[1:, j] != values[:-1, j], [True]])))
+        counts[j] = pairs + (runs * (runs - 1) // 2).sum()
+    return float(counts @ weights / (n * (n - 1)))
+
+
+# Function to add up the discordance of the pairs within rows [start, stop) and between
+# them and every later row
+def _discordance_block(matrix, weights, start, stop, totals):
+    block = slice(start, stop)
+    totals[0] += _pair_indices(matrix, weights, block, block)[1].sum()
+    _, discordance, _, reverse_discordance = _pair_indices(matrix, weights, block, slice(stop, None))
+    totals[0] += discordance.sum() + reverse_discordance.sum()
+
+
+# Function to count, for rows [start, stop), whom they outrank and who outranks them, among
+# themselves and against every later row (each later pair is compared once, both ways)
+def _outranking_block(matrix, weights, thresholds, start, stop, totals):
+    concordance_threshold, discordance_threshold = thresholds
+    block = slice(start, stop)
+    concordance, discordance = _pair_indices(matrix, weights, block, block)[:2]
+    outranks = (concordance >= concordance_threshold) & (discordance <= discordance_threshold)
+    np.fill_diagonal(outranks, False)
+    totals[0, block] += outranks.sum(axis=1)
+    totals[1, block] += outranks.sum(axis=0)
+    concordance, discordance, reverse_concordance, reverse_discordance = _pair_indices(
+        matrix, weights, block, slice(stop, None))
+    outranks = (concordance >= concordance_threshold) & (discordance <= discordance_threshold)
+    totals[0, block] += outranks.sum(axis=1)
+    totals[1, stop:] += outranks.sum(axis=0)
+    outranked = (reverse_concordance >= concordance_threshold) & (reverse_discordance <= discordance_threshold)
+    totals[0, stop:] += outranked.sum(axis=1)
+    totals[1, block] += outranked.sum(axis=0)
+
+
+# Function to rank alternatives with ELECTRE I without holding the n x n matrices: a
+# outranks b when c[a, b] >= concordance_threshold and d[a, b] <= discordance_threshold
+# (by default the mean concordance and mean discordance over all pairs). Row blocks are
+# compared with the later rows on `n_jobs` threads. Returns (outranks, outranked by,
+# net outranking = outranks - outranked by) counts per alternative.
+def electre_method(decision_matrix, weights, criteria_types, concordance_threshold=None, discordance_threshold=None,
+                   block_cells=PAIRWISE_BLOCK_CELLS, n_jobs=None):
+    matrix = _scaled_matrix(decision_matrix, criteria_types)
+    n_alternatives, n_criteria = matrix.shape
+    weights = unit_weights(weights, n_criteria)
+    if concordance_threshold is None:
+        concordance_threshold = mean_concordance(matrix, weights)
+    if discordance_threshold is None:
+        with stage('electre: mean discordance'):
+            total = accumulate_row_blocks(
+                lambda start, stop, totals: _discordance_block(matrix, weights, start, stop, totals),
+                1, n_alternatives, block_cells, n_jobs)[0]
+            discordance_threshold = total / max(n_alternatives * (n_alternatives - 1), 1)
+    thresholds = (concordance_threshold, discordance_threshold)
+    with stage('electre: outranking'):
+        outranks, outranked = accumulate_row_blocks(
+            lambda start, stop, totals: _outranking_block(matrix, weights, thresholds, start, stop, totals),
+            (2, n_alternatives), n_alternatives, block_cells, n_jobs).astype(np.int64)
+    return outranks, outranked, outranks - outranked
@@ -0,0 +1,95 @@
+from collections import namedtuple
+
+import numpy as np
+
+from dss.ahp import CONSISTENCY_THRESHOLD, batch_power_iteration, random_index
+from dss.profiling import stage
+
+AGGREGATION_METHODS = ('aij', 'aip')
+
+GroupResult = namedtuple('GroupResult', ['priorities', 'consistency_ratios', 'included', 'aggregated_matrix',
+                                         'group_consistency_ratio'])
+
+
+def _consistency_ratios(lambda_max, n):
+    consistency_index = (lambda_max - n) / (n - 1) if n > 1 else np.zeros_like(lambda_max)
+    index = random_index(n)
+    return consistency_index / index if index else np.zeros_like(consistency_index)
+
+
+# Function to calculate every evaluator's eigenvector priorities and consistency ratio with
+# one batched power iteration over the (n_evaluators, n, n) stack
+def evaluator_consistency(matrices, tol=1e-12, max_iter=1000):
+    matrices = np.asarray(matrices, dtype=np.float64)
+    with stage('group ahp: evaluator consistency'):
+        priorities, lambda_max = batch_power_iteration(matrices, tol, max_iter)
+    return priorities, _consistency_ratios(lambda_max, matrices.shape[-1])
+
+
+def _evaluator_weights(evaluator_weights, n_evaluators):
+    if evaluator_weights is None:
+        return np.full(n_evaluators, 1.0 / n_evaluators)
+    evaluator_weights = np.asarray(evaluator_weights, dtype=np.float64)
+    if evaluator_weights.shape != (n_evaluators,) or (evaluator_weights < 0).any() or evaluator_weights.sum() <= 0:
+        raise ValueError(f"Evaluator weights must be {n_evaluators} non-negative numbers with a positive sum.")
+    return evaluator_weights / evaluator_weights.sum()
+
+
+# Function to aggregate individual judgments (AIJ): the element-wise weighted geometric
+# mean of the comparison matrices, which stays reciprocal
+def aggregate_judgments(matrices, evaluator_weights=None):
+    matrices = np.asarray(matrices, dtype=np.float64)
+    weights = _evaluator_weights(evaluator_weights, matrices.shape[0])
+    return np.exp(np.tensordot(weights, np.log(matrices), axes=1))
+
+
+# Function to aggregate individual priorities (AIP): the weighted geometric mean of the
+# evaluators' priority vectors, normalized to sum to one
+def aggregate_priorities(priorities, evaluator_weights=None):
+    priorities = np.asarray(priorities, dtype=np.float64)
+    weights = _evaluator_weights(evaluator_weights, priorities.shape[0])
+    combined = np.exp(weights @ np.log(priorities))
+    return combined / combined.sum()
+
+
+# Function to derive group priorities from a stack of comparison matrices, one per
+# evaluator. With exclude_inconsistent, evaluators whose consistency ratio is not below
+# `threshold` are left out of the aggregation.
+def group_ahp(matrices, method='aij', evaluator_weights=None, exclude_inconsistent=False,
+              threshold=CONSISTENCY_THRESHOLD):
+    if method not in AGGREGATION_METHODS:
+        raise ValueError(f"Unknown aggregation '{method}'; expected one of {', '.join(AGGREGATION_METHODS)}.")
+    matrices = np.asarray(matrices, dtype=np.float64)
+    priorities, consistency_ratios = evaluator_consistency(matrices)
+    included = consistency_ratios < threshold if exclude_inconsistent else np.ones(len(matrices), dtype=bool)
+    if not included.any():
+        raise ValueError(f"No evaluator has a consistency ratio below {threshold}.")
+    weights = None if evaluator_weights is None else _evaluator_weights(evaluator_weights, len(matrices))[included]
+    if included.all():
+        selected, selected_priorities = matrices, priorities
+    else:
+        selected, selected_priorities = matrices[included], priorities[included]
+
+    with stage(f'group ahp: {method}'):
+        if method == 'aij':
+            aggregated = aggregate_judgments(selected, weights)
+            group_priorities, lambda_max = batch_power_iteration(aggregated[None])
+            group_priorities = group_priorities[0]
+            group_consistency_ratio = float(_consistency_ratios(lambda_max, aggregated.shape[0])[0])
+        else:
+            aggregated = None
+            group_priorities = aggregate_priorities(selected_priorities, weights)
+            group_consistency_ratio = None
+    return GroupResult(group_priorities, consistency_ratios, included, aggregated, group_consistency_ratio)
+
+
+# Function to simulate a panel of evaluators: each judges a shared priority vector with
+# log-normal noise of standard deviation `sigma`, mirrored to keep the matrices reciprocal
+def simulate_evaluators(n_evaluators, n, sigma=0.2, seed=0):
+    rng = np.random.default_rng(seed)
+    truth = rng.uniform(1, 9, size=n)
+    upper = np.triu_indices(n, k=1)
+    noise = np.zeros((n_evaluators, n, n))
+    noise[:, upper[0], upper[1]] = rng.normal(0.0, sigma, size=(n_evaluators, len(upper[0])))
+    noise -= noise.transpose(0, 2, 1)
+    return (truth[:, None] / truth[None, :]) * np.exp(noise)
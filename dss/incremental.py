@@ -0,0 +1,180 @@
+import bisect
+
+import numpy as np
+
+from dss.saw import saw_scores
+from dss.streaming import normalize_with_statistics, top_indices
+
+METHODS = ('saw', 'wp')
+
+
+# Incremental SAW/WP ranking of a decision matrix whose rows are appended or updated over
+# time. Column max/min are kept as running statistics; while the ones a method normalizes
+# by stay put only the changed rows are re-scored, otherwise every row is re-scored lazily
+# at the next query. WP keys rows by their log score, whose order does not depend on the
+# statistics, so it never re-scores everything. The best `k` rows are kept in a sorted
+# index, so repeated top-k queries are cheap. TOPSIS is left out: its vector normalization
+# divides by the column sums of squares, which every append or update changes, so every
+# change would re-score all rows.
+class IncrementalRanking:
+    def __init__(self, method, weights, criteria_types, k=10, capacity=1024):
+        if method == 'topsis':
+            raise ValueError("TOPSIS cannot be ranked incrementally: every change moves the column norms it "
+                             "normalizes by, so all rows must be re-scored. Use dss.topsis.topsis_scores.")
+        if method not in METHODS:
+            raise ValueError(f"Unknown method '{method}'; expected one of {', '.join(METHODS)}.")
+        self.method = method
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.criteria_types = np.asarray(criteria_types)
+        self.k = k
+        self.n_rows = 0
+        self.full_rescores = 0
+        self._benefit = self.criteria_types == 'benefit'
+        self._cost = self.criteria_types == 'cost'
+        self._sign = np.where(self._cost, -1.0, 1.0)
+        self._data = np.empty((capacity, len(self.weights)))
+        self._keys = np.empty(capacity)
+        self._stats = None
+        self._stale = False
+        # (-key, row) pairs of the best k rows in rank order; None when it must be rebuilt
+        self._top = []
+
+    def __len__(self):
+        return self.n_rows
+
+    def _reserve(self, n_rows):
+        capacity = len(self._keys)
+        if n_rows <= capacity:
+            return
+        while capacity < n_rows:
+            capacity *= 2
+        data = np.empty((capacity, self._data.shape[1]))
+        data[:self.n_rows] = self._data[:self.n_rows]
+        keys = np.empty(capacity)
+        keys[:self.n_rows] = self._keys[:self.n_rows]
+        self._data, self._keys = data, keys
+
+    def _row_keys(self, rows):
+        if self.method == 'saw':
+            return saw_scores(normalize_with_statistics(rows, self.criteria_types, self._stats), self.weights)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (np.log(rows) * self._sign) @ self.weights
+
+    def _scores_from_keys(self, keys):
+        if self.method != 'wp':
+            return np.array(keys, dtype=np.float64)
+        # score = prod((x / max) ** w) * prod((min / x) ** w) = exp(log key + offset)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            offset = (self.weights[self._cost] @ np.log(self._stats['min'][self._cost])
+                      - self.weights[self._benefit] @ np.log(self._stats['max'][self._benefit]))
+        return np.exp(np.asarray(keys, dtype=np.float64) + offset)
+
+    def _moved(self, old, new):
+        if self.method == 'wp':
+            return False
+        return not (np.array_equal(old['max'][self._benefit], new['max'][self._benefit])
+                    and np.array_equal(old['min'][self._cost], new['min'][self._cost]))
+
+    def _set_stats(self, stats):
+        moved = self._stats is not None and self._moved(self._stats, stats)
+        self._stats = stats
+        if moved:
+            self._stale = True
+            self._top = None
+
+    # Function to append one row or a block of rows; returns their row numbers
+    def append(self, rows):
+        rows = np.atleast_2d(np.asarray(rows, dtype=np.float64))
+        if rows.ndim != 2 or rows.shape[1] != self._data.shape[1]:
+            raise ValueError(f"rows must have {self._data.shape[1]} columns, got shape {rows.shape}")
+        start, stop = self.n_rows, self.n_rows + len(rows)
+        self._reserve(stop)
+        self._data[start:stop] = rows
+        self.n_rows = stop
+        if self._stats is None:
+            self._stats = {'max': rows.max(axis=0), 'min': rows.min(axis=0)}
+        else:
+            self._set_stats({'max': np.maximum(self._stats['max'], rows.max(axis=0)),
+                             'min': np.minimum(self._stats['min'], rows.min(axis=0))})
+        if not self._stale:
+            keys = self._row_keys(rows)
+            self._keys[start:stop] = keys
+            if self._top is not None:
+                best = [(-keys[i], start + int(i)) for i in top_indices(keys, self.k)]
+                self._top = sorted(self._top + best)[:self.k]
+        return np.arange(start, stop)
+
+    # Function to replace the values of an existing row
+    def update(self, index, row):
+        if not 0 <= index < self.n_rows:
+            raise IndexError(f"row {index} out of range for {self.n_rows} rows")
+        row = np.asarray(row, dtype=np.float64)
+        old = self._data[index].copy()
+        self._data[index] = row
+        data = self._data[:self.n_rows]
+        column_max = np.maximum(self._stats['max'], row)
+        column_min = np.minimum(self._stats['min'], row)
+        # A row that held a column extreme and moved inward needs that column rescanned
+        for j in np.flatnonzero((old == self._stats['max']) & (row < old)):
+            column_max[j] = data[:, j].max()
+        for j in np.flatnonzero((old == self._stats['min']) & (row > old)):
+            column_min[j] = data[:, j].min()
+        self._set_stats({'max': column_max, 'min': column_min})
+        if self._stale:
+            return
+        key = self._row_keys(row[None, :])[0]
+        self._keys[index] = key
+        if self._top is None:
+            return
+        item = (-key, index)
+        entry = next((entry for entry in self._top if entry[1] == index), None)
+        if entry is not None:
+            boundary = self._top[-1]
+            self._top.remove(entry)
+            # Rows outside the index all rank after the old k-th row
+            if item <= boundary or self.n_rows <= self.k:
+                bisect.insort(self._top, item)
+            else:
+                self._top = None
+        elif len(self._top) < self.k:
+            bisect.insort(self._top, item)
+        elif item < self._top[-1]:
+            bisect.insort(self._top, item)
+            self._top.pop()
+
+    def _refresh(self):
+        if self._stale:
+            data = self._data[:self.n_rows]
+            self._stats = {'max': data.max(axis=0), 'min': data.min(axis=0)}
+            self._keys[:self.n_rows] = self._row_keys(data)
+            self._stale = False
+            self.full_rescores += 1
+        if self._top is None:
+            keys = self._keys[:self.n_rows]
+            self._top = [(-keys[i], int(i)) for i in top_indices(keys, self.k)]
+
+    # Function to get the rows and scores of the k best alternatives, best first
+    def top_k(self, k=None):
+        if not self.n_rows:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        self._refresh()
+        k = self.k if k is None else k
+        if k <= self.k:
+            rows = np.array([row for _, row in self._top[:k]], dtype=np.int64)
+            keys = [-key for key, _ in self._top[:k]]
+        else:
+            rows = top_indices(self._keys[:self.n_rows], k)
+            keys = self._keys[rows]
+        return rows, self._scores_from_keys(keys)
+
+    # Function to get the current scores of all rows
+    def scores(self):
+        if not self.n_rows:
+            return np.empty(0)
+        self._refresh()
+        return self._scores_from_keys(self._keys[:self.n_rows])
+
+    # Function to get the rank of one row; ties share the smallest rank
+    def rank(self, index):
+        self._refresh()
+        return 1 + int(np.count_nonzero(self._keys[:self.n_rows] > self._keys[index]))
@@ -0,0 +1,173 @@
+import io
+import os
+
+import numpy as np
+
+# File extensions accepted by load_matrix
+UPLOAD_TYPES = ('csv', 'parquet', 'xlsx', 'xls', 'npy')
+
+# Export format -> MIME type
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'parquet': 'application/vnd.apache.parquet',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'npy': 'application/octet-stream',
+}
+
+# File extensions accepted by load_judgments, and the columns it requires ('criterion' is optional)
+JUDGMENT_TYPES = ('csv', 'parquet', 'xlsx', 'xls')
+JUDGMENT_COLUMNS = ('first', 'second', 'judgment')
+
+# Rows checked for NaN/inf at a time, so a memory-mapped matrix is never held in RAM at once
+VALIDATE_BLOCK_ROWS = 65536
+
+# Largest relative gap allowed between a_ji and 1 / a_ij (and between a_ii and 1); wide
+# enough for reciprocals typed to two decimals, e.g. 0.14 for 1/7
+RECIPROCAL_TOLERANCE = 0.05
+
+
+# Function to build a zero-filled decision matrix with default alternative and criteria names
+def empty_matrix(num_alternatives, num_criteria, alternative_prefix='Alternative', criteria_prefix='Criteria', value=0.0):
+    import pandas as pd
+
+    return pd.DataFrame(np.full((num_alternatives, num_criteria), value, dtype=np.float64),
+                        index=[f'{alternative_prefix} {i+1}' for i in range(num_alternatives)],
+                        columns=[f'{criteria_prefix} {j+1}' for j in range(num_criteria)])
+
+
+# Function to memory-map a .npy decision matrix without reading it into RAM
+def load_npy(path):
+    array = np.load(path, mmap_mode='r')
+    if array.ndim != 2:
+        raise ValueError(f"Expected a 2-D decision matrix, got an array with shape {array.shape}.")
+    return array
+
+
+# Function to load an (n_evaluators, n, n) stack of pairwise comparison matrices from a
+# .npy file (memory-mapped when given a path) or an uploaded file object
+def load_comparison_stack(source):
+    if isinstance(source, (str, os.PathLike)):
+        stack = np.load(source, mmap_mode='r')
+    else:
+        stack = np.load(source)
+    return validate_comparison_stack(stack)
+
+
+# Function to check that a comparison stack is 3-D, square, positive and finite, and that
+# every matrix is reciprocal with a unit diagonal
+def validate_comparison_stack(stack, tolerance=RECIPROCAL_TOLERANCE):
+    if stack.ndim != 3 or stack.shape[1] != stack.shape[2]:
+        raise ValueError(f"Expected an (evaluators, n, n) stack of comparison matrices, got shape {stack.shape}.")
+    if stack.shape[0] == 0 or stack.shape[1] == 0:
+        raise ValueError("The comparison stack is empty.")
+    if not (np.isfinite(stack).all() and (stack > 0).all()):
+        raise ValueError("Pairwise comparisons must be positive, finite numbers.")
+    if (np.abs(np.diagonal(stack, axis1=1, axis2=2) - 1) > tolerance).any():
+        raise ValueError("Every comparison matrix must have 1 on its diagonal.")
+    gap = np.abs(stack * np.swapaxes(stack, 1, 2) - 1)
+    if (gap > tolerance).any():
+        evaluator, i, j = np.unravel_index(np.argmax(gap), gap.shape)
+        raise ValueError(f"Comparison matrix {evaluator + 1} is not reciprocal: entry ({i + 1}, {j + 1}) is "
+                         f"{stack[evaluator, i, j]:g} but entry ({j + 1}, {i + 1}) is {stack[evaluator, j, i]:g}.")
+    return stack
+
+
+# Function to check that a decision matrix is non-empty, numeric, finite and of the expected shape
+def validate_matrix(frame, shape=None):
+    if frame.shape[0] == 0 or frame.shape[1] == 0:
+        raise ValueError("The decision matrix is empty.")
+    if shape is not None and frame.shape != tuple(shape):
+        raise ValueError(f"Expected a decision matrix of shape {tuple(shape)}, got {frame.shape}.")
+    non_numeric = [str(column) for column in frame.columns if frame[column].dtype.kind not in 'biuf']
+    if non_numeric:
+        raise ValueError(f"Non-numeric criteria columns: {', '.join(non_numeric)}.")
+    # Only non-float64 columns are converted, so float64 (e.g. memory-mapped) data is not copied
+    if (frame.dtypes != np.float64).any():
+        frame = frame.astype(np.float64)
+    values = frame.to_numpy()
+    for start in range(0, len(values), VALIDATE_BLOCK_ROWS):
+        if not np.isfinite(values[start:start + VALIDATE_BLOCK_ROWS]).all():
+            raise ValueError("The decision matrix contains missing or infinite values.")
+    return frame
+
+
+# Function to read a whole decision matrix in one vectorized read. `source` is a path or a
+# file-like object (e.g. a Streamlit upload); a leading text column becomes the alternative names.
+def load_matrix(source, name=None, shape=None):
+    import pandas as pd
+
+    name = name or getattr(source, 'name', None) or os.fspath(source)
+    extension = os.path.splitext(name)[1].lower().lstrip('.')
+    if extension == 'npy':
+        if isinstance(source, (str, os.PathLike)):
+            array = load_npy(source)
+        else:
+            array = np.load(source)
+        # Wrapped without a copy, so a memory-mapped .npy stays on disk
+        frame = pd.DataFrame(array, copy=False)
+        frame.index = [f'Alternative {i+1}' for i in range(frame.shape[0])]
+        frame.columns = [f'Criteria {j+1}' for j in range(frame.shape[1])]
+    elif extension == 'csv':
+        frame = pd.read_csv(source)
+    elif extension == 'parquet':
+        frame = pd.read_parquet(source)
+    elif extension in ('xlsx', 'xls'):
+        frame = pd.read_excel(source)
+    else:
+        raise ValueError(f"Unsupported file type '{extension}'; expected one of {', '.join(UPLOAD_TYPES)}.")
+
+    if frame.shape[1] > 0 and frame.iloc[:, 0].dtype.kind not in 'biuf':
+        frame = frame.set_index(frame.columns[0])
+    frame.index = frame.index.astype(str)
+    frame.columns = frame.columns.astype(str)
+    return validate_matrix(frame, shape)
+
+
+# Function to read incomplete pairwise judgments, one row per comparison "first is judgment
+# times as important as second", from CSV, Parquet or Excel. Item names are matched as text;
+# an optional criterion column groups the judgments of several comparison graphs.
+def load_judgments(source, name=None):
+    import pandas as pd
+
+    name = name or getattr(source, 'name', None) or os.fspath(source)
+    extension = os.path.splitext(name)[1].lower().lstrip('.')
+    if extension == 'csv':
+        frame = pd.read_csv(source)
+    elif extension == 'parquet':
+        frame = pd.read_parquet(source)
+    elif extension in ('xlsx', 'xls'):
+        frame = pd.read_excel(source)
+    else:
+        raise ValueError(f"Unsupported file type '{extension}'; expected one of {', '.join(JUDGMENT_TYPES)}.")
+
+    frame.columns = frame.columns.astype(str).str.strip().str.lower()
+    missing = [column for column in JUDGMENT_COLUMNS if column not in frame.columns]
+    if missing:
+        raise ValueError(f"Missing judgment columns: {', '.join(missing)}.")
+    if frame.empty:
+        raise ValueError("The judgment table is empty.")
+    if frame['judgment'].dtype.kind not in 'biuf':
+        raise ValueError("The judgment column must be numeric.")
+    if not (np.isfinite(frame['judgment']).all() and (frame['judgment'] > 0).all()):
+        raise ValueError("Pairwise comparisons must be positive, finite numbers.")
+    judgments = frame[['first', 'second']].astype(str)
+    judgments['judgment'] = frame['judgment'].astype(np.float64)
+    judgments.insert(0, 'criterion', frame['criterion'].astype(str) if 'criterion' in frame.columns else 'Criterion 1')
+    return judgments
+
+
+# Function to serialize a table to bytes in one of EXPORT_FORMATS
+def export_table(frame, fmt):
+    buffer = io.BytesIO()
+    frame = frame.rename_axis(frame.index.name or 'Alternative')
+    if fmt == 'csv':
+        frame.to_csv(buffer)
+    elif fmt == 'parquet':
+        frame.to_parquet(buffer)
+    elif fmt == 'xlsx':
+        frame.to_excel(buffer)
+    elif fmt == 'npy':
+        np.save(buffer, frame.select_dtypes('number').to_numpy())
+    else:
+        raise ValueError(f"Unsupported export format '{fmt}'; expected one of {', '.join(EXPORT_FORMATS)}.")
+    return buffer.getvalue()
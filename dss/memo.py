@@ -0,0 +1,131 @@
+import hashlib
+import sys
+from collections import OrderedDict
+
+import numpy as np
+
+# Bytes of results a Memo keeps (per session) before evicting the least recently used
+MEMO_MAX_BYTES = 128 * 2**20
+
+
+def _update_digest(digest, value):
+    if isinstance(value, np.ndarray):
+        digest.update(f'ndarray{value.dtype}{value.shape}'.encode())
+        if value.dtype == object:
+            digest.update(repr(value.tolist()).encode())
+        else:
+            digest.update(np.ascontiguousarray(value).tobytes())
+    elif hasattr(value, 'columns') and hasattr(value, 'to_numpy'):
+        digest.update(f'frame{list(value.index)!r}'.encode())
+        for column in value.columns:
+            digest.update(f'column{column!r}'.encode())
+            _update_digest(digest, value[column].to_numpy())
+    elif isinstance(value, dict):
+        digest.update(f'dict{len(value)}('.encode())
+        for key, item in value.items():
+            _update_digest(digest, key)
+            _update_digest(digest, item)
+        digest.update(b')')
+    elif isinstance(value, (list, tuple)):
+        digest.update(f'{type(value).__name__}{len(value)}('.encode())
+        for item in value:
+            _update_digest(digest, item)
+        digest.update(b')')
+    else:
+        digest.update(f'{type(value).__name__}:{value!r};'.encode())
+
+
+# Function to hash arrays, DataFrames, sequences, dicts and scalars by content
+def content_key(*values):
+    digest = hashlib.blake2b(digest_size=16)
+    _update_digest(digest, values)
+    return digest.hexdigest()
+
+
+# Function to estimate the memory held by a memoized result
+def result_nbytes(value):
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if hasattr(value, 'memory_usage'):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if hasattr(usage, 'sum') else int(usage)
+    if isinstance(value, dict):
+        return sum(result_nbytes(key) + result_nbytes(item) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(result_nbytes(item) for item in value)
+    return sys.getsizeof(value)
+
+
+# Content-addressed memo layer: each call is keyed on the function and a hash of its
+# inputs, so reruns only recompute the blocks whose inputs changed. Returned arrays
+# are made read-only because they are shared between calls. Results are evicted least
+# recently used first once they hold more than `max_bytes`; a larger result is not kept.
+class Memo:
+    def __init__(self, max_bytes=MEMO_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()
+
+    def __call__(self, func, *args):
+        return self.keyed(content_key(*args), func, *args)
+
+    # Method to memoize `func(*args)` under a key the caller derives from its inputs, for
+    # inputs whose changes the caller already tracks, so they are not hashed again
+    def keyed(self, key, func, *args):
+        key = (func.__module__, func.__qualname__, key)
+        if key in self._results:
+            self._results.move_to_end(key)
+            self.hits += 1
+            return self._results[key][0]
+        self.misses += 1
+        result = func(*args)
+        if isinstance(result, np.ndarray):
+            result.flags.writeable = False
+        size = result_nbytes(result)
+        if size <= self.max_bytes:
+            self._results[key] = (result, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                self.nbytes -= self._results.popitem(last=False)[1][1]
+        return result
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._results), 'bytes': self.nbytes,
+                'hit_rate': self.hits / total if total else 0.0}
+
+    def clear(self):
+        self._results.clear()
+        self.nbytes = 0
+        self.hits = self.misses = 0
+
+
+# Function to parse one comma-separated row of scores
+def parse_row(text):
+    return np.array(text.split(','), dtype=np.float64)
+
+
+# Function to normalize one column (benefit: x / max, cost: min / x, otherwise unchanged)
+def normalize_column(column, criteria_type):
+    if criteria_type == 'benefit':
+        return column / column.max()
+    if criteria_type == 'cost':
+        return column.min() / column
+    return column.copy()
+
+
+# Function to normalize a decision matrix column by column, recomputing only changed columns.
+# `revisions` (one token per column that changes whenever the column does, e.g. from the
+# matrix editor's change-set) keys the columns; without it each column is hashed.
+def normalize_matrix_cached(memo, decision_matrix, criteria_types, revisions=None):
+    decision_matrix = np.asarray(decision_matrix, dtype=np.float64)
+    if revisions is None or not hasattr(memo, 'keyed'):
+        columns = [memo(normalize_column, decision_matrix[:, i], str(criteria_types[i]))
+                   for i in range(decision_matrix.shape[1])]
+    else:
+        columns = [memo.keyed((revisions[i], str(criteria_types[i])), normalize_column, decision_matrix[:, i],
+                              str(criteria_types[i]))
+                   for i in range(decision_matrix.shape[1])]
+    return np.column_stack(columns)
@@ -0,0 +1,114 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from dss.ahp import batch_power_iteration, priority_vectors
+from dss.batch import batch_saw, batch_topsis, batch_wp, rank_scores
+
+# Weight vectors sampled and scored per vectorized block inside a worker
+DEFAULT_CHUNK_SIZE = 8192
+
+METHODS = ('saw', 'wp', 'topsis')
+
+# How ahp_rank_stability derives the criteria priorities of each perturbed matrix
+PRIORITY_METHODS = ('eigenvector', 'column_average')
+
+
+# Function to sample weight vectors around the point weights: Dirichlet with mean equal
+# to the normalized weights (larger concentration = less spread), or uniform within
+# per-criterion [lower, upper] intervals
+def sample_weights(rng, n_samples, weights=None, concentration=100.0, lower=None, upper=None):
+    if lower is not None and upper is not None:
+        return rng.uniform(lower, upper, size=(n_samples, len(lower)))
+    weights = np.asarray(weights, dtype=np.float64)
+    total = weights.sum()
+    mean = weights / total if total > 0 else np.full(len(weights), 1.0 / len(weights))
+    alpha = concentration * mean
+    # Dirichlet needs strictly positive parameters; zero weights stay (almost) zero
+    return rng.dirichlet(np.maximum(alpha, 1e-9), size=n_samples)
+
+
+# Function to turn a (n_samples, n_alternatives) rank block into counts[alternative, rank - 1]
+def rank_counts(ranks):
+    n_alternatives = ranks.shape[1]
+    flat = np.arange(n_alternatives) * n_alternatives + (ranks - 1)
+    return np.bincount(flat.ravel(), minlength=n_alternatives * n_alternatives).reshape(n_alternatives, n_alternatives)
+
+
+def _score_ranks(method, decision_matrix, criteria_types, weight_matrix):
+    if method == 'saw':
+        return batch_saw(decision_matrix, weight_matrix, criteria_types)[1]
+    if method == 'wp':
+        return batch_wp(decision_matrix, weight_matrix, criteria_types)[1]
+    if method == 'topsis':
+        return batch_topsis(decision_matrix, weight_matrix, np.asarray(criteria_types) == 'benefit')[1]
+    raise ValueError(f"Unknown method '{method}'; expected one of {', '.join(METHODS)}.")
+
+
+def _weights_task(n_samples, seed, method, decision_matrix, criteria_types, sampler, chunk_size):
+    rng = np.random.default_rng(seed)
+    n_alternatives = decision_matrix.shape[0]
+    counts = np.zeros((n_alternatives, n_alternatives), dtype=np.int64)
+    for start in range(0, n_samples, chunk_size):
+        weight_matrix = sample_weights(rng, min(chunk_size, n_samples - start), **sampler)
+        counts += rank_counts(_score_ranks(method, decision_matrix, criteria_types, weight_matrix))
+    return counts
+
+
+def _ahp_task(n_samples, seed, criteria_matrix, alternative_priorities, sigma, priority_method, chunk_size):
+    rng = np.random.default_rng(seed)
+    n = criteria_matrix.shape[0]
+    upper = np.triu_indices(n, k=1)
+    log_matrix = np.log(criteria_matrix)
+    n_alternatives = alternative_priorities.shape[0]
+    counts = np.zeros((n_alternatives, n_alternatives), dtype=np.int64)
+    for start in range(0, n_samples, chunk_size):
+        size = min(chunk_size, n_samples - start)
+        # Log-normal perturbation of each judgment, mirrored to keep the matrices reciprocal
+        noise = np.zeros((size, n, n))
+        noise[:, upper[0], upper[1]] = rng.normal(0.0, sigma, size=(size, len(upper[0])))
+        noise -= noise.transpose(0, 2, 1)
+        if priority_method == 'eigenvector':
+            weights, _ = batch_power_iteration(np.exp(log_matrix + noise), tol=1e-10)
+        else:
+            weights = priority_vectors(np.exp(log_matrix + noise))
+        counts += rank_counts(rank_scores(weights @ alternative_priorities.T))
+    return counts
+
+
+def _run_tasks(task, args, n_samples, seed, n_workers):
+    n_workers = n_workers or os.cpu_count() or 1
+    seeds = np.random.SeedSequence(seed).spawn(n_workers)
+    sizes = [n_samples // n_workers + (i < n_samples % n_workers) for i in range(n_workers)]
+    if n_workers == 1:
+        counts = task(sizes[0], seeds[0], *args)
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [executor.submit(task, size, worker_seed, *args)
+                       for size, worker_seed in zip(sizes, seeds) if size]
+            counts = sum(future.result() for future in futures)
+    return counts / n_samples
+
+
+# Function to estimate rank probabilities under weight uncertainty for SAW, WP or TOPSIS.
+# Returns P[alternative, rank - 1]; results are reproducible for a given seed and worker count.
+def rank_stability(method, decision_matrix, criteria_types, weights=None, n_samples=10000, concentration=100.0,
+                   lower=None, upper=None, seed=0, n_workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    decision_matrix = np.asarray(decision_matrix, dtype=np.float64)
+    sampler = {'weights': weights, 'concentration': concentration, 'lower': lower, 'upper': upper}
+    return _run_tasks(_weights_task, (method, decision_matrix, np.asarray(criteria_types), sampler, chunk_size),
+                      n_samples, seed, n_workers)
+
+
+# Function to estimate AHP rank probabilities by perturbing the criteria comparisons with
+# log-normal noise of standard deviation `sigma`; `alternative_priorities` is (alternatives x criteria).
+# `priority_method` should match how the unperturbed priorities were derived.
+def ahp_rank_stability(criteria_matrix, alternative_priorities, sigma=0.1, n_samples=10000, seed=0, n_workers=None,
+                       chunk_size=DEFAULT_CHUNK_SIZE, priority_method='eigenvector'):
+    if priority_method not in PRIORITY_METHODS:
+        raise ValueError(f"Unknown priority method '{priority_method}'; expected one of {', '.join(PRIORITY_METHODS)}.")
+    criteria_matrix = np.asarray(criteria_matrix, dtype=np.float64)
+    alternative_priorities = np.asarray(alternative_priorities, dtype=np.float64)
+    return _run_tasks(_ahp_task, (criteria_matrix, alternative_priorities, sigma, priority_method, chunk_size),
+                      n_samples, seed, n_workers)
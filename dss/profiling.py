@@ -0,0 +1,159 @@
+import contextlib
+import contextvars
+import cProfile
+import io
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+
+# Profiler collecting stages for the current script run; None means instrumentation is off
+_active_profiler = contextvars.ContextVar('dss_active_profiler', default=None)
+
+# tracemalloc is process-wide with a single peak, so one profiler at a time traces memory;
+# the others in the process (e.g. other sessions) record no peaks while it runs
+_memory_lock = threading.Lock()
+_memory_owner = None
+
+
+# Opt-in stage timer. While active, every `stage(name)` block records its wall time and,
+# with trace_memory, its tracemalloc peak; with use_cprofile the whole run is also profiled.
+# Memory is only traced when no other profiler is tracing it (see `tracing_memory`), and the
+# peaks include allocations made meanwhile by other threads of the process.
+class Profiler:
+    def __init__(self, name='dss', trace_memory=False, use_cprofile=False):
+        self.name = name
+        self.trace_memory = trace_memory
+        self.use_cprofile = use_cprofile
+        self.records = []
+        self._stack = []
+        self._token = None
+        self.tracing_memory = False
+        self._started_tracemalloc = False
+        self._cprofile = None
+
+    def start(self):
+        global _memory_owner
+        if self.trace_memory:
+            with _memory_lock:
+                if _memory_owner is None:
+                    _memory_owner = self
+                    self.tracing_memory = True
+                    if not tracemalloc.is_tracing():
+                        tracemalloc.start()
+                        self._started_tracemalloc = True
+        if self.use_cprofile:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        self._token = _active_profiler.set(self)
+        return self
+
+    def stop(self):
+        global _memory_owner
+        if self._token is not None:
+            try:
+                _active_profiler.reset(self._token)
+            except ValueError:
+                # Stopped from a different context (e.g. a later Streamlit rerun)
+                _active_profiler.set(None)
+            self._token = None
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        with _memory_lock:
+            if _memory_owner is self:
+                _memory_owner = None
+                if self._started_tracemalloc:
+                    tracemalloc.stop()
+                self._started_tracemalloc = False
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        tracing = self.tracing_memory and tracemalloc.is_tracing()
+        frame = {'peak': 0}
+        if tracing:
+            start_memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        self._stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._stack.pop()
+            record = {'page': self.name, 'stage': name, 'ms': elapsed * 1e3, 'peak_bytes': None}
+            if tracing:
+                # Nested stages reset the tracemalloc peak, so also take the peaks they saw
+                peak = max(tracemalloc.get_traced_memory()[1], frame['peak'])
+                record['peak_bytes'] = max(peak - start_memory, 0)
+                if self._stack:
+                    self._stack[-1]['peak'] = max(self._stack[-1]['peak'], peak)
+            self.records.append(record)
+
+    def summary(self):
+        totals = {}
+        for record in self.records:
+            total = totals.setdefault(record['stage'], {'stage': record['stage'], 'calls': 0, 'ms': 0.0, 'peak_bytes': None})
+            total['calls'] += 1
+            total['ms'] += record['ms']
+            if record['peak_bytes'] is not None:
+                total['peak_bytes'] = max(total['peak_bytes'] or 0, record['peak_bytes'])
+        return list(totals.values())
+
+    def cprofile_stats(self, limit=30):
+        if self._cprofile is None:
+            return ''
+        stream = io.StringIO()
+        pstats.Stats(self._cprofile, stream=stream).sort_stats('cumulative').print_stats(limit)
+        return stream.getvalue()
+
+
+# Function to get the profiler active in the current context, if any
+def active_profiler():
+    return _active_profiler.get()
+
+
+# Function to time a block under the active profiler; a no-op when instrumentation is off
+def stage(name):
+    profiler = _active_profiler.get()
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.stage(name)
+
+
+# Function to export stage records as JSON lines
+def to_json_lines(records):
+    return ''.join(json.dumps(record) + '\n' for record in records)
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+# Function to export per-stage totals in the Prometheus text exposition format
+def to_prometheus(profiler, prefix='dss_stage'):
+    lines = [
+        f'# HELP {prefix}_seconds_total Wall time spent in each calculation stage.',
+        f'# TYPE {prefix}_seconds_total counter',
+    ]
+    summary = profiler.summary()
+    for total in summary:
+        labels = f'page="{_label(profiler.name)}",stage="{_label(total["stage"])}"'
+        lines.append(f'{prefix}_seconds_total{{{labels}}} {total["ms"] / 1e3:.9f}')
+    lines += [f'# HELP {prefix}_calls_total Number of times each stage ran.', f'# TYPE {prefix}_calls_total counter']
+    for total in summary:
+        labels = f'page="{_label(profiler.name)}",stage="{_label(total["stage"])}"'
+        lines.append(f'{prefix}_calls_total{{{labels}}} {total["calls"]}')
+    traced = [total for total in summary if total['peak_bytes'] is not None]
+    if traced:
+        lines += [f'# HELP {prefix}_peak_bytes Peak traced memory of each stage.', f'# TYPE {prefix}_peak_bytes gauge']
+        for total in traced:
+            labels = f'page="{_label(profiler.name)}",stage="{_label(total["stage"])}"'
+            lines.append(f'{prefix}_peak_bytes{{{labels}}} {total["peak_bytes"]}')
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,169 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from dss.profiling import stage
+
+PREFERENCE_FUNCTIONS = ('usual', 'linear', 'gaussian')
+
+# Pairwise differences held in memory at once, per thread, by the blocked computation
+PAIRWISE_BLOCK_CELLS = 2**16
+
+
+# Function to orient a decision matrix so that larger is better on every criterion
+# (cost columns are negated; the same benefit/cost convention as normalize_matrix)
+def oriented_matrix(decision_matrix, criteria_types):
+    matrix = np.asarray(decision_matrix, dtype=np.float64)
+    return np.where(np.asarray(criteria_types) == 'cost', -matrix, matrix)
+
+
+# Function to check the weights against the number of criteria and scale them to sum to one
+def unit_weights(weights, n_criteria):
+    weights = np.asarray(weights, dtype=np.float64)
+    if weights.shape != (n_criteria,) or (weights < 0).any() or weights.sum() <= 0:
+        raise ValueError(f"Weights must be {n_criteria} non-negative numbers with a positive sum.")
+    return weights / weights.sum()
+
+
+# Function to fill in the preference function parameters of every criterion: indifference
+# threshold q and preference threshold p for 'linear' (p == q is a step at q), and the
+# inflection point s for 'gaussian' (the column's standard deviation when not given)
+def preference_parameters(matrix, functions=None, q=None, p=None, s=None):
+    n_criteria = matrix.shape[1]
+    functions = np.array(['usual'] * n_criteria if functions is None else functions)
+    unknown = set(functions) - set(PREFERENCE_FUNCTIONS)
+    if unknown or functions.shape != (n_criteria,):
+        raise ValueError(f"Expected {n_criteria} preference functions from {', '.join(PREFERENCE_FUNCTIONS)}.")
+    q = np.zeros(n_criteria) if q is None else np.asarray(q, dtype=np.float64)
+    p = q.copy() if p is None else np.asarray(p, dtype=np.float64)
+    s = matrix.std(axis=0) if s is None else np.asarray(s, dtype=np.float64)
+    usual = functions == 'usual'
+    q, p = np.where(usual, 0.0, q), np.where(usual, 0.0, p)
+    if (q < 0).any() or (p < q).any():
+        raise ValueError("Preference thresholds must satisfy 0 <= q <= p.")
+    if (s[functions == 'gaussian'] <= 0).any():
+        raise ValueError("Gaussian preference functions need a positive s.")
+    return functions, q, p, s
+
+
+# Function to sum P(x_a - x_b) and P(x_b - x_a) over every b for one oriented column, with
+# P(d) = clip((d - q) / (p - q), 0, 1) (a step at q when p == q). Alternatives beyond p count
+# fully and those between q and p linearly, so a sort and prefix sums give both in O(n log n).
+def _sorted_preferences(column, q, p):
+    values = np.sort(column)
+    n = len(values)
+    if p == q:
+        return (np.searchsorted(values, column - q, side='left').astype(np.float64),
+                (n - np.searchsorted(values, column + q, side='right')).astype(np.float64))
+    # Centering keeps the prefix sums small, so their differences stay accurate
+    center = values[n // 2]
+    column = column - center
+    values = values - center
+    prefix = np.concatenate([[0.0], np.cumsum(values)])
+    full = np.searchsorted(values, column - p, side='right')
+    partial_end = np.searchsorted(values, column - q, side='left')
+    count = partial_end - full
+    positive = full + (count * (column - q) - (prefix[partial_end] - prefix[full])) / (p - q)
+    partial_start = np.searchsorted(values, column + q, side='right')
+    full_start = np.searchsorted(values, column + p, side='left')
+    count = full_start - partial_start
+    negative = (n - full_start) + ((prefix[full_start] - prefix[partial_start]) - count * (column + q)) / (p - q)
+    return positive, negative
+
+
+def _preference(differences, function, q, p, s):
+    if function == 'gaussian':
+        preference = -np.square(np.maximum(differences, 0.0)) / (2 * s * s)
+        np.exp(preference, out=preference)
+        return np.subtract(1.0, preference, out=preference)
+    if p == q:
+        return (differences > q).astype(np.float64)
+    preference = np.subtract(differences, q)
+    preference /= p - q
+    return np.clip(preference, 0.0, 1.0, out=preference)
+
+
+# Function to compare rows [start, stop) with each other and with every later row. Each
+# later pair is visited once: its preferences in both directions come from one block of
+# differences, and their column sums are the later rows' flows against this block.
+def _pairwise_block(matrix, weights, parameters, start, stop, totals):
+    block_positive, block_negative = totals[0, start:stop], totals[1, start:stop]
+    later_positive, later_negative = totals[0, stop:], totals[1, stop:]
+    for j, (function, q, p, s) in enumerate(zip(*parameters)):
+        block = matrix[start:stop, j, None]
+        differences = block - matrix[None, start:stop, j]
+        block_positive += weights[j] * _preference(differences, function, q, p, s).sum(axis=1)
+        block_negative += weights[j] * _preference(-differences, function, q, p, s).sum(axis=1)
+        differences = block - matrix[None, stop:, j]
+        preference = _preference(differences, function, q, p, s)
+        block_positive += weights[j] * preference.sum(axis=1)
+        later_negative += weights[j] * preference.sum(axis=0)
+        preference = _preference(np.negative(differences, out=differences), function, q, p, s)
+        block_negative += weights[j] * preference.sum(axis=1)
+        later_positive += weights[j] * preference.sum(axis=0)
+
+
+# Function to call `func(start, stop, totals)` on blocks of rows sized so that a block
+# compared against all n rows holds about `block_cells` values. Blocks are dealt out in
+# turn to `n_jobs` threads (NumPy releases the GIL inside its element-wise kernels); each
+# thread adds into its own zeroed `totals` array of `shape`, and their sum is returned.
+def accumulate_row_blocks(func, shape, n_rows, block_cells=PAIRWISE_BLOCK_CELLS, n_jobs=None):
+    block_size = max(1, block_cells // max(n_rows, 1))
+    blocks = [(start, min(start + block_size, n_rows)) for start in range(0, n_rows, block_size)]
+    n_jobs = max(1, min(n_jobs or os.cpu_count() or 1, len(blocks)))
+
+    def work(worker):
+        totals = np.zeros(shape)
+        for start, stop in blocks[worker::n_jobs]:
+            func(start, stop, totals)
+        return totals
+
+    if n_jobs == 1:
+        return work(0)
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        return sum(executor.map(work, range(n_jobs)))
+
+
+# Function to sum the weighted preferences of every alternative over every other one by
+# comparing row blocks against the later rows, one criterion at a time, so that only a
+# (block x n) slice of differences is in memory per thread
+def pairwise_preferences(matrix, weights, parameters, block_cells=PAIRWISE_BLOCK_CELLS, n_jobs=None):
+    n_alternatives = matrix.shape[0]
+    positive, negative = accumulate_row_blocks(
+        lambda start, stop, totals: _pairwise_block(matrix, weights, parameters, start, stop, totals),
+        (2, n_alternatives), n_alternatives, block_cells, n_jobs)
+    return positive, negative
+
+
+# Function to calculate PROMETHEE positive, negative and net (PROMETHEE II) outranking
+# flows without forming the (n x n x m) preference tensor. 'usual' and 'linear' criteria
+# are summed exactly from sorted columns; 'gaussian' criteria (or all of them with
+# method='pairwise') use the blocked, threaded pairwise computation.
+def promethee_flows(decision_matrix, weights, criteria_types, functions=None, q=None, p=None, s=None,
+                    method='auto', block_cells=PAIRWISE_BLOCK_CELLS, n_jobs=None):
+    if method not in ('auto', 'pairwise'):
+        raise ValueError(f"Unknown method '{method}'; expected 'auto' or 'pairwise'.")
+    matrix = oriented_matrix(decision_matrix, criteria_types)
+    n_alternatives, n_criteria = matrix.shape
+    weights = unit_weights(weights, n_criteria)
+    functions, q, p, s = preference_parameters(matrix, functions, q, p, s)
+    pairwise = np.ones(n_criteria, dtype=bool) if method == 'pairwise' else functions == 'gaussian'
+    positive = np.zeros(n_alternatives)
+    negative = np.zeros(n_alternatives)
+    with stage('promethee: sorted flows'):
+        for j in np.flatnonzero(~pairwise):
+            column_positive, column_negative = _sorted_preferences(matrix[:, j], q[j], p[j])
+            positive += weights[j] * column_positive
+            negative += weights[j] * column_negative
+    if pairwise.any():
+        with stage('promethee: pairwise flows'):
+            parameters = (functions[pairwise], q[pairwise], p[pairwise], s[pairwise])
+            block_positive, block_negative = pairwise_preferences(matrix[:, pairwise], weights[pairwise], parameters,
+                                                                  block_cells, n_jobs)
+            positive += block_positive
+            negative += block_negative
+    scale = 1.0 / max(n_alternatives - 1, 1)
+    positive *= scale
+    negative *= scale
+    return positive, negative, positive - negative
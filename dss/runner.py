@@ -0,0 +1,371 @@
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from dss.analysis import (AHP_PRIORITY_METHODS, TOPSIS_RESULTS_TITLE, ahp_analysis, saw_analysis, topsis_analysis,
+                          wp_analysis)
+from dss.ahp import EigenSolver
+from dss.matrix_io import load_comparison_stack, load_matrix, validate_comparison_stack, validate_matrix
+from dss.topsis import rank_descending
+
+METHODS = ('saw', 'wp', 'topsis', 'ahp')
+
+OUTPUT_FORMATS = ('parquet', 'csv')
+
+# One output row per alternative of every problem; consistency_ratio is only set for AHP
+OUTPUT_COLUMNS = ['problem', 'method', 'alternative', 'score', 'rank', 'consistency_ratio']
+
+# Problem files per task sent to a worker, and tasks in flight per worker
+DEFAULT_CHUNK_SIZE = 16
+TASKS_PER_WORKER = 2
+
+# Seconds between progress lines
+PROGRESS_INTERVAL = 1.0
+
+PRIORITY_METHODS = {'column_average': AHP_PRIORITY_METHODS[0], 'eigenvector': AHP_PRIORITY_METHODS[1]}
+
+
+# Function to list the problem files (*.json) under a directory, in a stable order
+def discover_problems(directory):
+    paths = []
+    for root, _, files in os.walk(directory):
+        paths.extend(os.path.join(root, name) for name in files if name.lower().endswith('.json'))
+    return sorted(paths)
+
+
+# Function to read a matrix given inline as nested lists, or as the path of a matrix file
+# relative to the problem file; inline matrices get the default names of the pages
+def _problem_matrix(value, base, row_names, column_names, row_prefix, column_prefix):
+    import pandas as pd
+
+    if isinstance(value, str):
+        frame = load_matrix(os.path.join(base, value))
+    else:
+        frame = pd.DataFrame(np.asarray(value, dtype=np.float64))
+        frame.index = [f'{row_prefix} {i+1}' for i in range(frame.shape[0])]
+        frame.columns = [f'{column_prefix} {j+1}' for j in range(frame.shape[1])]
+    if row_names is not None:
+        frame.index = [str(name) for name in row_names]
+    if column_names is not None:
+        frame.columns = [str(name) for name in column_names]
+    return validate_matrix(frame.rename_axis(None))
+
+
+# Function to read the comparison matrices of the alternatives under each criterion: a
+# {criterion: matrix} object, a list in criteria order, or the path of an .npy stack.
+# Every matrix must be positive and reciprocal with a unit diagonal.
+def _alternative_matrices(value, base, criteria_names, alternative_names):
+    import pandas as pd
+
+    if isinstance(value, str):
+        value = list(load_comparison_stack(os.path.join(base, value)))
+    if isinstance(value, dict):
+        value = [value[criterion] for criterion in criteria_names]
+    if len(value) != len(criteria_names):
+        raise ValueError(f"Expected {len(criteria_names)} alternative comparison matrices, got {len(value)}.")
+    matrices = {}
+    for criterion, matrix in zip(criteria_names, value):
+        matrix = np.asarray(matrix, dtype=np.float64)
+        names = alternative_names or [f'Alternative {i+1}' for i in range(len(matrix))]
+        if matrix.shape != (len(names), len(names)):
+            raise ValueError(f"The comparison matrix for {criterion} must be {len(names)} x {len(names)}, "
+                             f"got {matrix.shape}.")
+        try:
+            validate_comparison_stack(matrix[None])
+        except ValueError as error:
+            raise ValueError(f"The comparison matrix for {criterion} is invalid: {error}")
+        matrices[criterion] = pd.DataFrame(matrix, columns=names, index=names)
+    return matrices
+
+
+# Function to score one problem file with the analysis its page would run; returns the
+# output rows as a DataFrame
+def score_problem(path, name, default_method=None):
+    import pandas as pd
+
+    with open(path) as handle:
+        problem = json.load(handle)
+    if not isinstance(problem, dict):
+        raise ValueError(f"A problem file must hold a JSON object, got a {type(problem).__name__}.")
+    method = problem.get('method', default_method)
+    if method not in METHODS:
+        raise ValueError(f"Unknown method {method!r}; expected one of {', '.join(METHODS)}.")
+    base = os.path.dirname(path)
+    consistency_ratio_value = np.nan
+
+    if method == 'ahp':
+        criteria_matrix = np.asarray(problem['criteria_matrix'], dtype=np.float64)
+        criteria_names = [str(criterion) for criterion in problem.get(
+            'criteria', [f'Criterion {i+1}' for i in range(len(criteria_matrix))])]
+        if criteria_matrix.shape != (len(criteria_names), len(criteria_names)):
+            raise ValueError(f"The criteria comparison matrix must be {len(criteria_names)} x {len(criteria_names)}, "
+                             f"got {criteria_matrix.shape}.")
+        try:
+            validate_comparison_stack(criteria_matrix[None])
+        except ValueError as error:
+            raise ValueError(f"The criteria comparison matrix is invalid: {error}")
+        priority_method = PRIORITY_METHODS.get(problem.get('priority_method', 'column_average'))
+        if priority_method is None:
+            raise ValueError(f"Unknown priority method; expected one of {', '.join(PRIORITY_METHODS)}.")
+        alternative_names = [str(alternative) for alternative in problem.get('alternatives', [])]
+        ahp_df = pd.DataFrame(criteria_matrix, columns=criteria_names, index=criteria_names)
+        attribute_dfs = _alternative_matrices(problem['alternative_matrices'], base, criteria_names, alternative_names)
+        # A solver per problem, so no problem warm-starts from another problem's priorities
+        analysis = ahp_analysis(ahp_df, attribute_dfs, priority_method, solver=EigenSolver())
+        final_scores = analysis['Final Scores for Alternatives']['Final Score']
+        alternatives, scores = final_scores.index, final_scores.to_numpy()
+        ranks = rank_descending(scores)[0]
+        consistency_ratio_value = analysis['Consistency Check']['Consistency Ratio'].iloc[0]
+    else:
+        decision_df = _problem_matrix(problem['matrix'], base, problem.get('alternatives'), problem.get('criteria'),
+                                      'Alternative', 'Criteria')
+        n_criteria = decision_df.shape[1]
+        weights = np.asarray(problem.get('weights', [1.0] * n_criteria), dtype=np.float64)
+        criteria_types = np.array(problem.get('criteria_types', ['benefit'] * n_criteria))
+        if weights.shape != (n_criteria,) or not np.isfinite(weights).all():
+            raise ValueError(f"'weights' must have {n_criteria} finite values, got {weights.size}.")
+        if criteria_types.shape != (n_criteria,) or not np.isin(criteria_types, ('benefit', 'cost')).all():
+            raise ValueError(f"'criteria_types' must list 'benefit' or 'cost' for each of the {n_criteria} criteria.")
+        if method in ('saw', 'wp'):
+            values = decision_df.to_numpy()
+            if (values[:, criteria_types == 'cost'] <= 0).any():
+                raise ValueError("Cost criteria must be positive for SAW and WP normalization.")
+            if (values[:, criteria_types == 'benefit'].max(axis=0) <= 0).any():
+                raise ValueError("Benefit criteria need a positive maximum for SAW and WP normalization.")
+        if method == 'topsis':
+            result_df = topsis_analysis(decision_df, weights, criteria_types == 'benefit')[TOPSIS_RESULTS_TITLE]
+            alternatives, scores, ranks = result_df.index, result_df['Closeness Coefficient'], result_df['Ranking']
+        else:
+            analysis = (saw_analysis if method == 'saw' else wp_analysis)(decision_df, weights, criteria_types)
+            result_df = analysis['Final Scores and Rankings']
+            alternatives, scores, ranks = result_df['Alternative'], result_df['Final Score'], result_df['Rank']
+    if not np.isfinite(np.asarray(scores, dtype=np.float64)).all():
+        raise ValueError("The problem gives scores that are not finite numbers.")
+
+    return pd.DataFrame({'problem': name, 'method': method, 'alternative': np.asarray(alternatives, dtype=str),
+                         'score': np.asarray(scores, dtype=np.float64), 'rank': np.asarray(ranks, dtype=np.int64),
+                         'consistency_ratio': consistency_ratio_value}, columns=OUTPUT_COLUMNS)
+
+
+# Function to score one chunk of problem files; runs in the worker pool. Returns the rows
+# of every problem that succeeded, {problem: error message} for the others, and the
+# seconds each problem took
+def score_chunk(paths, names, default_method=None):
+    import pandas as pd
+
+    tables, errors, timings = [], {}, []
+    for path, name in zip(paths, names):
+        start = time.perf_counter()
+        try:
+            tables.append(score_problem(path, name, default_method))
+        # Any failure is recorded against its problem, so one bad file never stops the run
+        except Exception as error:
+            errors[name] = f"{type(error).__name__}: {error}"
+        timings.append(time.perf_counter() - start)
+    rows = pd.concat(tables, ignore_index=True) if tables else pd.DataFrame(columns=OUTPUT_COLUMNS)
+    return rows, errors, timings
+
+
+# Results of a run staged next to the output: every finished chunk is written at once as
+# a part file, then recorded in a journal. An interrupted run resumes from the journal;
+# finish() streams the parts into the single output file and removes the staging area,
+# unless `keep` is set (some problems failed) so the next run only scores what is missing.
+class BatchOutput:
+    def __init__(self, output, resume=True):
+        self.output = output
+        self.format = os.path.splitext(output)[1].lower().lstrip('.')
+        if self.format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format '{self.format}'; expected one of {', '.join(OUTPUT_FORMATS)}.")
+        self.staging = f'{output}.partial'
+        self.journal_path = os.path.join(self.staging, 'journal.jsonl')
+        if not resume:
+            shutil.rmtree(self.staging, ignore_errors=True)
+        os.makedirs(self.staging, exist_ok=True)
+        self.parts = []
+        self.completed = set()
+        self._read_journal()
+        self._journal = open(self.journal_path, 'a')
+
+    def _read_journal(self):
+        if not os.path.exists(self.journal_path):
+            return
+        with open(self.journal_path) as handle:
+            for line in handle:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # The last line of a run killed mid-write
+                    break
+                self.parts.append(entry['part'])
+                self.completed.update(entry['problems'])
+        recorded = set(self.parts) | {'journal.jsonl'}
+        for name in os.listdir(self.staging):
+            if name not in recorded:
+                os.remove(os.path.join(self.staging, name))
+
+    # Write one chunk's rows as a part file, then record its problems as done
+    def write(self, rows, problems):
+        part = f'{len(self.parts):06d}.{self.format}'
+        staged = os.path.join(self.staging, f'{part}.tmp')
+        if self.format == 'parquet':
+            rows.to_parquet(staged, index=False)
+        else:
+            rows.to_csv(staged, index=False)
+        os.replace(staged, os.path.join(self.staging, part))
+        self._journal.write(json.dumps({'part': part, 'problems': list(problems)}) + '\n')
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self.parts.append(part)
+        self.completed.update(problems)
+
+    # Concatenate the parts, in the order they finished, into the output file
+    def finish(self, keep=False):
+        self._journal.close()
+        staged = f'{self.output}.tmp'
+        paths = [os.path.join(self.staging, part) for part in self.parts]
+        if self.format == 'parquet':
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            schema = pa.schema([('problem', pa.string()), ('method', pa.string()), ('alternative', pa.string()),
+                                ('score', pa.float64()), ('rank', pa.int64()), ('consistency_ratio', pa.float64())])
+            with pq.ParquetWriter(staged, schema) as writer:
+                for path in paths:
+                    writer.write_table(pq.read_table(path).cast(schema))
+        else:
+            with open(staged, 'w', newline='') as target:
+                target.write(','.join(OUTPUT_COLUMNS) + '\n')
+                for path in paths:
+                    with open(path, newline='') as source:
+                        source.readline()
+                        shutil.copyfileobj(source, target)
+        os.replace(staged, self.output)
+        if not keep:
+            shutil.rmtree(self.staging)
+
+
+# Running totals of a batch run for the progress lines and the final summary
+class Throughput:
+    def __init__(self, total, skipped):
+        self.total = total
+        self.skipped = skipped
+        self.done = 0
+        self.failed = 0
+        self.rows = 0
+        self.timings = []
+        self.started = time.perf_counter()
+
+    def record(self, rows, errors, timings):
+        self.done += len(timings)
+        self.failed += len(errors)
+        self.rows += len(rows)
+        self.timings.extend(timings)
+
+    def summary(self):
+        elapsed = time.perf_counter() - self.started
+        timings = np.array(self.timings) * 1e3
+        p50, p99 = np.percentile(timings, [50, 99]) if len(timings) else (0.0, 0.0)
+        return {'problems': self.done, 'failed': self.failed, 'skipped': self.skipped, 'rows': self.rows,
+                'elapsed_s': elapsed, 'problems_per_s': self.done / elapsed if elapsed > 0 else 0.0,
+                'rows_per_s': self.rows / elapsed if elapsed > 0 else 0.0,
+                'p50_ms': float(p50), 'p99_ms': float(p99)}
+
+    def progress(self):
+        stats = self.summary()
+        remaining = self.total - self.done
+        eta = remaining / stats['problems_per_s'] if stats['problems_per_s'] else float('inf')
+        return (f"{self.done:,}/{self.total:,} problems ({self.done / max(self.total, 1):.1%}), "
+                f"{stats['problems_per_s']:,.1f} problems/s, {self.failed:,} failed, ETA {eta:,.0f} s")
+
+
+# Function to score every problem file under `directory` in a process pool and write one
+# row per alternative to `output` (.parquet or .csv). Problems are sent in chunks of
+# `chunk_size` with at most TASKS_PER_WORKER chunks queued per worker; `workers=0` scores
+# in this process. With `resume`, problems recorded by an interrupted run, or by a run in
+# which some problems failed, are skipped; failed problems are retried.
+# Returns the throughput summary and {problem: error} for the problems that failed.
+def run_batch(directory, output, method=None, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, resume=True,
+              log=None):
+    paths = discover_problems(directory)
+    names = [os.path.relpath(path, directory) for path in paths]
+    batch_output = BatchOutput(output, resume)
+    pending = [(path, name) for path, name in zip(paths, names) if name not in batch_output.completed]
+    chunks = [pending[start:start + chunk_size] for start in range(0, len(pending), chunk_size)]
+    throughput = Throughput(len(pending), len(paths) - len(pending))
+    errors = {}
+    last_report = time.perf_counter()
+
+    def collect(result):
+        nonlocal last_report
+        rows, chunk_errors, timings = result
+        if len(rows):
+            batch_output.write(rows, rows['problem'].unique().tolist())
+        errors.update(chunk_errors)
+        throughput.record(rows, chunk_errors, timings)
+        if log is not None and time.perf_counter() - last_report >= PROGRESS_INTERVAL:
+            log(throughput.progress())
+            last_report = time.perf_counter()
+
+    if workers == 0:
+        for chunk in chunks:
+            collect(score_chunk(*zip(*chunk), method))
+    elif chunks:
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            queue = iter(chunks)
+            in_flight = set()
+            while True:
+                for chunk in queue:
+                    in_flight.add(executor.submit(score_chunk, *zip(*chunk), method))
+                    if len(in_flight) >= workers * TASKS_PER_WORKER:
+                        break
+                if not in_flight:
+                    break
+                finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    collect(future.result())
+    batch_output.finish(keep=bool(errors))
+    return throughput.summary(), errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Score every decision problem file (*.json) in a directory with SAW, WP, TOPSIS or AHP",
+        epilog="A problem file holds {\"method\", \"matrix\", \"weights\", \"criteria_types\"} for SAW, WP and "
+               "TOPSIS, where \"matrix\" is nested lists or the path of a CSV, Parquet, Excel or .npy file, and "
+               "{\"method\": \"ahp\", \"criteria_matrix\", \"alternative_matrices\"} for AHP. Optional "
+               "\"alternatives\" and \"criteria\" name the rows and columns.")
+    parser.add_argument('directory')
+    parser.add_argument('-o', '--output', required=True, help="output file, .parquet or .csv")
+    parser.add_argument('--method', choices=METHODS, help="method for problem files that do not name one")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="scoring processes (default: one per CPU; 0 scores in this process)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="problem files per task")
+    parser.add_argument('--no-resume', action='store_true',
+                        help="discard the results of an interrupted run instead of resuming it")
+    args = parser.parse_args(argv)
+
+    log = lambda message: print(message, file=sys.stderr, flush=True)
+    try:
+        summary, errors = run_batch(args.directory, args.output, args.method, args.workers, max(1, args.chunk_size),
+                                    not args.no_resume, log)
+    except ValueError as error:
+        raise SystemExit(str(error))
+    for problem, message in sorted(errors.items()):
+        log(f"failed: {problem}: {message}")
+    print(f"scored {summary['problems'] - summary['failed']:,} problems ({summary['failed']:,} failed, "
+          f"{summary['skipped']:,} already done) into {summary['rows']:,} rows in {summary['elapsed_s']:.2f} s: "
+          f"{summary['problems_per_s']:,.1f} problems/s, {summary['rows_per_s']:,.0f} rows/s, "
+          f"per problem p50 {summary['p50_ms']:.2f} ms, p99 {summary['p99_ms']:.2f} ms")
+    if errors:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,30 @@
+import numpy as np
+
+from dss.profiling import stage
+
+
+# Function to normalize decision matrix for SAW; a leading axis stacks several matrices
+def normalize_matrix(decision_matrix, criteria_types):
+    normalized_matrix = np.copy(decision_matrix)
+    for i in range(decision_matrix.shape[-1]):
+        column = decision_matrix[..., i]
+        if criteria_types[i] == 'benefit':
+            normalized_matrix[..., i] = column / column.max(axis=-1, keepdims=True)
+        elif criteria_types[i] == 'cost':
+            normalized_matrix[..., i] = column.min(axis=-1, keepdims=True) / column
+    return normalized_matrix
+
+
+# Function to calculate SAW scores from an already normalized matrix (or a stack of
+# matrices with one weight vector each)
+def saw_scores(normalized_matrix, weights):
+    return np.matmul(normalized_matrix, np.asarray(weights)[..., None])[..., 0]
+
+
+# Function to calculate SAW scores
+def saw_method(decision_matrix, weights, criteria_types):
+    with stage('saw: normalize'):
+        normalized_matrix = normalize_matrix(decision_matrix, criteria_types)
+    with stage('saw: weighting'):
+        final_scores = saw_scores(normalized_matrix, weights)
+    return normalized_matrix, final_scores
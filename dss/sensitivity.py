@@ -0,0 +1,137 @@
+from collections import namedtuple
+
+import numpy as np
+
+from dss.profiling import stage
+from dss.saw import normalize_matrix, saw_scores
+from dss.topsis import column_norms, topsis_scores
+
+SENSITIVITY_METHODS = ('saw', 'topsis')
+
+# Per criterion: the smallest weight decrease (negative) and increase that let another
+# alternative overtake the best one (-inf / inf when none does), and who overtakes
+Sensitivity = namedtuple('Sensitivity', ['best', 'decrease', 'increase', 'decrease_by', 'increase_by'])
+
+
+# Function to list every pair of alternatives i < j as two index arrays
+def all_pairs(n_alternatives):
+    return np.triu_indices(n_alternatives, k=1)
+
+
+# Function to pair the best-scoring alternative (the first, on ties) with every other one
+def top_pairs(scores):
+    best = int(np.argmax(scores))
+    others = np.delete(np.arange(len(scores)), best)
+    return np.full(len(others), best), others
+
+
+# Function to calculate SAW rank-reversal thresholds. Scores are linear in each weight, so
+# pair (i, j) swaps when w_k changes by (S_i - S_j) / (r_jk - r_ik). Returns a (pairs x
+# criteria) array of weight changes, NaN where the pair never swaps for a non-negative weight.
+def saw_thresholds(normalized_matrix, weights, pairs):
+    weights = np.asarray(weights, dtype=np.float64)
+    first, second = pairs
+    scores = saw_scores(normalized_matrix, weights)
+    gap = (scores[first] - scores[second])[:, None]
+    slope = normalized_matrix[second] - normalized_matrix[first]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        change = gap / slope
+    return np.where(np.isfinite(change) & (weights + change >= 0), change, np.nan)
+
+
+# Function to solve a * u^2 + b * u + c = 0 element-wise without cancellation; returns the
+# two roots along a new last axis, NaN where a root is complex or undefined
+def _quadratic_roots(a, b, c):
+    discriminant = b * b - 4 * a * c
+    real = discriminant >= 0
+    q = -0.5 * (b + np.copysign(np.sqrt(np.where(real, discriminant, 0.0)), b))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        roots = np.stack([q / a, c / q], axis=-1)
+    return np.where(real[..., None] & np.isfinite(roots), roots, np.nan)
+
+
+# Function to calculate TOPSIS rank-reversal thresholds. The ideal solutions of the weighted
+# matrix are the weights times those of the normalized matrix, so with w_k = t the squared
+# distances are D+^2 = A + t^2 a and D-^2 = B + t^2 b. Closeness ties when D-_i D+_j = D-_j D+_i;
+# squared, that is a quadratic in u = t^2, solved for every pair and criterion at once.
+# Returns a (pairs x criteria x 2) array of weight changes, NaN where there is no crossing.
+def topsis_thresholds(decision_matrix, weights, is_benefit_criteria, pairs):
+    matrix = np.asarray(decision_matrix, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    benefit = np.asarray(is_benefit_criteria, dtype=bool)
+    normalized = matrix / column_norms(matrix)
+    column_max, column_min = normalized.max(axis=0), normalized.min(axis=0)
+    positive = np.square(normalized - np.where(benefit, column_max, column_min))
+    negative = np.square(normalized - np.where(benefit, column_min, column_max))
+    squared_weights = np.square(weights)
+    first, second = pairs
+    # Squared distances without criterion k (rest) and the coefficient of w_k^2 (per unit)
+    a_i, a_j, b_i, b_j = positive[first], positive[second], negative[first], negative[second]
+    rest_a_i = (a_i @ squared_weights)[:, None] - squared_weights * a_i
+    rest_a_j = (a_j @ squared_weights)[:, None] - squared_weights * a_j
+    rest_b_i = (b_i @ squared_weights)[:, None] - squared_weights * b_i
+    rest_b_j = (b_j @ squared_weights)[:, None] - squared_weights * b_j
+    # (B_i + u b_i)(A_j + u a_j) - (B_j + u b_j)(A_i + u a_i) = 0
+    roots = _quadratic_roots(b_i * a_j - b_j * a_i,
+                             rest_b_i * a_j + b_i * rest_a_j - rest_b_j * a_i - b_j * rest_a_i,
+                             rest_b_i * rest_a_j - rest_b_j * rest_a_i)
+    roots[roots < 0] = np.nan
+    return np.sqrt(roots) - weights[:, None]
+
+
+# Function to reduce thresholds against the best alternative to the nearest decrease and
+# increase per criterion, with the index of the alternative that overtakes at each
+def critical_changes(changes, others):
+    changes = changes.reshape(changes.shape[0], changes.shape[1], -1)
+    decrease = np.where(changes < 0, changes, -np.inf).max(axis=2)
+    increase = np.where(changes > 0, changes, np.inf).min(axis=2)
+    decrease_at = decrease.argmax(axis=0)
+    increase_at = increase.argmin(axis=0)
+    criteria = np.arange(changes.shape[1])
+    decrease, increase = decrease[decrease_at, criteria], increase[increase_at, criteria]
+    decrease_by = np.where(np.isfinite(decrease), others[decrease_at], -1)
+    increase_by = np.where(np.isfinite(increase), others[increase_at], -1)
+    return decrease, increase, decrease_by, increase_by
+
+
+def _check_weights(weights, n_criteria):
+    weights = np.asarray(weights, dtype=np.float64)
+    if weights.shape != (n_criteria,) or (weights < 0).any() or weights.sum() <= 0:
+        raise ValueError(f"Weights must be {n_criteria} non-negative numbers with a positive sum.")
+    return weights
+
+
+# Function to calculate rank-reversal thresholds for SAW or TOPSIS: for each pair of
+# alternatives (every pair i < j by default) and each criterion, the change of that weight
+# alone at which the pair swaps places. TOPSIS keeps the crossing nearest the current weight.
+def rank_reversal_thresholds(method, decision_matrix, weights, criteria_types, pairs=None):
+    if method not in SENSITIVITY_METHODS:
+        raise ValueError(f"Unknown method '{method}'; expected one of {', '.join(SENSITIVITY_METHODS)}.")
+    decision_matrix = np.asarray(decision_matrix, dtype=np.float64)
+    weights = _check_weights(weights, decision_matrix.shape[1])
+    pairs = all_pairs(len(decision_matrix)) if pairs is None else pairs
+    if method == 'saw':
+        return saw_thresholds(normalize_matrix(decision_matrix, criteria_types), weights, pairs)
+    changes = topsis_thresholds(decision_matrix, weights, np.asarray(criteria_types) == 'benefit', pairs)
+    nearest = np.nanargmin(np.where(np.isnan(changes), np.inf, np.abs(changes)), axis=2)
+    return np.take_along_axis(changes, nearest[..., None], axis=2)[..., 0]
+
+
+# Function to find how far each criterion weight can move, alone, before the best SAW or
+# TOPSIS alternative changes; exact, from one pass over the best-vs-other pairs
+def weight_sensitivity(method, decision_matrix, weights, criteria_types):
+    if method not in SENSITIVITY_METHODS:
+        raise ValueError(f"Unknown method '{method}'; expected one of {', '.join(SENSITIVITY_METHODS)}.")
+    decision_matrix = np.asarray(decision_matrix, dtype=np.float64)
+    weights = _check_weights(weights, decision_matrix.shape[1])
+    is_benefit = np.asarray(criteria_types) == 'benefit'
+    with stage(f'sensitivity: {method}'):
+        if method == 'saw':
+            normalized = normalize_matrix(decision_matrix, criteria_types)
+            pairs = top_pairs(saw_scores(normalized, weights))
+            changes = saw_thresholds(normalized, weights, pairs)
+        else:
+            pairs = top_pairs(topsis_scores(decision_matrix, weights, is_benefit))
+            changes = topsis_thresholds(decision_matrix, weights, is_benefit, pairs)
+        best = int(pairs[0][0]) if len(pairs[0]) else 0
+        return Sensitivity(best, *critical_changes(changes, pairs[1]))
@@ -0,0 +1,362 @@
+import argparse
+import asyncio
+import collections
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from urllib.parse import parse_qs
+
+import numpy as np
+
+from dss.ahp import consistency_indices, is_consistent, priority_vectors
+from dss.saw import saw_method
+from dss.topsis import closeness_coefficient, ideal_distances, ideal_solutions, rank_descending, weighted_matrix
+from dss.wp import wp_method
+
+# Seconds a request waits for others of the same shape before its batch is scored
+DEFAULT_WINDOW = 0.005
+
+# Requests scored together at most; a full batch is dispatched without waiting
+DEFAULT_MAX_BATCH = 256
+
+# Latencies kept per endpoint for the percentiles
+LATENCY_SAMPLES = 10_000
+
+ARROW_STREAM = 'application/vnd.apache.arrow.stream'
+
+METHODS = ('saw', 'wp', 'topsis', 'ahp')
+
+
+# Error answered with HTTP 4xx and a JSON {"error": ...} body
+class RequestError(Exception):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+# Function to calculate TOPSIS closeness for a (k, alternatives, criteria) stack with one
+# weight vector per matrix, using the same normalization and ideal points as topsis()
+def _topsis_batch(matrices, weights, is_benefit_criteria):
+    weighted = weighted_matrix(matrices, weights)
+    ideal_positive, ideal_negative = ideal_solutions(weighted, is_benefit_criteria)
+    return np.stack([closeness_coefficient(*ideal_distances(*solution))
+                     for solution in zip(weighted, ideal_positive, ideal_negative)])
+
+
+# Function to score one coalesced batch; runs in the worker pool. Returns one result per
+# request: (scores, ranks) for SAW/WP/TOPSIS, (priorities, CI, CR) for AHP
+def score_batch(method, matrices, weights, criteria_types):
+    if method == 'ahp':
+        priorities = priority_vectors(matrices)
+        consistency_index, consistency_ratio_value = consistency_indices(matrices, priorities)
+        return list(zip(priorities, consistency_index, consistency_ratio_value))
+    if method == 'saw':
+        scores = saw_method(matrices, weights, criteria_types)[1]
+    elif method == 'wp':
+        scores = wp_method(matrices, weights, criteria_types)[1]
+    else:
+        scores = _topsis_batch(matrices, weights, np.asarray(criteria_types) == 'benefit')
+    return [(row, rank_descending(row)[0]) for row in scores]
+
+
+# Rolling request latencies of one endpoint
+class LatencyStats:
+    def __init__(self, maxlen=LATENCY_SAMPLES):
+        self.latencies = collections.deque(maxlen=maxlen)
+        self.requests = 0
+        self.errors = 0
+
+    def record(self, seconds, error=False):
+        self.latencies.append(seconds)
+        self.requests += 1
+        self.errors += error
+
+    def summary(self, elapsed):
+        latencies = np.array(self.latencies) * 1e3
+        p50, p99 = np.percentile(latencies, [50, 99]) if len(latencies) else (None, None)
+        return {'requests': self.requests, 'errors': self.errors,
+                'p50_ms': None if p50 is None else float(p50), 'p99_ms': None if p99 is None else float(p99),
+                'throughput_rps': self.requests / elapsed if elapsed > 0 else 0.0}
+
+
+# Collects requests that share a batch key for `window` seconds (or until `max_batch`
+# arrive) and hands them to `run_batch(key, items)` as one batch
+class Coalescer:
+    def __init__(self, run_batch, window=DEFAULT_WINDOW, max_batch=DEFAULT_MAX_BATCH):
+        self.run_batch = run_batch
+        self.window = window
+        self.max_batch = max_batch
+        self.batches = 0
+        self.items = 0
+        self._pending = {}
+
+    async def submit(self, key, item):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = []
+            loop.call_later(self.window, self._flush, key, batch)
+        batch.append((item, future))
+        if len(batch) >= self.max_batch:
+            self._flush(key, batch)
+        return await future
+
+    def _flush(self, key, batch):
+        if self._pending.get(key) is not batch:
+            return
+        del self._pending[key]
+        self.batches += 1
+        self.items += len(batch)
+        asyncio.ensure_future(self._run(key, batch))
+
+    async def _run(self, key, batch):
+        try:
+            results = await self.run_batch(key, [item for item, _ in batch])
+        except Exception as error:
+            results = [error] * len(batch)
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+def _float_array(values, name, ndim):
+    try:
+        array = np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        raise RequestError(f"'{name}' must contain only numbers.")
+    if array.ndim != ndim:
+        raise RequestError(f"'{name}' must be a {ndim}-d array, got {array.ndim}-d.")
+    if not np.isfinite(array).all():
+        raise RequestError(f"'{name}' must not contain NaN or infinite values.")
+    return array
+
+
+# Function to validate one scoring problem and build its batch key and item
+def parse_problem(method, problem):
+    if not isinstance(problem, dict) or 'matrix' not in problem:
+        raise RequestError("Each problem must be an object with a 'matrix'.")
+    matrix = _float_array(problem['matrix'], 'matrix', 2)
+    if method == 'ahp':
+        n = matrix.shape[0]
+        if n < 1 or matrix.shape != (n, n) or (matrix <= 0).any():
+            raise RequestError("'matrix' must be a square matrix of positive pairwise comparisons.")
+        return ('ahp', matrix.shape, None), (matrix, None)
+
+    n_alternatives, n_criteria = matrix.shape
+    if n_alternatives < 1 or n_criteria < 1:
+        raise RequestError("'matrix' must have at least one alternative and one criterion.")
+    weights = _float_array(problem.get('weights', []), 'weights', 1)
+    if len(weights) != n_criteria:
+        raise RequestError(f"'weights' must have {n_criteria} values, got {len(weights)}.")
+    criteria_types = problem.get('criteria_types', ['benefit'] * n_criteria)
+    if not isinstance(criteria_types, list) or len(criteria_types) != n_criteria or any(value not in ('benefit', 'cost') for value in criteria_types):
+        raise RequestError(f"'criteria_types' must list 'benefit' or 'cost' for each of the {n_criteria} criteria.")
+    if method in ('saw', 'wp') and (matrix[:, np.array(criteria_types) == 'cost'] <= 0).any():
+        raise RequestError("Cost criteria must be positive for SAW and WP normalization.")
+    if method in ('saw', 'wp') and (matrix[:, np.array(criteria_types) == 'benefit'].max(axis=0) <= 0).any():
+        raise RequestError("Benefit criteria need a positive maximum for SAW and WP normalization.")
+    return (method, matrix.shape, tuple(criteria_types)), (matrix, weights)
+
+
+# Function to read an Arrow IPC stream: matrix columns, with the remaining problem fields
+# as JSON in the schema metadata under b'dss'
+def read_arrow_problem(body):
+    import pyarrow as pa
+
+    try:
+        table = pa.ipc.open_stream(body).read_all()
+    except pa.ArrowInvalid as error:
+        raise RequestError(f"Invalid Arrow IPC stream: {error}")
+    metadata = table.schema.metadata or {}
+    try:
+        problem = json.loads(metadata.get(b'dss', b'{}'))
+    except (json.JSONDecodeError, UnicodeDecodeError) as error:
+        raise RequestError(f"Invalid JSON in the 'dss' schema metadata: {error}")
+    if not isinstance(problem, dict):
+        raise RequestError("The 'dss' schema metadata must be a JSON object.")
+    problem['matrix'] = np.column_stack([column.to_numpy(zero_copy_only=False) for column in table.columns]) \
+        if table.num_columns else np.empty((table.num_rows, 0))
+    return problem
+
+
+def _result_record(method, result):
+    if method == 'ahp':
+        priorities, consistency_index, consistency_ratio_value = result
+        return {'priorities': priorities.tolist(), 'consistency_index': float(consistency_index),
+                'consistency_ratio': float(consistency_ratio_value),
+                'consistent': bool(is_consistent(consistency_ratio_value))}
+    scores, ranks = result
+    return {'scores': scores.tolist(), 'ranks': ranks.tolist()}
+
+
+def _arrow_body(method, result):
+    import pyarrow as pa
+
+    if method == 'ahp':
+        priorities, consistency_index, consistency_ratio_value = result
+        table = pa.table({'priority': priorities}).replace_schema_metadata({'dss': json.dumps({
+            'consistency_index': float(consistency_index), 'consistency_ratio': float(consistency_ratio_value)})})
+    else:
+        scores, ranks = result
+        table = pa.table({'score': scores, 'rank': ranks})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+# ASGI scoring service. POST /saw, /wp, /topsis or /ahp with a JSON problem (or a list of
+# problems) or an Arrow IPC stream; GET /metrics for latency and batching statistics.
+# Requests with the same method, shape and criteria types are coalesced into one batch
+# scored in a worker pool (`n_workers=0` scores in a thread next to the event loop).
+class ScoringService:
+    def __init__(self, window=DEFAULT_WINDOW, max_batch=DEFAULT_MAX_BATCH, n_workers=None):
+        self.n_workers = n_workers
+        self.coalescer = Coalescer(self._run_batch, window, max_batch)
+        self.stats = collections.defaultdict(LatencyStats)
+        self.started = time.perf_counter()
+        self._executor = None
+
+    def executor(self):
+        if self._executor is None:
+            if self.n_workers == 0:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+            else:
+                self._executor = ProcessPoolExecutor(max_workers=self.n_workers or os.cpu_count() or 1)
+        return self._executor
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    async def _run_batch(self, key, items):
+        method, _, criteria_types = key
+        matrices = np.stack([matrix for matrix, _ in items])
+        weights = None if method == 'ahp' else np.stack([weight for _, weight in items])
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor(), score_batch, method, matrices, weights, criteria_types)
+
+    async def score(self, method, problem):
+        key, item = parse_problem(method, problem)
+        result = await self.coalescer.submit(key, item)
+        # NaN or infinite scores (e.g. WP with negative benefit values) are not valid JSON
+        if not np.isfinite(result[0]).all():
+            raise RequestError("The matrix cannot be scored: it gives scores that are not finite numbers.")
+        return result
+
+    def metrics(self):
+        elapsed = time.perf_counter() - self.started
+        batches = self.coalescer.batches
+        return {
+            'uptime_s': elapsed,
+            'endpoints': {path: stats.summary(elapsed) for path, stats in sorted(self.stats.items())},
+            'batches': {'count': batches, 'mean_size': self.coalescer.items / batches if batches else 0.0},
+        }
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+        elif scope['type'] == 'http':
+            await self._http(scope, receive, send)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                self.executor()
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.shutdown()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _http(self, scope, receive, send):
+        start = time.perf_counter()
+        path = scope['path'].rstrip('/') or '/'
+        headers = {name.decode('latin-1').lower(): value.decode('latin-1') for name, value in scope['headers']}
+        status = 200
+        try:
+            body = await _read_body(receive)
+            content_type, payload = await self._respond(scope['method'], path, headers, body,
+                                                        parse_qs(scope.get('query_string', b'').decode()))
+        except RequestError as error:
+            status, content_type, payload = error.status, 'application/json', json.dumps({'error': str(error)}).encode()
+        except ValueError as error:
+            status, content_type, payload = 400, 'application/json', json.dumps({'error': str(error)}).encode()
+        await send({'type': 'http.response.start', 'status': status,
+                    'headers': [(b'content-type', content_type.encode()), (b'content-length', str(len(payload)).encode())]})
+        await send({'type': 'http.response.body', 'body': payload})
+        if path.lstrip('/') in METHODS:
+            self.stats[path].record(time.perf_counter() - start, error=status != 200)
+
+    async def _respond(self, http_method, path, headers, body, query):
+        if path == '/metrics':
+            if http_method != 'GET':
+                raise RequestError("Use GET for /metrics.", status=405)
+            return 'application/json', json.dumps(self.metrics()).encode()
+        if path == '/health':
+            return 'application/json', b'{"status": "ok"}'
+        method = path.lstrip('/')
+        if method not in METHODS:
+            raise RequestError(f"Unknown endpoint '{path}'; use one of /{', /'.join(METHODS)} or /metrics.", status=404)
+        if http_method != 'POST':
+            raise RequestError(f"Use POST for {path}.", status=405)
+
+        if headers.get('content-type', '').startswith(ARROW_STREAM):
+            result = await self.score(method, read_arrow_problem(body))
+            if ARROW_STREAM in headers.get('accept', '') or query.get('format') == ['arrow']:
+                return ARROW_STREAM, _arrow_body(method, result)
+            return 'application/json', json.dumps(_result_record(method, result)).encode()
+
+        try:
+            problem = json.loads(body)
+        except json.JSONDecodeError as error:
+            raise RequestError(f"Invalid JSON body: {error}")
+        if isinstance(problem, list):
+            results = await asyncio.gather(*(self.score(method, item) for item in problem))
+            return 'application/json', json.dumps([_result_record(method, result) for result in results]).encode()
+        return 'application/json', json.dumps(_result_record(method, await self.score(method, problem))).encode()
+
+
+async def _read_body(receive):
+    chunks = []
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            raise RequestError("Client disconnected.", status=499)
+        chunks.append(message.get('body', b''))
+        if not message.get('more_body'):
+            return b''.join(chunks)
+
+
+# Default instance for ASGI servers, e.g. `uvicorn dss.service:app`
+app = ScoringService()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the MCDM scoring service")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, default=None,
+                        help="scoring processes (default: one per CPU; 0 scores in a thread)")
+    parser.add_argument('--window-ms', type=float, default=DEFAULT_WINDOW * 1e3,
+                        help="how long requests wait to be coalesced with others of the same shape")
+    parser.add_argument('--max-batch', type=int, default=DEFAULT_MAX_BATCH)
+    args = parser.parse_args(argv)
+    try:
+        import uvicorn
+    except ImportError:
+        raise SystemExit("The scoring service needs an ASGI server: pip install uvicorn")
+    service = ScoringService(args.window_ms / 1e3, args.max_batch, args.workers)
+    uvicorn.run(service, host=args.host, port=args.port, log_level='warning')
+
+
+if __name__ == '__main__':
+    main()
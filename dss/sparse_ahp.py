@@ -0,0 +1,243 @@
+from collections import namedtuple
+
+import numpy as np
+
+from dss.profiling import stage
+
+SOLVERS = ('cg', 'scipy')
+
+# Acceptable geometric consistency index by number of items (Aguarón & Moreno-Jiménez, 2003)
+GCI_THRESHOLDS = {3: 0.31, 4: 0.35}
+GCI_THRESHOLD = 0.37
+
+# Up to this many items the effective resistances behind the suggestions come from the dense
+# pseudo-inverse of the Laplacian; beyond it they are estimated from random projections
+DENSE_RESISTANCE_LIMIT = 2000
+RESISTANCE_PROJECTIONS = 64
+RESISTANCE_BLOCK_ROWS = 256
+
+# Normalized priorities, their logarithms, the log-residual of every judgment, the
+# geometric consistency index of the observed pairs and the solver iterations
+IncompleteResult = namedtuple('IncompleteResult', ['priorities', 'log_priorities', 'residuals',
+                                                   'consistency_index', 'iterations'])
+
+
+# Function to look up the acceptable geometric consistency index for n items
+def gci_threshold(n):
+    return GCI_THRESHOLDS.get(n, GCI_THRESHOLD)
+
+
+# Function to label the connected components of the comparison graph (union-find);
+# every item gets the smallest item index of its component
+def connected_components(n, first, second):
+    parent = list(range(n))
+
+    def root(item):
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    for i, j in zip(first.tolist(), second.tolist()):
+        root_i, root_j = root(i), root(j)
+        if root_i != root_j:
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+    return np.array([root(item) for item in range(n)])
+
+
+# Function to check judgments "item first[e] is values[e] times as important as item
+# second[e]": indices in range, no self-comparisons, positive finite values, and every item
+# linked to every other through some chain of comparisons. Repeated pairs are allowed.
+def check_judgments(n, first, second, values):
+    first = np.asarray(first, dtype=np.int64)
+    second = np.asarray(second, dtype=np.int64)
+    values = np.asarray(values, dtype=np.float64)
+    if first.ndim != 1 or not first.shape == second.shape == values.shape:
+        raise ValueError("Judgments need matching 1-D arrays of first items, second items and values.")
+    if n < 2:
+        raise ValueError("At least two items are needed.")
+    if len(first) and (min(first.min(), second.min()) < 0 or max(first.max(), second.max()) >= n):
+        raise ValueError(f"Judgment items must be between 0 and {n - 1}.")
+    if (first == second).any():
+        raise ValueError("An item cannot be compared with itself.")
+    if not (np.isfinite(values).all() and (values > 0).all()):
+        raise ValueError("Pairwise comparisons must be positive, finite numbers.")
+    n_groups = len(np.unique(connected_components(n, first, second)))
+    if n_groups > 1:
+        raise ValueError(f"The comparisons split the {n} items into {n_groups} unconnected groups; "
+                         "they must link every item, which takes at least n - 1 comparisons.")
+    return first, second, values
+
+
+# Function to count the comparisons each item takes part in (the Laplacian diagonal)
+def comparison_degrees(n, first, second):
+    return (np.bincount(first, minlength=n) + np.bincount(second, minlength=n)).astype(np.float64)
+
+
+# Function to multiply the comparison-graph Laplacian by a vector, or by each column of an
+# (n, k) matrix, in O(comparisons) without forming the matrix
+def laplacian_matvec(x, first, second, degree):
+    if x.ndim == 2:
+        return np.column_stack([laplacian_matvec(column, first, second, degree) for column in x.T])
+    n = len(degree)
+    return (degree * x - np.bincount(first, weights=x[second], minlength=n)
+            - np.bincount(second, weights=x[first], minlength=n))
+
+
+# Function to solve A x = b by conjugate gradient with a Jacobi (diagonal) preconditioner;
+# `matvec` applies A to an (n, k) block so k right-hand sides are solved together. Each
+# column stops at |r| <= tol |b|. Returns the solution and the iterations used.
+def conjugate_gradient(matvec, b, diagonal, tol=1e-10, max_iter=None):
+    b = np.asarray(b, dtype=np.float64)
+    block = b if b.ndim == 2 else b[:, None]
+    max_iter = max_iter or 10 * len(block)
+    x = np.zeros_like(block)
+    residual = block.copy()
+    z = residual / diagonal[:, None]
+    direction = z.copy()
+    rz = np.einsum('ij,ij->j', residual, z)
+    target = tol * np.linalg.norm(block, axis=0)
+    iteration = 0
+    while iteration < max_iter and (np.linalg.norm(residual, axis=0) > target).any():
+        iteration += 1
+        product = matvec(direction)
+        curvature = np.einsum('ij,ij->j', direction, product)
+        step = np.divide(rz, curvature, out=np.zeros_like(rz), where=curvature > 0)
+        x += step * direction
+        residual -= step * product
+        z = residual / diagonal[:, None]
+        rz_next = np.einsum('ij,ij->j', residual, z)
+        direction = z + np.divide(rz_next, rz, out=np.zeros_like(rz), where=rz > 0) * direction
+        rz = rz_next
+    return (x if b.ndim == 2 else x[:, 0]), iteration
+
+
+# Function to solve the grounded Laplacian system (item 0 fixed at 0) with scipy.sparse
+def _scipy_solve(n, first, second, degree, rhs):
+    try:
+        from scipy.sparse import coo_matrix
+        from scipy.sparse.linalg import spsolve
+    except ImportError:
+        raise ImportError("The 'scipy' solver needs scipy: pip install scipy")
+    rows = np.concatenate([first, second, np.arange(n)])
+    columns = np.concatenate([second, first, np.arange(n)])
+    data = np.concatenate([-np.ones(2 * len(first)), degree])
+    laplacian = coo_matrix((data, (rows, columns)), shape=(n, n)).tocsc()[1:, 1:]
+    return np.concatenate([[0.0], spsolve(laplacian, rhs[1:])])
+
+
+# Function to derive AHP priorities from an incomplete set of pairwise judgments by
+# logarithmic least squares: minimize sum_e (v_first - v_second - log value_e)^2, whose normal
+# equations are L v = b with L the Laplacian of the comparison graph. On a complete matrix
+# this is the row geometric mean. Consistency is Crawford's geometric consistency index
+# computed over the observed pairs only: sum of squared log-residuals / (comparisons - n + 1),
+# 0 for a spanning tree, which has no redundancy to check.
+def incomplete_priorities(n, first, second, values, solver='cg', tol=1e-10):
+    if solver not in SOLVERS:
+        raise ValueError(f"Unknown solver '{solver}'; expected one of {', '.join(SOLVERS)}.")
+    first, second, values = check_judgments(n, first, second, values)
+    log_values = np.log(values)
+    degree = comparison_degrees(n, first, second)
+    rhs = np.bincount(first, weights=log_values, minlength=n) - np.bincount(second, weights=log_values, minlength=n)
+    with stage(f'sparse ahp: {solver} solve'):
+        if solver == 'scipy':
+            log_priorities, iterations = _scipy_solve(n, first, second, degree, rhs), 0
+        else:
+            log_priorities, iterations = conjugate_gradient(
+                lambda x: laplacian_matvec(x, first, second, degree), rhs, degree, tol)
+    log_priorities -= log_priorities.mean()
+    with stage('sparse ahp: consistency'):
+        residuals = log_values - (log_priorities[first] - log_priorities[second])
+        redundancy = len(values) - n + 1
+        consistency_index = float(np.square(residuals).sum() / redundancy) if redundancy > 0 else 0.0
+    priorities = np.exp(log_priorities - log_priorities.max())
+    return IncompleteResult(priorities / priorities.sum(), log_priorities, residuals, consistency_index, iterations)
+
+
+# Function to pick, greedily, the `count` missing pairs of largest effective resistance from
+# the dense Laplacian pseudo-inverse; after each pick the pseudo-inverse gets the rank-one
+# update for the new comparison, so later picks account for the earlier ones
+def _dense_suggestions(n, first, second, degree, count):
+    laplacian = np.diag(degree)
+    np.add.at(laplacian, (first, second), -1.0)
+    np.add.at(laplacian, (second, first), -1.0)
+    pseudo_inverse = np.linalg.inv(laplacian + 1.0 / n) - 1.0 / n
+    excluded = np.tri(n, dtype=bool)
+    excluded[np.minimum(first, second), np.maximum(first, second)] = True
+    picked_first, picked_second, resistances = [], [], []
+    for _ in range(min(count, int((~excluded).sum()))):
+        diagonal = np.diag(pseudo_inverse)
+        resistance = diagonal[:, None] + diagonal[None, :] - 2 * pseudo_inverse
+        resistance[excluded] = -np.inf
+        i, j = np.unravel_index(np.argmax(resistance), resistance.shape)
+        picked_first.append(i)
+        picked_second.append(j)
+        resistances.append(resistance[i, j])
+        excluded[i, j] = True
+        direction = pseudo_inverse[:, i] - pseudo_inverse[:, j]
+        pseudo_inverse -= np.outer(direction, direction) / (1.0 + resistance[i, j])
+    return np.array(picked_first, dtype=np.int64), np.array(picked_second, dtype=np.int64), np.array(resistances)
+
+
+# Function to estimate effective resistances from a random-projection sketch (Spielman &
+# Srivastava): with Q a random +-1/sqrt(k) (k x comparisons) matrix and B the incidence
+# matrix, R_ij ~ |Z_i - Z_j|^2 for Z = L^+ B^T Q^T, solved by block conjugate gradient.
+# Missing pairs are scanned in row blocks, keeping the `count` largest.
+def _sketched_suggestions(n, first, second, degree, count, projections, seed):
+    rng = np.random.default_rng(seed)
+    signs = rng.choice([-1.0, 1.0], size=(len(first), projections)) / np.sqrt(projections)
+    rhs = np.zeros((n, projections))
+    np.add.at(rhs, first, signs)
+    np.subtract.at(rhs, second, signs)
+    embedding = conjugate_gradient(lambda x: laplacian_matvec(x, first, second, degree), rhs, degree, 1e-6)[0]
+    squared_norms = np.einsum('ij,ij->i', embedding, embedding)
+    low, high = np.minimum(first, second), np.maximum(first, second)
+    codes, resistances = [], []
+    for start in range(0, n - 1, RESISTANCE_BLOCK_ROWS):
+        stop = min(start + RESISTANCE_BLOCK_ROWS, n)
+        resistance = squared_norms[start:stop, None] + squared_norms[None, :] - 2 * embedding[start:stop] @ embedding.T
+        resistance[np.arange(n)[None, :] <= np.arange(start, stop)[:, None]] = -np.inf
+        in_block = (low >= start) & (low < stop)
+        resistance[low[in_block] - start, high[in_block]] = -np.inf
+        flat = resistance.ravel()
+        top = np.argpartition(-flat, min(count, flat.size) - 1)[:count]
+        codes.append(start * n + top)
+        resistances.append(flat[top])
+    codes, resistances = np.concatenate(codes), np.concatenate(resistances)
+    top = np.argsort(-resistances, kind='stable')[:count]
+    top = top[np.isfinite(resistances[top])]
+    return codes[top] // n, codes[top] % n, resistances[top]
+
+
+# Function to suggest the comparisons to ask next: the missing pairs whose ratio the current
+# judgments pin down least, i.e. of largest effective resistance in the comparison graph.
+# Resistance is the variance factor of the implied log-ratio, so asking such a pair adds the
+# most information (log(1 + R)). The choice depends on the graph only, not on the judgment
+# values: these are information-maximizing suggestions, not consistency-targeted ones, and
+# judgments with large residuals are not preferred. Returns (first, second, resistance).
+def suggest_comparisons(n, first, second, count=10, projections=RESISTANCE_PROJECTIONS, seed=0):
+    first = np.asarray(first, dtype=np.int64)
+    second = np.asarray(second, dtype=np.int64)
+    check_judgments(n, first, second, np.ones(len(first)))
+    degree = comparison_degrees(n, first, second)
+    with stage('sparse ahp: suggestions'):
+        if n <= DENSE_RESISTANCE_LIMIT:
+            return _dense_suggestions(n, first, second, degree, count)
+        return _sketched_suggestions(n, first, second, degree, count, projections, seed)
+
+
+# Function to simulate incomplete judgments of n items: a random spanning tree plus
+# `extra` further random pairs per item, each the true ratio times log-normal noise.
+# Returns (first, second, values, true priorities).
+def simulate_judgments(n, extra=2, sigma=0.2, seed=0):
+    rng = np.random.default_rng(seed)
+    truth = rng.uniform(1, 9, size=n)
+    order = rng.permutation(n)
+    tree_first = order[1:]
+    tree_second = order[(rng.random(n - 1) * np.arange(1, n)).astype(np.int64)]
+    extra_first = rng.integers(0, n, size=int(extra * n))
+    extra_second = (extra_first + rng.integers(1, n, size=len(extra_first))) % n
+    first = np.concatenate([tree_first, extra_first])
+    second = np.concatenate([tree_second, extra_second])
+    values = truth[first] / truth[second] * np.exp(rng.normal(0.0, sigma, size=len(first)))
+    return first, second, values, truth / truth.sum()
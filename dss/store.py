@@ -0,0 +1,302 @@
+import copy
+import functools
+import glob
+import hashlib
+import os
+import pickle
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+import numpy as np
+
+from dss.memo import content_key
+
+# Store location and size budget, overridable from the environment. Results are pickles,
+# so the directory must be private to the user running the app (see _check_private).
+STORE_DIR = os.environ.get('DSS_STORE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'dss'))
+STORE_MAX_BYTES = int(os.environ.get('DSS_STORE_MAX_BYTES', 2**30))
+
+# Arrays at least this large are written to their own .npy file and memory-mapped on load;
+# smaller ones stay inside the pickle
+MMAP_MIN_BYTES = 2**16
+
+# Recently loaded results kept in memory, shared by every session of the process
+MEMORY_ENTRIES = 64
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    method TEXT NOT NULL,
+    label TEXT,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed);
+CREATE INDEX IF NOT EXISTS results_created ON results (method, created);
+CREATE TABLE IF NOT EXISTS history (
+    owner TEXT NOT NULL,
+    key TEXT NOT NULL,
+    method TEXT NOT NULL,
+    label TEXT NOT NULL,
+    created REAL NOT NULL,
+    PRIMARY KEY (owner, key)
+);
+CREATE INDEX IF NOT EXISTS history_created ON history (owner, method, created);
+"""
+
+_MISSING = object()
+
+# Modules of the dss package; their source is part of every result key
+PACKAGE_SOURCES = tuple(sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), '*.py'))))
+
+
+class _ArrayPickler(pickle.Pickler):
+    def __init__(self, file, directory):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.directory = directory
+        self.count = 0
+
+    def persistent_id(self, value):
+        if type(value) is not np.ndarray or value.dtype.hasobject or value.nbytes < MMAP_MIN_BYTES:
+            return None
+        name = f'array{self.count}.npy'
+        self.count += 1
+        np.save(os.path.join(self.directory, name), value, allow_pickle=False)
+        return name
+
+
+class _ArrayUnpickler(pickle.Unpickler):
+    def __init__(self, file, directory):
+        super().__init__(file)
+        self.directory = directory
+
+    def persistent_load(self, name):
+        return np.load(os.path.join(self.directory, name), mmap_mode='r').view(np.ndarray)
+
+
+# Function to hash one source file; cached on its modification time and size
+@functools.lru_cache(maxsize=256)
+def _file_digest(path, mtime_ns, size):
+    with open(path, 'rb') as file:
+        return hashlib.blake2b(file.read(), digest_size=16).digest()
+
+
+# Function to fingerprint source files by content, so that results computed by an older
+# version of the code are never served after it changes
+def source_fingerprint(*paths):
+    digest = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        try:
+            status = os.stat(path)
+        except OSError:
+            digest.update(f'missing:{path}'.encode())
+            continue
+        digest.update(_file_digest(path, status.st_mtime_ns, status.st_size))
+    return digest.hexdigest()
+
+
+# Function to refuse a store directory another user could have written: loading a pickle
+# runs code, so only a directory owned by this user and closed to others (0700) is used
+def _check_private(root):
+    status = os.stat(root)
+    if hasattr(os, 'getuid') and status.st_uid != os.getuid():
+        raise PermissionError(f"The result store {root} belongs to another user.")
+    if status.st_mode & 0o022:
+        raise PermissionError(f"The result store {root} is writable by other users; make it private (chmod 700).")
+    if status.st_mode & 0o077:
+        os.chmod(root, 0o700)
+
+
+# Function to hand out a stored result without exposing the copy shared by every session:
+# containers are rebuilt, arrays become read-only views and pandas objects copies (shallow
+# under pandas' copy-on-write, so memory-mapped data is not read into RAM)
+def _detached(value):
+    if type(value) is dict:
+        return {key: _detached(item) for key, item in value.items()}
+    if type(value) in (list, tuple):
+        return type(value)(_detached(item) for item in value)
+    if isinstance(value, np.ndarray):
+        view = value.view()
+        view.flags.writeable = False
+        return view
+    if type(value).__module__.startswith('pandas.'):
+        import pandas as pd
+
+        return value.copy(deep=int(pd.__version__.split('.')[0]) < 3)
+    return copy.deepcopy(value)
+
+
+def _directory_size(directory):
+    return sum(entry.stat().st_size for entry in os.scandir(directory) if entry.is_file())
+
+
+# On-disk result store shared across sessions and processes. Results are keyed by a
+# content hash of (method, inputs, the NumPy version, and a fingerprint of the library's
+# source); the index lives in SQLite, each result in its own directory as a
+# pickle whose large arrays are separate .npy files that are memory-mapped on load. Least
+# recently used results are evicted once the total size passes `max_bytes`. Results are
+# shared, but the history of past analyses is kept per owner (a user or session id): a
+# result fetched with a label and an owner is listed in that owner's history only. Every
+# caller gets its own copy of a result (arrays read-only), never the shared one.
+class ResultStore:
+    def __init__(self, root=STORE_DIR, max_bytes=STORE_MAX_BYTES, memory_entries=MEMORY_ENTRIES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._lock = threading.RLock()
+        os.makedirs(root, mode=0o700, exist_ok=True)
+        _check_private(root)
+        os.makedirs(os.path.join(root, 'objects'), exist_ok=True)
+        os.makedirs(os.path.join(root, 'tmp'), exist_ok=True)
+        self._connection = sqlite3.connect(os.path.join(root, 'index.sqlite'), timeout=30,
+                                           check_same_thread=False, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.executescript(_SCHEMA)
+
+    def key(self, method, *inputs):
+        return content_key(method, source_fingerprint(*PACKAGE_SOURCES), np.__version__, *inputs)
+
+    def _path(self, key):
+        return os.path.join(self.root, 'objects', key)
+
+    def _remember(self, key, value):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _load(self, key):
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+        if self._connection.execute('SELECT 1 FROM results WHERE key = ?', (key,)).fetchone() is None:
+            return _MISSING
+        directory = self._path(key)
+        try:
+            with open(os.path.join(directory, 'result.pkl'), 'rb') as file:
+                value = _ArrayUnpickler(file, directory).load()
+        except (OSError, pickle.UnpicklingError, EOFError):
+            self._delete(key)
+            return _MISSING
+        self._connection.execute('UPDATE results SET accessed = ?, hits = hits + 1 WHERE key = ?', (time.time(), key))
+        self._remember(key, value)
+        return value
+
+    # Method to return the stored result for `key`, or `default` when there is none
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._load(key)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return _detached(value)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._memory or self._connection.execute(
+                'SELECT 1 FROM results WHERE key = ?', (key,)).fetchone() is not None
+
+    # Method to write a result under `key`; the directory is written aside and renamed into
+    # place, so readers never see a partial result. The caller keeps `value`: the memory
+    # cache is filled from disk on the next get, never with an object the caller can change.
+    def put(self, key, value, method, label=None):
+        staging = os.path.join(self.root, 'tmp', uuid.uuid4().hex)
+        os.makedirs(staging)
+        with open(os.path.join(staging, 'result.pkl'), 'wb') as file:
+            _ArrayPickler(file, staging).dump(value)
+        size = _directory_size(staging)
+        with self._lock:
+            try:
+                os.rename(staging, self._path(key))
+            except OSError:
+                # Already stored by another session or process
+                shutil.rmtree(staging, ignore_errors=True)
+            now = time.time()
+            self._connection.execute(
+                'INSERT INTO results (key, method, label, size, created, accessed) VALUES (?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (key) DO UPDATE SET accessed = excluded.accessed, label = COALESCE(excluded.label, label)',
+                (key, method, label, size, now, now))
+            self.evict(keep=key)
+
+    # Method to return the stored result of `compute()` for these inputs, computing and
+    # storing it on a miss; with a label and an owner it is added to the owner's history
+    def fetch(self, method, compute, *inputs, label=None, owner=None):
+        key = self.key(method, *inputs)
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value, method, label)
+        if label is not None and owner is not None:
+            self.record(owner, key, method, label)
+        return value
+
+    # Method to add a stored result to an owner's history; an analysis already listed keeps its entry
+    def record(self, owner, key, method, label):
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR IGNORE INTO history (owner, key, method, label, created) VALUES (?, ?, ?, ?, ?)',
+                (owner, key, method, label, time.time()))
+
+    def _delete(self, key):
+        self._memory.pop(key, None)
+        self._connection.execute('DELETE FROM results WHERE key = ?', (key,))
+        self._connection.execute('DELETE FROM history WHERE key = ?', (key,))
+        shutil.rmtree(self._path(key), ignore_errors=True)
+
+    # Method to drop least recently used results until the store fits in max_bytes
+    def evict(self, keep=None):
+        with self._lock:
+            total = self._connection.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+            if total <= self.max_bytes:
+                return 0
+            evicted = 0
+            for key, size in self._connection.execute('SELECT key, size FROM results ORDER BY accessed').fetchall():
+                if total <= self.max_bytes:
+                    break
+                if key == keep:
+                    continue
+                self._delete(key)
+                total -= size
+                evicted += 1
+            return evicted
+
+    # Method to list an owner's past analyses, newest first
+    def history(self, owner, method=None, limit=50):
+        query = ('SELECT history.key, history.method, history.label, results.size, history.created '
+                 'FROM history JOIN results ON results.key = history.key WHERE history.owner = ?')
+        parameters = (owner,)
+        if method is not None:
+            query += ' AND history.method = ?'
+            parameters += (method,)
+        with self._lock:
+            rows = self._connection.execute(query + ' ORDER BY history.created DESC LIMIT ?',
+                                            (*parameters, limit)).fetchall()
+        return [dict(zip(('key', 'method', 'label', 'size', 'created'), row)) for row in rows]
+
+    def stats(self):
+        with self._lock:
+            entries, size = self._connection.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results').fetchone()
+        total = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hits / total if total else 0.0,
+                'entries': entries, 'bytes': size, 'max_bytes': self.max_bytes}
+
+    def clear(self):
+        with self._lock:
+            for (key,) in self._connection.execute('SELECT key FROM results').fetchall():
+                self._delete(key)
+            self._memory.clear()
+            self.hits = self.misses = 0
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
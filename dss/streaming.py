@@ -0,0 +1,148 @@
+import heapq
+import os
+
+import numpy as np
+
+from dss.topsis import closeness_coefficient, ideal_distances
+
+# Rows read per chunk when streaming a decision matrix
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+# Function to read a decision matrix chunk by chunk as float64 arrays. `source` is a
+# CSV/Parquet path, an in-memory or memory-mapped array, or a zero-argument callable
+# returning a fresh iterable of arrays (the ranking makes two passes over it).
+def iter_matrix_chunks(source, chunk_size=DEFAULT_CHUNK_SIZE, columns=None):
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        if path.endswith(('.parquet', '.pq')):
+            import pyarrow.parquet as pq
+
+            for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size, columns=columns):
+                yield np.column_stack([column.to_numpy(zero_copy_only=False) for column in batch.columns]).astype(np.float64)
+        else:
+            import pandas as pd
+
+            for frame in pd.read_csv(path, chunksize=chunk_size, usecols=columns):
+                if columns is not None:
+                    frame = frame[columns]
+                yield frame.to_numpy(dtype=np.float64)
+    elif callable(source):
+        for chunk in source():
+            yield np.array(chunk, dtype=np.float64)
+    else:
+        for start in range(0, len(source), chunk_size):
+            yield np.array(source[start:start + chunk_size], dtype=np.float64)
+
+
+# Function to collect column max, min and sum of squares in a single pass (pass 1)
+def column_statistics(source, chunk_size=DEFAULT_CHUNK_SIZE, columns=None):
+    column_max = column_min = sum_of_squares = None
+    n_rows = 0
+    for chunk in iter_matrix_chunks(source, chunk_size, columns):
+        if not len(chunk):
+            continue
+        if column_max is None:
+            column_max = chunk.max(axis=0)
+            column_min = chunk.min(axis=0)
+            sum_of_squares = np.einsum('ij,ij->j', chunk, chunk)
+        else:
+            np.maximum(column_max, chunk.max(axis=0), out=column_max)
+            np.minimum(column_min, chunk.min(axis=0), out=column_min)
+            sum_of_squares += np.einsum('ij,ij->j', chunk, chunk)
+        n_rows += len(chunk)
+    if column_max is None:
+        raise ValueError("The decision matrix is empty.")
+    return {'max': column_max, 'min': column_min, 'sum_of_squares': sum_of_squares, 'rows': n_rows}
+
+
+# Function to pick the rows of the k largest keys, best first; ties keep the lower row
+# number like a stable sort, and NaN keys rank last
+def top_indices(keys, k):
+    keys = np.where(np.isnan(keys), -np.inf, keys)
+    if len(keys) > k:
+        kth = np.partition(keys, len(keys) - k)[len(keys) - k]
+        above = np.flatnonzero(keys > kth)
+        ties = np.flatnonzero(keys == kth)[:k - len(above)]
+        candidates = np.sort(np.concatenate([above, ties]))
+    else:
+        candidates = np.arange(len(keys))
+    return candidates[np.argsort(-keys[candidates], kind='stable')]
+
+
+# Function to keep the k best (score, row) pairs. argpartition alone would pick an
+# arbitrary subset of the rows tied at the k-th score, so candidates come from
+# top_indices, and the heap orders equal scores by row number: ties keep the lower row
+# number like a stable sort, within and across chunks. Items are (key, -row, score) with
+# NaN scores keyed as -inf, as in top_indices, since NaN keys would break the ordering.
+def _push_top_k(heap, scores, offset, k):
+    keys = np.where(np.isnan(scores), -np.inf, scores)
+    for i in top_indices(scores, k):
+        item = (float(keys[i]), -(offset + int(i)), float(scores[i]))
+        if len(heap) < k:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            heapq.heapreplace(heap, item)
+
+
+def _stream_top_k(score_chunk, source, k, chunk_size, columns):
+    heap = []
+    offset = 0
+    for chunk in iter_matrix_chunks(source, chunk_size, columns):
+        _push_top_k(heap, score_chunk(chunk), offset, k)
+        offset += len(chunk)
+    best = sorted(heap, reverse=True)
+    rows = np.array([-row for _, row, _ in best], dtype=np.int64)
+    scores = np.array([score for _, _, score in best], dtype=np.float64)
+    return rows, scores
+
+
+# Function to normalize rows with global column statistics (same rule as normalize_matrix);
+# writes into `out` when given
+def normalize_with_statistics(chunk, criteria_types, stats, out=None):
+    criteria_types = np.asarray(criteria_types)
+    benefit = criteria_types == 'benefit'
+    cost = criteria_types == 'cost'
+    normalized = np.divide(chunk, np.where(benefit, stats['max'], 1.0), out=out)
+    np.divide(np.where(cost, stats['min'], 1.0), chunk, out=normalized, where=cost)
+    return normalized
+
+
+# Function to stream the SAW top-k rows (row numbers, scores) of a matrix larger than RAM
+def stream_saw(source, weights, criteria_types, k=10, chunk_size=DEFAULT_CHUNK_SIZE, columns=None):
+    stats = column_statistics(source, chunk_size, columns)
+    weights = np.asarray(weights, dtype=np.float64)
+    return _stream_top_k(lambda chunk: normalize_with_statistics(chunk, criteria_types, stats) @ weights,
+                         source, k, chunk_size, columns)
+
+
+# Function to stream the WP top-k rows (row numbers, scores) of a matrix larger than RAM
+def stream_wp(source, weights, criteria_types, k=10, chunk_size=DEFAULT_CHUNK_SIZE, columns=None):
+    stats = column_statistics(source, chunk_size, columns)
+    weights = np.asarray(weights, dtype=np.float64)
+    return _stream_top_k(lambda chunk: np.prod(normalize_with_statistics(chunk, criteria_types, stats) ** weights, axis=1),
+                         source, k, chunk_size, columns)
+
+
+# Function to derive the TOPSIS column scale (weight / norm) and ideal points from column
+# statistics; the ideal points of the weighted matrix follow from the raw column extremes
+def topsis_ideals(stats, weights, is_benefit_criteria):
+    scale = np.asarray(weights, dtype=np.float64) / np.sqrt(stats['sum_of_squares'])
+    scaled_max = stats['max'] * scale
+    scaled_min = stats['min'] * scale
+    column_max = np.maximum(scaled_max, scaled_min)
+    column_min = np.minimum(scaled_max, scaled_min)
+    benefit = np.asarray(is_benefit_criteria, dtype=bool)
+    return scale, np.where(benefit, column_max, column_min), np.where(benefit, column_min, column_max)
+
+
+# Function to stream the TOPSIS top-k rows (row numbers, closeness) of a matrix larger than RAM
+def stream_topsis(source, weights, is_benefit_criteria, k=10, chunk_size=DEFAULT_CHUNK_SIZE, columns=None):
+    stats = column_statistics(source, chunk_size, columns)
+    scale, ideal_positive, ideal_negative = topsis_ideals(stats, weights, is_benefit_criteria)
+
+    def score_chunk(chunk):
+        np.multiply(chunk, scale, out=chunk)
+        return closeness_coefficient(*ideal_distances(chunk, ideal_positive, ideal_negative))
+
+    return _stream_top_k(score_chunk, source, k, chunk_size, columns)
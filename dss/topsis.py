@@ -0,0 +1,135 @@
+import numpy as np
+
+from dss.profiling import stage
+
+# Rows processed per block when measuring distances to the ideal solutions
+DISTANCE_BLOCK_SIZE = 8192
+
+
+# Function to calculate the L2 norm of every column (per matrix for a stack of matrices)
+def column_norms(matrix):
+    return np.sqrt(np.einsum('...ij,...ij->...j', matrix, matrix))
+
+
+# Function to normalize and weight the matrix in one step; writes into `out` when given
+def weighted_matrix(matrix, weights, out=None):
+    scale = np.asarray(weights, dtype=matrix.dtype) / column_norms(matrix)
+    return np.multiply(matrix, scale[..., None, :], out=out)
+
+
+# Function to pick the ideal positive and negative solutions with a benefit mask
+def ideal_solutions(weighted, is_benefit_criteria):
+    benefit = np.asarray(is_benefit_criteria, dtype=bool)
+    column_max = weighted.max(axis=-2)
+    column_min = weighted.min(axis=-2)
+    return np.where(benefit, column_max, column_min), np.where(benefit, column_min, column_max)
+
+
+# Function to calculate both ideal distances in a single blocked pass over the rows
+def ideal_distances(weighted, ideal_positive, ideal_negative, block_size=DISTANCE_BLOCK_SIZE):
+    n_rows = weighted.shape[0]
+    distance_to_positive = np.empty(n_rows, dtype=weighted.dtype)
+    distance_to_negative = np.empty(n_rows, dtype=weighted.dtype)
+    scratch = np.empty((min(block_size, n_rows), weighted.shape[1]), dtype=weighted.dtype)
+    for start in range(0, n_rows, block_size):
+        stop = min(start + block_size, n_rows)
+        block = scratch[:stop - start]
+        for ideal, distance in ((ideal_positive, distance_to_positive), (ideal_negative, distance_to_negative)):
+            np.subtract(weighted[start:stop], ideal, out=block)
+            np.einsum('ij,ij->i', block, block, out=distance[start:stop])
+    np.sqrt(distance_to_positive, out=distance_to_positive)
+    np.sqrt(distance_to_negative, out=distance_to_negative)
+    return distance_to_positive, distance_to_negative
+
+
+# Function to calculate relative closeness to the ideal positive solution (NaN, e.g. both distances zero, becomes 0)
+def closeness_coefficient(distance_to_positive, distance_to_negative, out=None):
+    with np.errstate(invalid='ignore', divide='ignore'):
+        closeness = np.divide(distance_to_negative, distance_to_positive + distance_to_negative, out=out)
+    return np.nan_to_num(closeness, nan=0.0, copy=False)
+
+
+# Function to rank scores from highest to lowest; ties share the smallest rank
+def rank_descending(scores):
+    order = np.argsort(-scores, kind='stable')
+    ordered = scores[order]
+    # Each run of equal scores takes the position of its first member (NaNs form one run)
+    starts = np.ones(len(ordered), dtype=bool)
+    starts[1:] = (ordered[1:] != ordered[:-1]) & ~(np.isnan(ordered[1:]) & np.isnan(ordered[:-1]))
+    ranks = np.empty(len(ordered), dtype=np.int64)
+    ranks[order] = np.maximum.accumulate(np.where(starts, np.arange(1, len(ordered) + 1), 0))
+    return ranks, order
+
+
+# Vectorized TOPSIS kernel on a plain (alternatives x criteria) array. `dtype` selects
+# float64 or float32, `overwrite_input` reuses `matrix` as the working buffer when it
+# already has that dtype, and `out` receives the closeness coefficients.
+def topsis_scores(matrix, weights, is_benefit_criteria, dtype=np.float64, overwrite_input=False, out=None):
+    matrix = np.asarray(matrix)
+    if overwrite_input and matrix.dtype == dtype and matrix.flags.writeable:
+        work = matrix
+    else:
+        work = matrix.astype(dtype)
+    weighted_matrix(work, weights, out=work)
+    ideal_positive, ideal_negative = ideal_solutions(work, is_benefit_criteria)
+    distance_to_positive, distance_to_negative = ideal_distances(work, ideal_positive, ideal_negative)
+    return closeness_coefficient(distance_to_positive, distance_to_negative, out=out)
+
+
+# Main TOPSIS function; `report(title, table)` is called with each intermediate table when given
+def topsis(alternative_data, weights, is_benefit_criteria, report=None):
+    import pandas as pd
+
+    criteria = alternative_data.columns[1:]
+    matrix = alternative_data.iloc[:, 1:].to_numpy(dtype=np.float64, copy=True)
+    weights = np.asarray(weights, dtype=np.float64)
+
+    # 1-2. Normalize the decision matrix and apply the weights
+    with stage('topsis: normalize and weight'):
+        if report is not None:
+            normalized = matrix / column_norms(matrix)
+            report('Normalized Matrix', pd.DataFrame(normalized, index=alternative_data.index, columns=criteria))
+            weighted = normalized * weights
+            report('Weighted Matrix', pd.DataFrame(weighted, index=alternative_data.index, columns=criteria))
+        else:
+            weighted = weighted_matrix(matrix, weights, out=matrix)
+
+    # 3. Determine ideal positive and negative solutions
+    with stage('topsis: ideal solutions'):
+        ideal_positive, ideal_negative = ideal_solutions(weighted, is_benefit_criteria)
+    if report is not None:
+        report('Ideal Positive and Negative Solutions', pd.DataFrame({
+            'Criterion': criteria,
+            'Ideal Positive': ideal_positive,
+            'Ideal Negative': ideal_negative
+        }))
+
+    # 4. Calculate the distance to the ideal positive and negative solutions
+    with stage('topsis: distances'):
+        distance_to_positive, distance_to_negative = ideal_distances(weighted, ideal_positive, ideal_negative)
+    if report is not None:
+        report('Distance to Ideal Positive and Negative Solutions', pd.DataFrame({
+            'Alternative': alternative_data['index'],
+            'Distance to Ideal Positive': distance_to_positive,
+            'Distance to Ideal Negative': distance_to_negative
+        }))
+
+    # 5. Calculate relative closeness and rank the alternatives
+    with stage('topsis: ranking'):
+        relative_closeness = closeness_coefficient(distance_to_positive, distance_to_negative)
+        if np.isnan(relative_closeness).any():
+            raise ValueError("Calculation resulted in NaN values. Please check input data for accuracy.")
+        ranking, _ = rank_descending(relative_closeness)
+
+        alternative_data['Closeness Coefficient'] = relative_closeness
+        alternative_data['Ranking'] = ranking
+        alternative_data['Conclusion'] = np.where(
+            ranking == 1, 'Selected alternative', np.char.add('Not selected, rank ', ranking.astype(str)))
+    return alternative_data
+
+
+# Function to run TOPSIS and collect the intermediate tables as (title, table) pairs
+def topsis_report(alternative_data, weights, is_benefit_criteria):
+    steps = []
+    result = topsis(alternative_data, weights, is_benefit_criteria, report=lambda title, table: steps.append((title, table)))
+    return result, steps
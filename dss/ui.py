@@ -0,0 +1,446 @@
+# Streamlit helpers shared by the pages. This is the only dss module that imports
+# Streamlit; the scoring modules never import it. NumPy, pandas and the scoring modules
+# are imported inside the helpers that use them, so a page only loads what it calls.
+import math
+import os
+import sqlite3
+import time
+import uuid
+
+import streamlit as st
+
+from dss.profiling import Profiler, active_profiler, to_json_lines, to_prometheus
+
+# Rows sent to the browser per table page, and chart sizes for large alternative sets
+PAGE_SIZE = 200
+CHART_BARS = 50
+CHART_POINTS = 1000
+
+# Largest problem for which the rank-reversal thresholds of every pair are offered, and
+# the cap (in percent of the weight) of open-ended bars in the tornado chart
+SENSITIVITY_PAIR_LIMIT = 500
+TORNADO_CAP = 200
+
+
+# Directory of the static page assets (stylesheets)
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets')
+
+
+# Function to read a static asset once per process; every session and rerun reuses the text
+@st.cache_resource
+def load_asset(name):
+    with open(os.path.join(ASSETS_DIR, name), encoding='utf-8') as handle:
+        return handle.read()
+
+
+# Function to apply a stylesheet from the assets directory
+def inject_css(name):
+    st.markdown(f"<style>{load_asset(name)}</style>", unsafe_allow_html=True)
+
+
+# Function to open a collapsible section whose body only runs while it is expanded:
+# `with lazy_section(...) as section: if section.open: ...`. Widgets inside it are not
+# rebuilt on reruns while it is closed (and return to their defaults when it reopens).
+def lazy_section(label, key, sidebar=False):
+    return (st.sidebar if sidebar else st).expander(label, key=key, on_change='rerun')
+
+
+# Function to get the memo shared by every page of the current session
+def session_memo():
+    from dss.memo import Memo
+
+    if 'dss_memo' not in st.session_state:
+        st.session_state['dss_memo'] = Memo()
+    return st.session_state['dss_memo']
+
+
+# Function to get the session's own eigenvector solver, so warm starts never cross sessions
+def session_solver():
+    from dss.ahp import EigenSolver
+
+    if 'dss_eigen_solver' not in st.session_state:
+        st.session_state['dss_eigen_solver'] = EigenSolver()
+    return st.session_state['dss_eigen_solver']
+
+
+# Function to get the on-disk result store shared by every session of this process;
+# None when the store directory cannot be opened, in which case nothing is persisted
+@st.cache_resource
+def result_store():
+    from dss.store import ResultStore
+
+    try:
+        return ResultStore()
+    except (OSError, sqlite3.Error):
+        return None
+
+
+# Function to show the memo and result store hit/miss counters in the sidebar
+def show_cache_stats(memo):
+    stats = memo.stats()
+    st.sidebar.caption(
+        f"Cache: {stats['hits']} hits / {stats['misses']} misses "
+        f"({stats['hit_rate']:.0%} hit rate, {stats['size']} entries, {stats['bytes'] / 2**20:.1f} MiB)")
+    store = result_store()
+    if store is not None:
+        stats = store.stats()
+        st.sidebar.caption(
+            f"Result store: {stats['hits']} hits / {stats['misses']} misses ({stats['hit_rate']:.0%} hit rate), "
+            f"{stats['entries']} results, {stats['bytes'] / 2**20:.1f} of {stats['max_bytes'] / 2**20:.0f} MiB")
+
+
+# Function to identify whose history an analysis belongs to: the signed-in user's email when
+# authentication is configured, otherwise an id kept for the browser session
+def history_owner():
+    if 'dss_history_owner' not in st.session_state:
+        email = st.user.get('email')
+        st.session_state['dss_history_owner'] = f'user:{email}' if email else f'session:{uuid.uuid4().hex}'
+    return st.session_state['dss_history_owner']
+
+
+# Function to get a page's analysis (a dict of titled tables) from the result store,
+# computing and storing it on a miss; the label names it in the user's history of past
+# analyses. The source of the page defining `compute` is part of the key, as the library's is.
+# Reruns with unchanged inputs reuse the session's last analysis without touching the store.
+def stored_analysis(method, compute, inputs, label):
+    from dss.store import source_fingerprint
+
+    store = result_store()
+    if store is None:
+        return compute()
+    inputs = (*inputs, source_fingerprint(compute.__code__.co_filename))
+    key = store.key(method, *inputs)
+    last = st.session_state.get(f'dss_stored_{method}')
+    if last is not None and last[0] == key:
+        return last[1]
+    analysis = store.fetch(method, compute, *inputs, label=label, owner=history_owner())
+    st.session_state[f'dss_stored_{method}'] = (key, analysis)
+    return analysis
+
+
+# Function to list the user's past analyses of `method` in the sidebar and render the one the
+# user reloads straight from the result store, without recomputing it
+def history_panel(method, key):
+    store = result_store()
+    if store is None:
+        return
+    entries = store.history(history_owner(), method)
+    with st.sidebar.expander("🕘 Past analyses"):
+        if not entries:
+            st.caption("No stored analyses yet.")
+            return
+        choice = st.selectbox("Analysis", range(len(entries)), key=f'{key}_choice', format_func=lambda i: (
+            f"{entries[i]['label']} · {time.strftime('%Y-%m-%d %H:%M', time.localtime(entries[i]['created']))}"))
+        if st.button("Reload", key=f'{key}_reload'):
+            st.session_state[f'{key}_selected'] = entries[choice]['key']
+    selected = st.session_state.get(f'{key}_selected')
+    if selected is None:
+        return
+    tables = store.get(selected)
+    if tables is None:
+        st.warning("The selected analysis has been evicted from the result store.")
+        del st.session_state[f'{key}_selected']
+        return
+    st.header("🕘 Saved Analysis")
+    if st.button("Close saved analysis", key=f'{key}_close'):
+        del st.session_state[f'{key}_selected']
+        st.rerun()
+    for index, (title, table) in enumerate(tables.items()):
+        show_lazy(title, table, f'{key}_table_{index}')
+
+
+# Function to collect the decision matrix from an uploaded file or a single editable grid
+# (instead of one widget per cell); returns a float64 DataFrame indexed by alternative name
+def matrix_editor(key, num_alternatives, num_criteria, alternative_prefix='Alternative', criteria_prefix='Criteria', value=0.0):
+    from dss.matrix_io import UPLOAD_TYPES, empty_matrix, load_matrix, validate_matrix
+
+    frame = None
+    source = 'grid'
+    uploaded = st.sidebar.file_uploader("Upload decision matrix", type=list(UPLOAD_TYPES), key=f'{key}_upload',
+                                        help="CSV, Parquet, Excel or .npy. A leading text column is used as the alternative names.")
+    if uploaded is not None:
+        try:
+            frame = load_matrix(uploaded, uploaded.name)
+            source = uploaded.file_id
+        except ValueError as error:
+            st.sidebar.error(str(error))
+    if frame is None:
+        frame = empty_matrix(num_alternatives, num_criteria, alternative_prefix, criteria_prefix, value)
+
+    st.subheader("Decision Matrix")
+    # Keyed on where the matrix came from and its size, so unsaved edits survive reruns and
+    # only a new upload or a new number of rows or columns starts a fresh grid
+    editor_key = f'{key}_editor_{source}_{frame.shape[0]}x{frame.shape[1]}'
+    edited = st.data_editor(frame.rename_axis(alternative_prefix).reset_index(), hide_index=True, key=editor_key)
+    # The base grid and the editor's change-set determine every column, so they identify
+    # its content for the memo without hashing the values
+    changes = st.session_state.get(editor_key) or {}
+    base = (editor_key, value, tuple(changes.get('deleted_rows', ())), len(changes.get('added_rows', ())))
+    st.session_state[f'{key}_revisions'] = tuple(
+        (*base, column, tuple(sorted((row, cells[column]) for row, cells in changes.get('edited_rows', {}).items()
+                                     if column in cells)),
+         tuple(row.get(column) for row in changes.get('added_rows', ())))
+        for column in frame.columns)
+    edited = edited.set_index(alternative_prefix).rename_axis(None)
+    try:
+        return validate_matrix(edited)
+    except ValueError as error:
+        st.error(str(error))
+        st.stop()
+
+
+# Function to get the per-column revision tokens of the matrix last collected by
+# matrix_editor(key), for normalize_matrix_cached
+def matrix_revisions(key):
+    return st.session_state.get(f'{key}_revisions')
+
+
+# Function to collect an upper-triangular pairwise comparison matrix (values are mirrored as
+# reciprocals). The inputs live in a collapsible form: they are only built while it is open and
+# only applied on submit, so other reruns reuse the stored matrix. Returns a float64 DataFrame.
+def comparison_inputs(key, names, title, label_prefix=''):
+    import numpy as np
+    import pandas as pd
+
+    n = len(names)
+    matrix = st.session_state.get(f'{key}_matrix')
+    if matrix is None or matrix.shape != (n, n):
+        matrix = np.ones((n, n))
+    with lazy_section(title, f'{key}_section') as section:
+        if section.open:
+            with st.form(f'{key}_form'):
+                st.write("Fill in the upper triangular matrix (values will be mirrored):")
+                edited = matrix.copy()
+                for i in range(n):
+                    for j in range(i + 1, n):
+                        value = st.number_input(f'{label_prefix}{names[i]} vs {names[j]}', min_value=0.1, max_value=10.0,
+                                                step=0.1, value=float(matrix[i, j]), key=f'{key}_{i}_{j}')
+                        edited[i, j] = value
+                        edited[j, i] = 1 / value
+                if st.form_submit_button("Apply comparisons"):
+                    matrix = edited
+    st.session_state[f'{key}_matrix'] = matrix
+    return pd.DataFrame(matrix, columns=names, index=names)
+
+
+# Function to collect a decision problem in the sidebar as the SAW and WP pages do: the
+# matrix, each criterion's name and benefit/cost type, and comma-separated weights.
+# Returns (decision DataFrame, criteria types array, weights array).
+def decision_inputs(key):
+    import numpy as np
+
+    from dss.memo import parse_row
+
+    st.sidebar.header("Input Data")
+    num_alternatives = st.sidebar.number_input("Number of Alternatives", min_value=2, value=3)
+    num_criteria = st.sidebar.number_input("Number of Criteria", min_value=2, value=3)
+    decision_df = matrix_editor(f"{key}_matrix", num_alternatives, num_criteria)
+    num_criteria = decision_df.shape[1]
+
+    st.sidebar.subheader("Criteria")
+    criteria_names = []
+    criteria_types = []
+    for i in range(num_criteria):
+        criteria_names.append(st.sidebar.text_input(f"Criteria {i+1} Name", decision_df.columns[i]))
+        criteria_types.append(st.sidebar.selectbox(f"Type of Criteria {i+1}", ['benefit', 'cost'], key=f"criteria_type_{i}"))
+    decision_df.columns = criteria_names
+
+    weights_input = st.sidebar.text_input("Enter the weights for each criterion (comma-separated)",
+                                          value=",".join(["1" for _ in range(num_criteria)]))
+    return decision_df, np.array(criteria_types), session_memo()(parse_row, weights_input)
+
+
+# Function to offer a table for download; only the selected format is serialized
+def download_table(frame, label, file_stem, key):
+    from dss.matrix_io import EXPORT_FORMATS, export_table
+
+    left, right = st.columns([1, 2])
+    fmt = left.selectbox(f"{label} format", list(EXPORT_FORMATS), key=f'{key}_format', label_visibility='collapsed')
+    try:
+        data = session_memo()(export_table, frame, fmt)
+    except ImportError:
+        # Parquet and Excel writers are optional dependencies (pyarrow, openpyxl)
+        right.caption(f"{fmt} export needs an optional dependency that is not installed")
+        return
+    right.download_button(f"⬇️ Download {label} ({fmt})", data, file_name=f"{file_stem}.{fmt}",
+                          mime=EXPORT_FORMATS[fmt], key=f'{key}_download')
+
+
+# Function to keep a calculation visible after later widget interactions rerun the page
+def persistent_button(label, key, sidebar=False):
+    if (st.sidebar if sidebar else st).button(label, key=key):
+        st.session_state[f'{key}_pressed'] = True
+    return st.session_state.get(f'{key}_pressed', False)
+
+
+# Function to render a table, sending only one page of rows to the browser when it is large;
+# the full table is offered as a download instead
+def show_table(frame, key, page_size=PAGE_SIZE, label="table"):
+    if len(frame) <= page_size:
+        st.write(frame)
+    else:
+        n_pages = math.ceil(len(frame) / page_size)
+        page = st.number_input(f"Page (1-{n_pages})", min_value=1, max_value=n_pages, value=1, key=f'{key}_page')
+        start = (page - 1) * page_size
+        st.caption(f"Rows {start + 1}-{min(start + page_size, len(frame))} of {len(frame)}")
+        st.write(frame.iloc[start:start + page_size])
+    download_table(frame, label, key, f'{key}_download')
+
+
+# Function to render an intermediate table only when the user asks for it; `table` may be
+# a DataFrame or a zero-argument callable that builds one
+def show_lazy(title, table, key, page_size=PAGE_SIZE):
+    st.subheader(title)
+    if st.checkbox("Show table", key=f'{key}_show'):
+        show_table(table() if callable(table) else table, key, page_size)
+
+
+# Function to chart scores sorted from best to worst: a bar per alternative for small sets,
+# otherwise the top bars plus the whole score curve downsampled to at most `max_points`
+def score_chart(scores, max_bars=CHART_BARS, max_points=CHART_POINTS):
+    import numpy as np
+    import pandas as pd
+
+    if len(scores) <= max_bars:
+        st.bar_chart(scores)
+        return
+    st.caption(f"Top {max_bars} of {len(scores)} alternatives")
+    st.bar_chart(scores.iloc[:max_bars])
+    stride = math.ceil(len(scores) / max_points)
+    curve = pd.Series(scores.to_numpy()[::stride], index=np.arange(1, len(scores) + 1, stride), name=scores.name)
+    st.caption("Score by rank (downsampled)")
+    st.line_chart(curve)
+
+
+# Function to show rank probabilities as a table of P(alternative lands at rank r)
+def show_rank_probabilities(probabilities, alternative_names):
+    import pandas as pd
+
+    table = pd.DataFrame(probabilities, index=alternative_names,
+                         columns=[f'Rank {r+1}' for r in range(probabilities.shape[1])])
+    st.write(table.round(4))
+    st.bar_chart(table['Rank 1'])
+
+
+# Function to render the Monte Carlo rank-stability section for SAW, WP or TOPSIS
+def rank_stability_panel(method, decision_matrix, criteria_types, weights, alternative_names, key):
+    with lazy_section("🎲 Rank Stability (Monte Carlo weight uncertainty)", f'{key}_section') as section:
+        if not section.open:
+            return
+        import numpy as np
+
+        from dss.montecarlo import rank_stability
+
+        sampler = st.radio("Weight sampling", ['Dirichlet around the weights', 'Uniform intervals'], key=f'{key}_sampler')
+        n_samples = st.number_input("Number of samples", min_value=100, value=100_000, step=10_000, key=f'{key}_samples')
+        seed = st.number_input("Random seed", min_value=0, value=0, step=1, key=f'{key}_seed')
+        options = {'weights': weights}
+        if sampler == 'Uniform intervals':
+            spread = st.slider("Interval half-width (fraction of each weight)", 0.0, 1.0, 0.2, key=f'{key}_spread')
+            options = {'lower': np.asarray(weights) * (1 - spread), 'upper': np.asarray(weights) * (1 + spread)}
+        else:
+            options['concentration'] = st.slider("Concentration (higher = less spread)", 1.0, 1000.0, 100.0,
+                                                 key=f'{key}_concentration')
+        if st.button("Run rank stability analysis", key=f'{key}_run'):
+            with st.spinner("Sampling weights..."):
+                probabilities = rank_stability(method, decision_matrix, criteria_types, n_samples=int(n_samples),
+                                               seed=int(seed), **options)
+            show_rank_probabilities(probabilities, alternative_names)
+
+
+# Function to render the analytic weight-sensitivity section for SAW or TOPSIS: how far each
+# weight can move alone before the best alternative changes, as a table and a tornado chart
+def weight_sensitivity_panel(method, decision_matrix, criteria_types, weights, alternative_names, criteria_names, key):
+    with lazy_section("📐 Weight Sensitivity (rank-reversal thresholds)", f'{key}_section') as section:
+        if not section.open:
+            return
+        import numpy as np
+        import pandas as pd
+
+        from dss.sensitivity import all_pairs, rank_reversal_thresholds, weight_sensitivity
+
+        try:
+            result = session_memo()(weight_sensitivity, method, decision_matrix, weights, np.asarray(criteria_types))
+        except ValueError as error:
+            st.warning(str(error))
+            return
+        weights = np.asarray(weights, dtype=np.float64)
+        names = np.append(np.asarray(alternative_names, dtype=object), 'none')
+        st.write(f"Best alternative: **{names[result.best]}**. Each row shows how far one weight can move, "
+                 "with the others fixed, before another alternative takes first place.")
+        show_table(pd.DataFrame({
+            'Criterion': criteria_names,
+            'Weight': weights,
+            'Max Decrease': result.decrease,
+            'Max Increase': result.increase,
+            'New Best on Decrease': names[result.decrease_by],
+            'New Best on Increase': names[result.increase_by],
+        }), f'{key}_table', label='sensitivity')
+        st.caption("-inf / inf: the best alternative does not change in that direction (down to a weight of 0, or "
+                   "for any increase).")
+
+        # Tornado chart in percent of each weight, most sensitive criterion on top
+        with np.errstate(divide='ignore', invalid='ignore'):
+            decrease = np.where(weights > 0, np.maximum(result.decrease / weights * 100, -100), 0.0)
+            increase = np.minimum(result.increase / weights * 100, TORNADO_CAP)
+        tornado = pd.DataFrame({'Decrease (%)': decrease, 'Increase (%)': increase}, index=criteria_names)
+        st.subheader("Tornado Chart")
+        st.bar_chart(tornado.iloc[np.argsort(increase - decrease, kind='stable')], horizontal=True, stack=True,
+                     sort=False)
+        st.caption(f"Weight change before the best alternative changes, in % of the current weight "
+                   f"(increases capped at {TORNADO_CAP}%).")
+
+        n_alternatives = len(alternative_names)
+        if n_alternatives <= SENSITIVITY_PAIR_LIMIT:
+            def pair_table():
+                first, second = all_pairs(n_alternatives)
+                thresholds = session_memo()(rank_reversal_thresholds, method, decision_matrix, weights,
+                                            np.asarray(criteria_types))
+                table = pd.DataFrame(thresholds, columns=criteria_names)
+                table.insert(0, 'Alternative B', names[second])
+                table.insert(0, 'Alternative A', names[first])
+                return table
+
+            show_lazy("Rank-Reversal Thresholds for Every Pair", pair_table, f'{key}_pairs')
+            st.caption("Weight change of each criterion at which the two alternatives swap places (blank: never).")
+        else:
+            st.caption(f"The pairwise threshold table is offered for up to {SENSITIVITY_PAIR_LIMIT} alternatives.")
+
+
+# Function to render the opt-in instrumentation toggles; returns a started Profiler or None
+def start_instrumentation(page):
+    stale = active_profiler()
+    if stale is not None:
+        # A previous run stopped early (e.g. st.stop) without closing its profiler
+        stale.stop()
+    with st.sidebar.expander("⏱️ Instrumentation"):
+        enabled = st.checkbox("Measure stage timings", key=f'{page}_instrumentation')
+        trace_memory = st.checkbox("Trace memory (tracemalloc)", key=f'{page}_trace_memory', disabled=not enabled)
+        use_cprofile = st.checkbox("Capture cProfile", key=f'{page}_cprofile', disabled=not enabled)
+    if not enabled:
+        return None
+    return Profiler(page, trace_memory=trace_memory, use_cprofile=use_cprofile).start()
+
+
+# Function to stop the profiler and show per-stage milliseconds and memory in a collapsible panel
+def performance_panel(profiler):
+    if profiler is None:
+        return
+    profiler.stop()
+    with lazy_section("⏱️ Performance", f'{profiler.name}_performance') as section:
+        if not section.open:
+            return
+        import pandas as pd
+
+        summary = pd.DataFrame(profiler.summary(), columns=['stage', 'calls', 'ms', 'peak_bytes'])
+        summary['peak KiB'] = summary.pop('peak_bytes') / 1024
+        st.dataframe(summary.round(3), hide_index=True)
+        if profiler.trace_memory and not profiler.tracing_memory:
+            st.caption("Memory was not traced: another session was tracing memory at the time.")
+        left, right = st.columns(2)
+        left.download_button("⬇️ Metrics (JSON lines)", to_json_lines(profiler.records),
+                             file_name=f"{profiler.name}_metrics.jsonl", mime='application/x-ndjson')
+        right.download_button("⬇️ Metrics (Prometheus)", to_prometheus(profiler),
+                              file_name=f"{profiler.name}_metrics.prom", mime='text/plain')
+        if profiler.use_cprofile:
+            st.code(profiler.cprofile_stats(), language='text')
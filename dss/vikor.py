@@ -0,0 +1,58 @@
+import numpy as np
+
+from dss.profiling import stage
+from dss.promethee import oriented_matrix, unit_weights
+from dss.topsis import rank_descending
+
+
+# Function to calculate every alternative's normalized regret on each criterion:
+# (best - value) / (best - worst), 0 on criteria where all alternatives are equal
+def regret_matrix(decision_matrix, criteria_types):
+    matrix = oriented_matrix(decision_matrix, criteria_types)
+    best = matrix.max(axis=-2, keepdims=True)
+    spread = best - matrix.min(axis=-2, keepdims=True)
+    regret = np.subtract(best, matrix)
+    # Where every value is equal the regret is already 0, so those columns are not divided
+    np.divide(regret, spread, out=regret, where=spread > 0)
+    return regret
+
+
+def _rescale(values):
+    low, high = values.min(), values.max()
+    return (values - low) / (high - low) if high > low else np.zeros_like(values)
+
+
+# Function to calculate VIKOR group utility S, individual regret R and compromise index Q
+# (lower is better for all three); `v` weighs group utility against individual regret
+def vikor_method(decision_matrix, weights, criteria_types, v=0.5):
+    if not 0 <= v <= 1:
+        raise ValueError("The strategy weight v must be between 0 and 1.")
+    decision_matrix = np.asarray(decision_matrix, dtype=np.float64)
+    weights = unit_weights(weights, decision_matrix.shape[1])
+    with stage('vikor: regret'):
+        weighted_regret = regret_matrix(decision_matrix, criteria_types)
+        weighted_regret *= weights
+    with stage('vikor: compromise'):
+        utility = weighted_regret.sum(axis=1)
+        regret = weighted_regret.max(axis=1)
+        compromise = v * _rescale(utility) + (1 - v) * _rescale(regret)
+    return utility, regret, compromise
+
+
+# Function to find VIKOR's compromise solution set from S, R and Q. The best alternative by
+# Q is accepted alone when it leads the runner-up by at least 1 / (n - 1) (acceptable
+# advantage) and is also best by S or R (acceptable stability); otherwise the set holds
+# every alternative within that advantage, or the top two when only stability fails.
+def compromise_solutions(utility, regret, compromise):
+    order = rank_descending(-compromise)[1]
+    if len(order) < 2:
+        return order
+    threshold = 1.0 / (len(order) - 1)
+    best = order[0]
+    advantage = compromise[order[1]] - compromise[best] >= threshold
+    stable = utility[best] == utility.min() or regret[best] == regret.min()
+    if advantage and stable:
+        return order[:1]
+    if advantage:
+        return order[:2]
+    return order[compromise[order] - compromise[best] < threshold]
@@ -0,0 +1,24 @@
+import numpy as np
+
+from dss.profiling import stage
+from dss.saw import normalize_matrix
+
+
+# Function to normalize decision matrix for WP (same benefit/cost rule as SAW)
+def normalize_matrix_wp(decision_matrix, criteria_types):
+    return normalize_matrix(decision_matrix, criteria_types)
+
+
+# Function to calculate WP scores from an already normalized matrix (or a stack of
+# matrices with one weight vector each)
+def wp_scores(normalized_matrix, weights):
+    return np.prod(normalized_matrix ** np.asarray(weights)[..., None, :], axis=-1)
+
+
+# Function to calculate WP scores
+def wp_method(decision_matrix, weights, criteria_types):
+    with stage('wp: normalize'):
+        normalized_matrix = normalize_matrix_wp(decision_matrix, criteria_types)
+    with stage('wp: weighting'):
+        final_scores = wp_scores(normalized_matrix, weights)
+    return normalized_matrix, final_scores
@@ -1,5 +1,7 @@
 import streamlit as st
 
+from dss.ui import inject_css
+
 # Set page configuration
 st.set_page_config(
     page_title="Welcome to My DSS App",
@@ -8,71 +10,8 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Custom CSS for artistic design
-st.markdown("""
-    <style>
-    /* Main page styling */
-    .main {
-        background: linear-gradient(to right, #ece9e6, #ffffff);
-        color: #333333;
-        font-family: 'Verdana', sans-serif;
-    }
-    h1 {
-        color: #2E8B57;
-        text-align: center;
-        font-family: 'Helvetica', sans-serif;
-        font-size: 3rem;
-        margin-top: 30px;
-        animation: fadeIn 2s ease-in-out;
-    }
-    h3 {
-        color: #4169E1;
-        font-size: 1.8rem;
-        text-align: center;
-        margin-bottom: 20px;
-    }
-    p {
-        text-align: center;
-        font-size: 1.2rem;
-    }
-    .content-block {
-        text-align: center;
-        margin-top: 50px;
-    }
-    .footer {
-        text-align: center;
-        margin-top: 50px;
-    }
-    /* Add subtle animation */
-    @keyframes fadeIn {
-        0% { opacity: 0; }
-        100% { opacity: 1; }
-    }
-    .btn-primary {
-        background-color: #4CAF50;
-        border: none;
-        color: white;
-        padding: 12px 24px;
-        text-align: center;
-        text-decoration: none;
-        display: inline-block;
-        font-size: 16px;
-        margin: 4px 2px;
-        transition-duration: 0.4s;
-        cursor: pointer;
-    }
-    .btn-primary:hover {
-        background-color: white;
-        color: black;
-        border: 2px solid #4CAF50;
-    }
-    hr {
-        border: 1px solid #CCCCCC;
-        width: 80%;
-        margin-top: 50px;
-    }
-    </style>
-""", unsafe_allow_html=True)
+# Custom CSS for artistic design, read once per process from assets/main.css
+inject_css('main.css')
 
 # Header Section
 st.markdown("<h1>Decision Support System 🌟</h1>", unsafe_allow_html=True)
@@ -81,24 +20,11 @@ st.markdown("<p style='text-align: center;'>Explore, Interact, and Enjoy the Exp
 # Main Content Section
 st.markdown("<div class='content-block'><h3>Welcome to the DSS Application!</h3></div>", unsafe_allow_html=True)
 st.write("""
-    Use the sidebar to navigate through different decision support system methods, including **AHP**, **WP**, and **SAW**.
+    Use the sidebar to navigate through different decision support system methods, including **AHP**, **WP**, **SAW**, **TOPSIS**,
+    **VIKOR**, **PROMETHEE II** and **ELECTRE I**, compare SAW, WP and TOPSIS side by side on the **Compare** page, combine many evaluators on the **Group AHP** page, or rank hundreds of alternatives from a subset of pairwise judgments on the **Incomplete AHP** page.
     Enhance your decision-making process with these powerful tools!
 """)
 
-
-# Sidebar styling
-st.sidebar.markdown("""
-    <style>
-    .sidebar-content {
-        font-family: 'Verdana', sans-serif;
-        color: #333333;
-        font-size: 1.1rem;
-        padding: 10px;
-        text-align: center;
-    }
-    </style>
-""", unsafe_allow_html=True)
-
 # Success message to show the app is working fine
 st.success("App Loaded Successfully!")
 
@@ -1,31 +1,19 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
-
-# Function to calculate the priority index for the criteria or alternatives
-def ahp_attributes(ahp_df):
-    sum_array = np.array(ahp_df.sum(numeric_only=True))
-    cell_by_sum = ahp_df.div(sum_array, axis=1)
-    priority_df = pd.DataFrame(cell_by_sum.mean(axis=1), columns=['priority index'])
-    return priority_df
-
-# Function to check the consistency ratio
-def consistency_ratio(priority_index, ahp_df):
-    random_matrix = {1: 0, 2: 0, 3: 0.58, 4: 0.9, 5: 1.12, 6: 1.24, 7: 1.32,
-                     8: 1.41, 9: 1.45, 10: 1.49, 11: 1.51, 12: 1.48, 13: 1.56,
-                     14: 1.57, 15: 1.59, 16: 1.605, 17: 1.61, 18: 1.615, 19: 1.62, 20: 1.625}
-
-    consistency_df = ahp_df.multiply(priority_index['priority index'].values, axis=1)
-    consistency_df['sum_of_col'] = consistency_df.sum(axis=1)
-    lambda_max_df = consistency_df['sum_of_col'].div(priority_index['priority index'])
-    lambda_max = lambda_max_df.mean()
-    consistency_index = (lambda_max - len(ahp_df.index)) / (len(ahp_df.index) - 1)
-    consistency_ratio_value = consistency_index / random_matrix[len(ahp_df.index)]
-    
+
+from dss.ahp import is_consistent
+from dss.analysis import AHP_PRIORITY_METHODS as PRIORITY_METHODS, ahp_analysis, priority_with_consistency
+from dss.profiling import stage
+from dss.ui import (comparison_inputs, history_panel, lazy_section, performance_panel, session_memo, session_solver,
+                    show_cache_stats, show_lazy, show_rank_probabilities, show_table, start_instrumentation,
+                    stored_analysis)
+
+# Function to display the consistency index and ratio
+def show_consistency(consistency_index, consistency_ratio_value):
     st.write(f'The Consistency Index is: {consistency_index:.3f}')
     st.write(f'The Consistency Ratio is: {consistency_ratio_value:.3f}')
-    
-    if consistency_ratio_value < 0.1:
+
+    if is_consistent(consistency_ratio_value):
         st.success('The model is consistent.')
     else:
         st.warning('The model is not consistent.')
@@ -34,6 +22,13 @@ def consistency_ratio(priority_index, ahp_df):
 # Streamlit app
 st.title('AHP (Analytical Hierarchy Process) Calculator')
 
+# Opt-in per-stage timing, toggled from the sidebar
+profiler = start_instrumentation('ahp')
+
+priority_method = st.selectbox('Priority method:', PRIORITY_METHODS)
+memo = session_memo()
+solver = session_solver()
+
 # User input for criteria
 st.subheader('Step 1: Define Criteria')
 num_criteria = st.number_input('Enter the number of criteria:', min_value=1, max_value=20, step=1)
@@ -43,32 +38,22 @@ for i in range(num_criteria):
     criteria_name = st.text_input(f'Enter name for Criterion {i+1}:', f'Criterion {i+1}')
     criteria_names.append(criteria_name)
 
-# Initialize the pairwise comparison matrix
-pairwise_comparison = np.ones((num_criteria, num_criteria))
-
-# Input the pairwise comparisons
+# Input the pairwise comparisons; the inputs are only built while their section is open
 st.subheader('Step 2: Pairwise Comparison Matrix for Criteria')
-st.write("Fill in the upper triangular matrix (values will be mirrored):")
-
-for i in range(num_criteria):
-    for j in range(i + 1, num_criteria):
-        value = st.number_input(f'Comparison: {criteria_names[i]} vs {criteria_names[j]}', min_value=0.1, max_value=10.0, step=0.1, value=1.0)
-        pairwise_comparison[i, j] = value
-        pairwise_comparison[j, i] = 1 / value
-
-# Convert to DataFrame for display and further processing
-ahp_df = pd.DataFrame(pairwise_comparison, columns=criteria_names, index=criteria_names)
+ahp_df = comparison_inputs('ahp_criteria', criteria_names, 'Edit criteria comparisons', 'Comparison: ')
+pairwise_comparison = ahp_df.to_numpy()
 
 # Calculate priority index and consistency ratio
-priority_index_attr = ahp_attributes(ahp_df)
+priority_index_attr, consistency_index, consistency_ratio_value = memo(priority_with_consistency, ahp_df, 'criteria', priority_method, solver)
 st.subheader('Priority Index for Criteria')
 st.write(priority_index_attr)
 
 st.subheader('Consistency Check')
-consistency_ratio(priority_index_attr, ahp_df)
+show_consistency(consistency_index, consistency_ratio_value)
 
 # Step 3: Define Alternatives
 st.subheader('Step 3: Define Alternatives')
+st.caption('For more than 20 alternatives, the Incomplete AHP page ranks them from a subset of the pairwise comparisons.')
 num_alternatives = st.number_input('Enter the number of alternatives:', min_value=1, max_value=20, step=1)
 
 alternative_names = []
@@ -77,30 +62,49 @@ for i in range(num_alternatives):
     alternative_names.append(alternative_name)
 
 # Step 4: Pairwise Comparison for Each Attribute
+attribute_dfs = {}
 attribute_priority_dfs = {}
-for criterion in criteria_names:
+for k, criterion in enumerate(criteria_names):
     st.subheader(f'Pairwise Comparison for {criterion}')
-    attribute_df = pd.DataFrame(np.ones((num_alternatives, num_alternatives)), columns=alternative_names, index=alternative_names)
-    
-    st.write(f"Fill in the upper triangular matrix for {criterion} (values will be mirrored):")
-    for i in range(num_alternatives):
-        for j in range(i + 1, num_alternatives):
-            attribute_value = st.number_input(f'{criterion}: {alternative_names[i]} vs {alternative_names[j]}', min_value=0.1, max_value=10.0, step=0.1, value=1.0)
-            attribute_df.iloc[i, j] = attribute_value
-            attribute_df.iloc[j, i] = 1 / attribute_value
-    
+    attribute_df = comparison_inputs(f'ahp_alternatives_{k}', alternative_names,
+                                     f'Edit comparisons for {criterion}', f'{criterion}: ')
+
     # Calculate priority index for each attribute
-    attribute_priority_df = ahp_attributes(attribute_df)
+    attribute_dfs[criterion] = attribute_df
+    attribute_priority_df = memo(priority_with_consistency, attribute_df, criterion, priority_method, solver)[0]
     attribute_priority_dfs[criterion] = attribute_priority_df
-    st.write(f'Priority Index for {criterion}')
-    st.write(attribute_priority_df)
+    show_lazy(f'Priority Index for {criterion}', attribute_priority_df, f'ahp_priority_{criterion}')
 
 # Step 5: Combine the results to get final scores
 st.subheader('Step 5: Final Scores for Alternatives')
 combined_df = pd.concat(attribute_priority_dfs, axis=1)
-weighted_scores = combined_df.multiply(priority_index_attr['priority index'].values, axis=1)
-weighted_scores['Final Score'] = weighted_scores.sum(axis=1)
+
+# Weight the attribute priorities, or reload the analysis from the result store when these comparisons were seen before
+analysis = stored_analysis('ahp', lambda: ahp_analysis(ahp_df, attribute_dfs, priority_method, memo, solver),
+                           (ahp_df, attribute_dfs, priority_method),
+                           f'{num_criteria} criteria × {num_alternatives} alternatives')
 
 # Display final scores
-st.write('Final Scores for Alternatives:')
-st.write(weighted_scores.sort_values(by='Final Score', ascending=False))
+with stage('page: render'):
+    st.write('Final Scores for Alternatives:')
+    show_table(analysis['Final Scores for Alternatives'], 'ahp_final_scores', label='final scores')
+
+# Rank stability under perturbed criteria comparisons
+with lazy_section('🎲 Rank Stability (perturbed pairwise comparisons)', 'ahp_stability_section') as section:
+    if section.open:
+        from dss.montecarlo import ahp_rank_stability
+
+        sigma = st.slider('Judgment noise (std. dev. of log comparison)', 0.01, 1.0, 0.1)
+        n_samples = st.number_input('Number of samples', min_value=100, value=100_000, step=10_000)
+        seed = st.number_input('Random seed', min_value=0, value=0, step=1)
+        if st.button('Run rank stability analysis'):
+            with st.spinner('Sampling comparison matrices...'):
+                probabilities = ahp_rank_stability(
+                    pairwise_comparison, combined_df.to_numpy(), sigma=sigma, n_samples=int(n_samples), seed=int(seed),
+                    priority_method='eigenvector' if priority_method == PRIORITY_METHODS[1] else 'column_average')
+            show_rank_probabilities(probabilities, list(combined_df.index))
+
+history_panel('ahp', 'ahp_history')
+
+show_cache_stats(memo)
+performance_panel(profiler)
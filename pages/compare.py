@@ -0,0 +1,78 @@
+import streamlit as st
+import pandas as pd
+
+from dss.compare import METHODS, compare_methods, rank_correlations
+from dss.profiling import stage
+from dss.ui import (decision_inputs, performance_panel, persistent_button, score_chart, session_memo, show_cache_stats,
+                    show_lazy, show_table, start_instrumentation)
+
+METHOD_LABELS = {'saw': 'SAW', 'wp': 'WP', 'topsis': 'TOPSIS'}
+
+# Streamlit UI
+st.set_page_config(page_title="Method Comparison", page_icon="⚖️", layout="centered")
+st.title("⚖️ Method Comparison: SAW vs WP vs TOPSIS")
+st.write("Enter the decision matrix once and rank the alternatives with **SAW**, **WP** and **TOPSIS** side by side, "
+         "combined into a **consensus ranking** with rank-correlation metrics between the methods.")
+
+# Opt-in per-stage timing, toggled from the sidebar
+profiler = start_instrumentation('compare')
+
+with stage('page: widgets'):
+    # Decision matrix, criteria and weights, entered in the sidebar
+    decision_df, criteria_types, weights = decision_inputs("compare")
+    candidate_names = list(decision_df.index)
+    criteria_names = list(decision_df.columns)
+    num_criteria = len(criteria_names)
+
+    # Consensus rule
+    consensus = st.sidebar.radio("Consensus ranking", ['borda', 'copeland'],
+                                 format_func=lambda rule: {'borda': 'Borda count', 'copeland': 'Copeland (pairwise majority)'}[rule])
+
+memo = session_memo()
+decision_matrix = decision_df.to_numpy()
+
+st.header("Comparison Results")
+
+if persistent_button("⚖️ Compare Methods", "compare_run"):
+    scores, ranks, points, consensus_ranks = memo(compare_methods, decision_matrix, weights, criteria_types,
+                                                  METHODS, consensus)
+
+    with stage('page: render'):
+        result_df = pd.DataFrame({'Alternative': candidate_names})
+        for method, method_ranks in zip(scores, ranks):
+            result_df[f'{METHOD_LABELS[method]} Score'] = scores[method]
+            result_df[f'{METHOD_LABELS[method]} Rank'] = method_ranks
+        points_label = 'Borda Points' if consensus == 'borda' else 'Copeland Score'
+        result_df[points_label] = points
+        result_df['Consensus Rank'] = consensus_ranks
+        result_df = result_df.sort_values(by='Consensus Rank', kind='stable').reset_index(drop=True)
+
+        st.subheader("Scores, Ranks and Consensus")
+        show_table(result_df, "compare_results", label="comparison")
+
+        st.subheader(f"Consensus Ranking ({points_label})")
+        score_chart(result_df[points_label].set_axis(result_df['Alternative']))
+
+        # Rank correlations are O(n log n) per pair of methods, so they render on demand
+        labels = [METHOD_LABELS[method] for method in scores]
+
+        def correlation_table(index):
+            return pd.DataFrame(memo(rank_correlations, scores)[index], index=labels, columns=labels)
+
+        show_lazy("Kendall τ between methods", lambda: correlation_table(0), "compare_kendall")
+        show_lazy("Spearman ρ between methods", lambda: correlation_table(1), "compare_spearman")
+
+        best = result_df.iloc[0]
+        st.subheader(f"🏆 Consensus Best Alternative: **{best['Alternative']}**")
+        agreeing = [label for label in labels if best[f'{label} Rank'] == 1]
+        st.write(f"Ranked first by: {', '.join(agreeing) if agreeing else 'none of the individual methods'}.")
+
+else:
+    st.info("Please enter the decision matrix, weights, and criteria types, then click **Compare Methods** to see the results.")
+
+show_cache_stats(memo)
+performance_panel(profiler)
+
+# Footer
+st.markdown("<hr>", unsafe_allow_html=True)
+st.markdown("Created with ❤️ using Streamlit.", unsafe_allow_html=True)
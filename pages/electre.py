@@ -0,0 +1,110 @@
+import streamlit as st
+import pandas as pd
+
+from dss.electre import electre_matrices, electre_method
+from dss.profiling import stage
+from dss.topsis import rank_descending
+from dss.ui import (decision_inputs, history_panel, performance_panel, persistent_button, score_chart, session_memo,
+                    show_cache_stats, show_lazy, show_table, start_instrumentation, stored_analysis)
+
+# Largest problem whose full concordance and discordance matrices are offered for display
+MATRIX_DISPLAY_LIMIT = 500
+
+# Streamlit UI
+st.set_page_config(page_title="ELECTRE I Calculator", page_icon="⚡", layout="centered")
+st.title("⚡ ELECTRE I Outranking Calculator")
+st.write("This tool applies **ELECTRE I**: an alternative outranks another when enough of the weight agrees "
+         "(**concordance**) and no criterion objects too strongly (**discordance**). Alternatives are ranked by "
+         "how many others they outrank minus how many outrank them.")
+
+# Opt-in per-stage timing, toggled from the sidebar
+profiler = start_instrumentation('electre')
+
+with stage('page: widgets'):
+    # Decision matrix, criteria and weights, entered as on the SAW page
+    decision_df, criteria_types, weights = decision_inputs("electre")
+    candidate_names = list(decision_df.index)
+    num_criteria = decision_df.shape[1]
+
+    st.sidebar.subheader("Thresholds")
+    mean_thresholds = st.sidebar.checkbox("Use the mean concordance and discordance", value=True)
+    concordance_threshold = st.sidebar.slider("Concordance threshold", 0.0, 1.0, 0.6, disabled=mean_thresholds)
+    discordance_threshold = st.sidebar.slider("Discordance threshold", 0.0, 1.0, 0.4, disabled=mean_thresholds)
+    if mean_thresholds:
+        concordance_threshold = discordance_threshold = None
+
+memo = session_memo()
+decision_matrix = decision_df.to_numpy()
+
+# Main content area
+st.header("ELECTRE I Calculation Results")
+
+if persistent_button("🔍 Calculate ELECTRE I", "electre_calculate"):
+    # Display the initial decision matrix
+    show_lazy("Step 1: Initial Decision Matrix", decision_df, "electre_decision")
+
+    # Perform ELECTRE I calculation, or reload it from the result store when these inputs were seen before
+    def calculate_electre():
+        outranks, outranked, net = memo(electre_method, decision_matrix, weights, criteria_types,
+                                        concordance_threshold, discordance_threshold)
+        with stage('electre: rank'):
+            result_df = pd.DataFrame({
+                'Alternative': candidate_names,
+                'Outranks': outranks,
+                'Outranked By': outranked,
+                'Net Outranking': net,
+                'Rank': rank_descending(net)[0],
+            })
+            result_df = result_df.sort_values(by='Rank', kind='stable').reset_index(drop=True)
+        return {'Initial Decision Matrix': decision_df, 'Outranking Counts and Rankings': result_df}
+
+    inputs = (decision_df, weights, criteria_types, concordance_threshold, discordance_threshold)
+    try:
+        analysis = stored_analysis('electre', calculate_electre, inputs,
+                                   f"{len(decision_df):,} alternatives × {num_criteria} criteria")
+    except ValueError as error:
+        st.error(str(error))
+        st.stop()
+    result_df = analysis['Outranking Counts and Rankings']
+
+    with stage('page: render'):
+        # The pairwise matrices are n x n, so they are only built on demand for small problems
+        if len(decision_df) <= MATRIX_DISPLAY_LIMIT:
+            show_lazy("Step 2: Concordance Matrix",
+                      lambda: pd.DataFrame(memo(electre_matrices, decision_matrix, weights, criteria_types)[0],
+                                           index=candidate_names, columns=candidate_names), "electre_concordance")
+            show_lazy("Step 3: Discordance Matrix",
+                      lambda: pd.DataFrame(memo(electre_matrices, decision_matrix, weights, criteria_types)[1],
+                                           index=candidate_names, columns=candidate_names), "electre_discordance")
+        else:
+            st.caption(f"The concordance and discordance matrices are shown for up to {MATRIX_DISPLAY_LIMIT} alternatives.")
+
+        # Display the outranking counts and ranking
+        st.subheader("Step 4: Outranking Counts and Rankings")
+        show_table(result_df, "electre_results", label="results")
+
+        # Plotting the net outranking
+        st.subheader("Graphical Representation of Net Outranking")
+        score_chart(result_df['Net Outranking'].set_axis(result_df['Alternative']))
+
+        # Alternatives that nothing outranks
+        unbeaten = list(result_df.loc[result_df['Outranked By'] == 0, 'Alternative'])
+        if unbeaten:
+            st.subheader(f"🏆 Not Outranked: **{', '.join(unbeaten[:10])}**"
+                         + (f" and {len(unbeaten) - 10:,} more" if len(unbeaten) > 10 else ""))
+            st.write("No other alternative outranks these at the chosen thresholds.")
+        else:
+            st.subheader(f"🏆 Best Net Outranking: **{result_df.iloc[0]['Alternative']}**")
+
+else:
+    st.info("Please enter the decision matrix, weights, and criteria types, then click **Calculate ELECTRE I** to see "
+            "the results.")
+
+history_panel('electre', 'electre_history')
+
+show_cache_stats(memo)
+performance_panel(profiler)
+
+# Footer
+st.markdown("<hr>", unsafe_allow_html=True)
+st.markdown("Created with ❤️ using Streamlit.", unsafe_allow_html=True)
@@ -0,0 +1,100 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+
+from dss.ahp import CONSISTENCY_THRESHOLD, is_consistent
+from dss.group_ahp import group_ahp, simulate_evaluators
+from dss.matrix_io import load_comparison_stack
+from dss.profiling import stage
+from dss.ui import performance_panel, score_chart, session_memo, show_cache_stats, show_table, start_instrumentation
+
+AGGREGATION_LABELS = {
+    'aij': 'Aggregate individual judgments (geometric mean of matrices)',
+    'aip': 'Aggregate individual priorities (geometric mean of priority vectors)',
+}
+
+# Streamlit UI
+st.set_page_config(page_title="Group AHP", page_icon="👥", layout="centered")
+st.title("👥 Group AHP: Aggregating Many Evaluators")
+st.write("Load the pairwise comparison matrices of every evaluator as one `(evaluators, n, n)` NumPy stack, "
+         "check each evaluator's consistency and combine the judgments into **group priorities**.")
+
+# Opt-in per-stage timing, toggled from the sidebar
+profiler = start_instrumentation('group_ahp')
+memo = session_memo()
+
+with stage('page: widgets'):
+    st.sidebar.header("Comparison Matrices")
+    source = st.sidebar.radio("Source", ['Upload .npy stack', 'Simulated panel'])
+    stack = None
+    if source == 'Upload .npy stack':
+        uploaded = st.sidebar.file_uploader("Comparison stack (.npy)", type=['npy'],
+                                            help="Array of shape (evaluators, n, n) with positive reciprocal judgments.")
+        if uploaded is not None:
+            try:
+                stack = load_comparison_stack(uploaded)
+            except ValueError as error:
+                st.sidebar.error(str(error))
+    else:
+        n_evaluators = st.sidebar.number_input("Number of evaluators", min_value=1, value=200, step=100)
+        n_criteria = st.sidebar.number_input("Number of criteria", min_value=2, max_value=50, value=5)
+        sigma = st.sidebar.slider("Judgment noise (std. dev. of log comparison)", 0.0, 1.0, 0.3)
+        seed = st.sidebar.number_input("Random seed", min_value=0, value=0, step=1)
+        stack = memo(simulate_evaluators, int(n_evaluators), int(n_criteria), sigma, int(seed))
+
+    st.sidebar.header("Aggregation")
+    method = st.sidebar.radio("Method", list(AGGREGATION_LABELS), format_func=AGGREGATION_LABELS.get)
+    exclude_inconsistent = st.sidebar.checkbox("Exclude inconsistent evaluators")
+    threshold = st.sidebar.number_input("Consistency ratio threshold", min_value=0.0, value=CONSISTENCY_THRESHOLD,
+                                        step=0.01, disabled=not exclude_inconsistent)
+
+if stack is None:
+    st.info("Upload a comparison stack or switch to a simulated panel in the sidebar.")
+    st.stop()
+
+n_criteria = stack.shape[1]
+names_input = st.text_input("Criteria names (comma-separated)",
+                            ", ".join(f"Criterion {i+1}" for i in range(n_criteria)))
+criteria_names = [name.strip() for name in names_input.split(',')]
+if len(criteria_names) != n_criteria:
+    st.warning(f"Expected {n_criteria} names; using default names instead.")
+    criteria_names = [f"Criterion {i+1}" for i in range(n_criteria)]
+
+try:
+    result = memo(group_ahp, stack, method, None, exclude_inconsistent, threshold)
+except ValueError as error:
+    st.error(str(error))
+    st.stop()
+
+with stage('page: render'):
+    left, middle, right = st.columns(3)
+    left.metric("Evaluators", f"{len(result.included):,}")
+    middle.metric("Included", f"{int(result.included.sum()):,}")
+    consistent_share = np.mean(is_consistent(result.consistency_ratios))
+    right.metric(f"Consistent (CR < {CONSISTENCY_THRESHOLD})", f"{consistent_share:.0%}")
+
+    st.subheader("Group Priorities")
+    priority_df = pd.DataFrame({'Criterion': criteria_names, 'Priority': result.priorities})
+    priority_df['Rank'] = priority_df['Priority'].rank(ascending=False, method='min').astype(int)
+    show_table(priority_df.sort_values('Rank'), 'group_ahp_priorities', label='group priorities')
+    score_chart(priority_df.set_index('Criterion')['Priority'])
+    if result.group_consistency_ratio is not None:
+        st.write(f"Consistency ratio of the aggregated matrix: {result.group_consistency_ratio:.3f}")
+
+    st.subheader("Evaluator Consistency")
+    counts, edges = np.histogram(result.consistency_ratios, bins=20)
+    st.bar_chart(pd.Series(counts, index=[f"{edge:.3f}" for edge in edges[:-1]], name='Evaluators'))
+    evaluator_df = pd.DataFrame({
+        'Evaluator': np.arange(1, len(result.included) + 1),
+        'Consistency Ratio': result.consistency_ratios,
+        'Consistent': is_consistent(result.consistency_ratios),
+        'Included': result.included,
+    })
+    show_table(evaluator_df, 'group_ahp_evaluators', label='evaluators')
+
+show_cache_stats(memo)
+performance_panel(profiler)
+
+# Footer
+st.markdown("<hr>", unsafe_allow_html=True)
+st.markdown("Created with ❤️ using Streamlit.", unsafe_allow_html=True)
@@ -0,0 +1,176 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+
+from dss.matrix_io import JUDGMENT_TYPES, load_judgments
+from dss.memo import parse_row
+from dss.profiling import stage
+from dss.sparse_ahp import gci_threshold, incomplete_priorities, simulate_judgments, suggest_comparisons
+from dss.ui import (history_panel, performance_panel, persistent_button, score_chart, session_memo, show_cache_stats,
+                    show_lazy, show_table, start_instrumentation, stored_analysis)
+
+SOLVER_LABELS = {
+    'cg': 'Conjugate gradient (NumPy)',
+    'scipy': 'Sparse direct solve (scipy.sparse)',
+}
+
+# Judgments with the largest log-residuals listed per criterion
+REVISIT_LIMIT = 20
+
+
+# Function to simulate a judgment table for several criteria over the same items
+def simulated_judgment_table(n_items, n_criteria, extra, sigma, seed):
+    tables = []
+    for k in range(n_criteria):
+        first, second, values, _ = simulate_judgments(n_items, extra, sigma, seed + k)
+        tables.append(pd.DataFrame({'criterion': f'Criterion {k+1}', 'first': first, 'second': second,
+                                    'judgment': values}))
+    table = pd.concat(tables, ignore_index=True)
+    names = np.array([f'Alternative {i+1}' for i in range(n_items)])
+    table['first'], table['second'] = names[table['first']], names[table['second']]
+    return table
+
+
+# Streamlit UI
+st.set_page_config(page_title="Incomplete AHP", page_icon="🕸️", layout="centered")
+st.title("🕸️ AHP with Incomplete Pairwise Comparisons")
+st.write("For hundreds of alternatives, asking all n(n-1)/2 comparisons is impractical. This tool derives AHP "
+         "priorities from **any connected subset of judgments** by logarithmic least squares on the comparison "
+         "graph, checks consistency on the pairs that were asked, and **suggests which comparisons to ask next**.")
+
+# Opt-in per-stage timing, toggled from the sidebar
+profiler = start_instrumentation('incomplete_ahp')
+memo = session_memo()
+
+with stage('page: widgets'):
+    st.sidebar.header("Judgments")
+    source = st.sidebar.radio("Source", ['Upload judgments', 'Simulated judgments'])
+    judgments = None
+    if source == 'Upload judgments':
+        uploaded = st.sidebar.file_uploader("Judgment table", type=list(JUDGMENT_TYPES),
+                                            help="One row per comparison with columns first, second and judgment "
+                                                 "(how many times more important first is than second), plus an "
+                                                 "optional criterion column.")
+        if uploaded is not None:
+            try:
+                judgments = load_judgments(uploaded, uploaded.name)
+            except ValueError as error:
+                st.sidebar.error(str(error))
+    else:
+        n_items = st.sidebar.number_input("Number of alternatives", min_value=3, value=300, step=50)
+        n_criteria = st.sidebar.number_input("Number of criteria", min_value=1, max_value=20, value=3)
+        extra = st.sidebar.number_input("Extra comparisons per alternative (beyond a spanning tree)", min_value=0.0,
+                                        value=2.0, step=0.5)
+        sigma = st.sidebar.slider("Judgment noise (std. dev. of log comparison)", 0.0, 1.0, 0.2)
+        seed = st.sidebar.number_input("Random seed", min_value=0, value=0, step=1)
+        judgments = memo(simulated_judgment_table, int(n_items), int(n_criteria), extra, sigma, int(seed))
+
+    st.sidebar.header("Solver")
+    solver = st.sidebar.radio("Least-squares solver", list(SOLVER_LABELS), format_func=SOLVER_LABELS.get)
+    n_suggestions = st.sidebar.number_input("Comparisons to suggest per criterion", min_value=1, value=10)
+
+if judgments is None:
+    st.info("Upload a judgment table or switch to simulated judgments in the sidebar.")
+    st.stop()
+
+items = pd.unique(pd.concat([judgments['first'], judgments['second']], ignore_index=True))
+criteria_names = list(pd.unique(judgments['criterion']))
+st.write(f"**{len(judgments):,}** judgments over **{len(items):,}** alternatives and **{len(criteria_names)}** "
+         f"criteria ({len(judgments) / len(criteria_names) / (len(items) * (len(items) - 1) / 2):.1%} of all pairs).")
+
+weights_input = st.text_input("Criteria weights (comma-separated, in the order "
+                              f"{', '.join(criteria_names[:10])}{', ...' if len(criteria_names) > 10 else ''})",
+                              value=",".join("1" for _ in criteria_names))
+weights = memo(parse_row, weights_input)
+if len(weights) != len(criteria_names) or (weights < 0).any() or weights.sum() <= 0:
+    st.error(f"Enter {len(criteria_names)} non-negative weights with a positive sum.")
+    st.stop()
+
+st.header("Incomplete AHP Results")
+
+if persistent_button("🔍 Calculate Priorities", "incomplete_ahp_calculate"):
+    index = pd.Index(items)
+
+    # Solve each criterion's comparison graph, or reload the analysis from the result store
+    def incomplete_ahp_analysis():
+        priorities, consistency_rows, revisit_tables, suggestion_tables = {}, [], [], []
+        for criterion, group in judgments.groupby('criterion', sort=False):
+            first, second = index.get_indexer(group['first']), index.get_indexer(group['second'])
+            values = group['judgment'].to_numpy()
+            result = memo(incomplete_priorities, len(items), first, second, values, solver)
+            priorities[criterion] = result.priorities
+            consistency_rows.append({'Criterion': criterion, 'Judgments': len(group),
+                                     'Geometric Consistency Index': result.consistency_index,
+                                     'Threshold': gci_threshold(len(items)),
+                                     'Consistent': result.consistency_index <= gci_threshold(len(items)),
+                                     'Solver Iterations': result.iterations})
+            worst = np.argsort(-np.abs(result.residuals), kind='stable')[:REVISIT_LIMIT]
+            revisit_tables.append(pd.DataFrame({
+                'Criterion': criterion,
+                'First': group['first'].to_numpy()[worst],
+                'Second': group['second'].to_numpy()[worst],
+                'Judgment': values[worst],
+                'Fitted Ratio': values[worst] / np.exp(result.residuals[worst]),
+                'Log Residual': result.residuals[worst],
+            }))
+            asked_first, asked_second, resistance = memo(suggest_comparisons, len(items), first, second,
+                                                         int(n_suggestions))
+            suggestion_tables.append(pd.DataFrame({
+                'Criterion': criterion,
+                'First': items[asked_first],
+                'Second': items[asked_second],
+                'Expected Judgment': result.priorities[asked_first] / result.priorities[asked_second],
+                'Effective Resistance': resistance,
+            }))
+        with stage('incomplete ahp: final scores'):
+            priority_df = pd.DataFrame(priorities, index=index)
+            priority_df['Final Score'] = priority_df[criteria_names].to_numpy() @ (weights / weights.sum())
+            priority_df['Rank'] = priority_df['Final Score'].rank(ascending=False, method='min').astype(int)
+        return {'Priorities and Final Scores': priority_df.sort_values('Rank', kind='stable'),
+                'Consistency on Observed Pairs': pd.DataFrame(consistency_rows),
+                'Judgments to Revisit': pd.concat(revisit_tables, ignore_index=True),
+                'Comparisons to Ask Next': pd.concat(suggestion_tables, ignore_index=True)}
+
+    try:
+        analysis = stored_analysis('incomplete_ahp', incomplete_ahp_analysis, (judgments, weights, solver, n_suggestions),
+                                   f"{len(items):,} alternatives × {len(criteria_names)} criteria, "
+                                   f"{len(judgments):,} judgments")
+    except (ValueError, ImportError) as error:
+        st.error(str(error))
+        st.stop()
+    priority_df = analysis['Priorities and Final Scores']
+
+    with stage('page: render'):
+        show_lazy("Step 1: Judgments", judgments, "incomplete_ahp_judgments")
+
+        st.subheader("Step 2: Consistency on Observed Pairs")
+        st.write("Geometric consistency index: the mean squared log-residual of the judgments, over the "
+                 "comparisons beyond a spanning tree (which could not contradict each other).")
+        show_table(analysis['Consistency on Observed Pairs'], "incomplete_ahp_consistency", label="consistency")
+        show_lazy("Judgments to Revisit (largest residuals)", analysis['Judgments to Revisit'],
+                  "incomplete_ahp_revisit")
+
+        st.subheader("Step 3: Priorities and Final Scores")
+        show_table(priority_df, "incomplete_ahp_scores", label="final scores")
+        score_chart(priority_df['Final Score'])
+        st.subheader(f"🏆 Best Alternative: **{priority_df.index[0]}**")
+
+        st.subheader("Step 4: Comparisons to Ask Next")
+        st.write("The missing pairs whose ratio the current judgments pin down least (largest effective "
+                 "resistance in the comparison graph). These suggestions maximize the information gained and "
+                 "depend only on which pairs were asked, not on how consistent the answers were: to check an "
+                 "inconsistent judgment, revisit the largest residuals in Step 2. The expected judgment is what a "
+                 "consistent answer would be.")
+        show_table(analysis['Comparisons to Ask Next'], "incomplete_ahp_suggestions", label="suggestions")
+
+else:
+    st.info("Check the judgments and criteria weights, then click **Calculate Priorities** to see the results.")
+
+history_panel('incomplete_ahp', 'incomplete_ahp_history')
+
+show_cache_stats(memo)
+performance_panel(profiler)
+
+# Footer
+st.markdown("<hr>", unsafe_allow_html=True)
+st.markdown("Created with ❤️ using Streamlit.", unsafe_allow_html=True)
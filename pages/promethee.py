@@ -0,0 +1,113 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+
+from dss.profiling import stage
+from dss.promethee import PREFERENCE_FUNCTIONS, promethee_flows
+from dss.topsis import rank_descending
+from dss.ui import (decision_inputs, history_panel, performance_panel, persistent_button, score_chart, session_memo,
+                    show_cache_stats, show_lazy, show_table, start_instrumentation, stored_analysis)
+
+FUNCTION_LABELS = {
+    'usual': 'Usual (any advantage is a full preference)',
+    'linear': 'Linear with indifference threshold q and preference threshold p',
+    'gaussian': 'Gaussian with inflection point s',
+}
+
+# Streamlit UI
+st.set_page_config(page_title="PROMETHEE II Calculator", page_icon="🔀", layout="centered")
+st.title("🔀 PROMETHEE II Outranking Calculator")
+st.write("This tool ranks alternatives with **PROMETHEE II**: every pair of alternatives is compared on each criterion "
+         "through a **preference function**, and alternatives are ranked by their **net outranking flow**.")
+
+# Opt-in per-stage timing, toggled from the sidebar
+profiler = start_instrumentation('promethee')
+
+with stage('page: widgets'):
+    # Decision matrix, criteria and weights, entered as on the SAW page
+    decision_df, criteria_types, weights = decision_inputs("promethee")
+    candidate_names = list(decision_df.index)
+    criteria_names = list(decision_df.columns)
+    num_criteria = len(criteria_names)
+
+    # Preference function of every criterion, with thresholds in the criterion's own units
+    st.sidebar.subheader("Preference Functions")
+    functions, q, p, s = [], np.zeros(num_criteria), np.zeros(num_criteria), decision_df.to_numpy().std(axis=0)
+    for i, name in enumerate(criteria_names):
+        functions.append(st.sidebar.selectbox(f"{name} preference", PREFERENCE_FUNCTIONS, key=f"promethee_function_{i}",
+                                              format_func=FUNCTION_LABELS.get))
+        if functions[i] == 'linear':
+            q[i] = st.sidebar.number_input(f"{name}: indifference threshold q", min_value=0.0, value=0.0,
+                                           key=f"promethee_q_{i}")
+            p[i] = st.sidebar.number_input(f"{name}: preference threshold p", min_value=q[i], value=q[i],
+                                           key=f"promethee_p_{i}")
+        elif functions[i] == 'gaussian':
+            s[i] = st.sidebar.number_input(f"{name}: inflection point s", min_value=0.0, value=float(s[i]) or 1.0,
+                                           key=f"promethee_s_{i}")
+
+memo = session_memo()
+decision_matrix = decision_df.to_numpy()
+
+# Main content area
+st.header("PROMETHEE II Calculation Results")
+st.caption("Usual and linear criteria are summed exactly from sorted columns in O(n log n); Gaussian criteria "
+           "compare every pair in blocks spread over threads, without materializing the pairwise tensor.")
+
+if persistent_button("🔍 Calculate PROMETHEE II", "promethee_calculate"):
+    # Display the initial decision matrix
+    show_lazy("Step 1: Initial Decision Matrix", decision_df, "promethee_decision")
+
+    # Perform PROMETHEE II calculation, or reload it from the result store when these inputs were seen before
+    def calculate_promethee():
+        positive, negative, net = memo(promethee_flows, decision_matrix, weights, criteria_types, functions, q, p, s)
+        with stage('promethee: rank'):
+            result_df = pd.DataFrame({
+                'Alternative': candidate_names,
+                'Positive Flow (φ+)': positive,
+                'Negative Flow (φ-)': negative,
+                'Net Flow (φ)': net,
+                'Rank': rank_descending(net)[0],
+            })
+            result_df = result_df.sort_values(by='Rank', kind='stable').reset_index(drop=True)
+        return {'Initial Decision Matrix': decision_df,
+                'Preference Functions': pd.DataFrame({'Function': functions, 'q': q, 'p': p, 's': s}, index=criteria_names),
+                'Outranking Flows and Rankings': result_df}
+
+    inputs = (decision_df, weights, criteria_types, functions, q, p, s)
+    try:
+        analysis = stored_analysis('promethee', calculate_promethee, inputs,
+                                   f"{len(decision_df):,} alternatives × {num_criteria} criteria")
+    except ValueError as error:
+        st.error(str(error))
+        st.stop()
+    result_df = analysis['Outranking Flows and Rankings']
+
+    with stage('page: render'):
+        # Display the preference function settings
+        show_lazy("Step 2: Preference Functions", analysis['Preference Functions'], "promethee_functions")
+
+        # Display the flows and ranking
+        st.subheader("Step 3: Outranking Flows and Rankings")
+        show_table(result_df, "promethee_results", label="results")
+
+        # Plotting the net flows
+        st.subheader("Graphical Representation of Net Flows")
+        score_chart(result_df['Net Flow (φ)'].set_axis(result_df['Alternative']))
+
+        # Highlight the best alternative
+        best_alternative = result_df.iloc[0]['Alternative']
+        st.subheader(f"🏆 Best Alternative: **{best_alternative}**")
+        st.write("The alternative with the highest net outranking flow is preferred.")
+
+else:
+    st.info("Please enter the decision matrix, weights, and criteria types, then click **Calculate PROMETHEE II** to see "
+            "the results.")
+
+history_panel('promethee', 'promethee_history')
+
+show_cache_stats(memo)
+performance_panel(profiler)
+
+# Footer
+st.markdown("<hr>", unsafe_allow_html=True)
+st.markdown("Created with ❤️ using Streamlit.", unsafe_allow_html=True)
@@ -0,0 +1,100 @@
+import streamlit as st
+import pandas as pd
+
+from dss.profiling import stage
+from dss.topsis import rank_descending
+from dss.ui import (decision_inputs, history_panel, performance_panel, persistent_button, score_chart, session_memo,
+                    show_cache_stats, show_lazy, show_table, start_instrumentation, stored_analysis)
+from dss.vikor import compromise_solutions, regret_matrix, vikor_method
+
+# Streamlit UI
+st.set_page_config(page_title="VIKOR Calculator", page_icon="🧭", layout="centered")
+st.title("🧭 VIKOR Compromise Ranking Calculator")
+st.write("This tool ranks alternatives with **VIKOR**, which balances the **group utility** of the majority against "
+         "the **individual regret** of the worst criterion and proposes a **compromise solution**.")
+
+# Opt-in per-stage timing, toggled from the sidebar
+profiler = start_instrumentation('vikor')
+
+with stage('page: widgets'):
+    # Decision matrix, criteria and weights, entered as on the SAW page
+    decision_df, criteria_types, weights = decision_inputs("vikor")
+    candidate_names = list(decision_df.index)
+    criteria_names = list(decision_df.columns)
+    num_criteria = len(criteria_names)
+
+    st.sidebar.subheader("Strategy")
+    v = st.sidebar.slider("Weight of group utility (v)", 0.0, 1.0, 0.5,
+                          help="1 follows the majority of criteria, 0 minimizes the worst regret; 0.5 is a consensus.")
+
+memo = session_memo()
+decision_matrix = decision_df.to_numpy()
+
+# Main content area
+st.header("VIKOR Calculation Results")
+
+if persistent_button("🔍 Calculate VIKOR", "vikor_calculate"):
+    # Display the initial decision matrix
+    show_lazy("Step 1: Initial Decision Matrix", decision_df, "vikor_decision")
+
+    # Perform VIKOR calculation, or reload it from the result store when these inputs were seen before
+    def calculate_vikor():
+        utility, regret, compromise = memo(vikor_method, decision_matrix, weights, criteria_types, v)
+        with stage('vikor: rank'):
+            result_df = pd.DataFrame({
+                'Alternative': candidate_names,
+                'Group Utility (S)': utility,
+                'Individual Regret (R)': regret,
+                'Compromise Index (Q)': compromise,
+                'Rank': rank_descending(-compromise)[0],
+            })
+            result_df = result_df.sort_values(by='Rank', kind='stable').reset_index(drop=True)
+            solutions = compromise_solutions(utility, regret, compromise)
+        return {'Initial Decision Matrix': decision_df,
+                'Normalized Regret Matrix': pd.DataFrame(regret_matrix(decision_matrix, criteria_types),
+                                                         columns=criteria_names, index=candidate_names),
+                'Scores and Rankings': result_df,
+                'Compromise Solutions': pd.DataFrame({'Alternative': [candidate_names[i] for i in solutions]})}
+
+    try:
+        analysis = stored_analysis('vikor', calculate_vikor, (decision_df, weights, criteria_types, v),
+                                   f"{len(decision_df):,} alternatives × {num_criteria} criteria, v = {v:.2f}")
+    except ValueError as error:
+        st.error(str(error))
+        st.stop()
+    result_df = analysis['Scores and Rankings']
+
+    with stage('page: render'):
+        # Display the normalized regret of every alternative on every criterion
+        show_lazy("Step 2: Normalized Regret Matrix", analysis['Normalized Regret Matrix'], "vikor_regret")
+
+        # Display S, R, Q and the ranking (lower Q is better)
+        st.subheader("Step 3: Scores and Rankings")
+        show_table(result_df, "vikor_results", label="results")
+
+        # Plotting the compromise index
+        st.subheader("Compromise Index by Rank (lower is better)")
+        score_chart(result_df['Compromise Index (Q)'].set_axis(result_df['Alternative']))
+
+        # Highlight the compromise solution
+        solutions = list(analysis['Compromise Solutions']['Alternative'])
+        if len(solutions) == 1:
+            st.subheader(f"🏆 Compromise Solution: **{solutions[0]}**")
+            st.write("It leads by an acceptable advantage and is also best by group utility or individual regret.")
+        else:
+            st.subheader(f"🏆 Compromise Solutions: **{', '.join(solutions[:10])}**"
+                         + (f" and {len(solutions) - 10:,} more" if len(solutions) > 10 else ""))
+            st.write("No single alternative meets both the acceptable advantage and stability conditions, "
+                     "so these alternatives are equally good compromises.")
+
+else:
+    st.info("Please enter the decision matrix, weights, and criteria types, then click **Calculate VIKOR** to see the results.")
+
+history_panel('vikor', 'vikor_history')
+
+show_cache_stats(memo)
+performance_panel(profiler)
+
+# Footer
+st.markdown("<hr>", unsafe_allow_html=True)
+st.markdown("Created with ❤️ using Streamlit.", unsafe_allow_html=True)
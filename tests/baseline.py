@@ -0,0 +1,151 @@
+# Frozen copies of the formulas of the original SAW, WP, TOPSIS and AHP pages (pages/*.py
+# of the baseline commit), with the Streamlit output taken out. They are the oracles the
+# dss package is tested against, so they must not follow later changes to dss: edit them
+# only if the intended page math changes.
+import numpy as np
+import pandas as pd
+
+
+# pages/saw.py
+
+# Function to normalize decision matrix for SAW
+def normalize_matrix(decision_matrix, criteria_types):
+    normalized_matrix = np.copy(decision_matrix)
+    for i in range(decision_matrix.shape[1]):
+        if criteria_types[i] == 'benefit':
+            normalized_matrix[:, i] = decision_matrix[:, i] / decision_matrix[:, i].max()
+        elif criteria_types[i] == 'cost':
+            normalized_matrix[:, i] = decision_matrix[:, i].min() / decision_matrix[:, i]
+    return normalized_matrix
+
+
+# Function to calculate SAW scores
+def saw_method(decision_matrix, weights, criteria_types):
+    normalized_matrix = normalize_matrix(decision_matrix, criteria_types)
+    final_scores = np.dot(normalized_matrix, weights)
+    return normalized_matrix, final_scores
+
+
+# Function to build the final scores table of the SAW and WP pages
+def score_table(candidate_names, final_scores):
+    # Create a dataframe for final results
+    result_df = pd.DataFrame({
+        'Alternative': candidate_names,
+        'Final Score': final_scores
+    })
+
+    # Sort the results by Final Score in descending order (highest rank first)
+    result_df = result_df.sort_values(by='Final Score', ascending=False).reset_index(drop=True)
+
+    # Add a new column 'Rank' starting from 1
+    result_df['Rank'] = result_df.index + 1
+    return result_df
+
+
+# pages/wp.py
+
+# Function to normalize decision matrix for WP
+def normalize_matrix_wp(decision_matrix, criteria_types):
+    normalized_matrix = np.copy(decision_matrix)
+    for i in range(decision_matrix.shape[1]):
+        if criteria_types[i] == 'benefit':
+            normalized_matrix[:, i] = decision_matrix[:, i] / decision_matrix[:, i].max()
+        elif criteria_types[i] == 'cost':
+            normalized_matrix[:, i] = decision_matrix[:, i].min() / decision_matrix[:, i]
+    return normalized_matrix
+
+
+# Function to calculate WP scores
+def wp_method(decision_matrix, weights, criteria_types):
+    normalized_matrix = normalize_matrix_wp(decision_matrix, criteria_types)
+    final_scores = np.prod(normalized_matrix ** weights, axis=1)
+    return normalized_matrix, final_scores
+
+
+# pages/topsis.py
+
+# Function to normalize the decision matrix
+def normalize_matrix_topsis(matrix):
+    return matrix / np.sqrt((matrix**2).sum(axis=0))
+
+
+# Function to calculate the distance to the ideal positive and negative solutions
+def calculate_distance(matrix, ideal_solution):
+    return np.sqrt(((matrix - ideal_solution) ** 2).sum(axis=1))
+
+
+# Main TOPSIS function; `alternative_data` has the alternative names in an 'index' column
+def topsis(alternative_data, weights, is_benefit_criteria):
+    # 1. Normalize the decision matrix
+    normalized_matrix = normalize_matrix_topsis(alternative_data.iloc[:, 1:].astype(float))
+
+    # 2. Apply weights to the normalized matrix
+    weighted_matrix = normalized_matrix * weights
+
+    # 3. Determine ideal positive and negative solutions
+    ideal_positive = np.zeros(weighted_matrix.shape[1])
+    ideal_negative = np.zeros(weighted_matrix.shape[1])
+
+    for i in range(weighted_matrix.shape[1]):
+        if is_benefit_criteria[i]:
+            ideal_positive[i] = weighted_matrix.iloc[:, i].max()
+            ideal_negative[i] = weighted_matrix.iloc[:, i].min()
+        else:
+            ideal_positive[i] = weighted_matrix.iloc[:, i].min()
+            ideal_negative[i] = weighted_matrix.iloc[:, i].max()
+
+    # 4. Calculate the distance to the ideal positive and negative solutions
+    distance_to_positive = calculate_distance(weighted_matrix, ideal_positive)
+    distance_to_negative = calculate_distance(weighted_matrix, ideal_negative)
+
+    # 5. Calculate relative closeness to the ideal positive solution
+    relative_closeness = distance_to_negative / (distance_to_positive + distance_to_negative)
+
+    # Handle potential NaN values in relative_closeness (e.g., if both distances are zero)
+    relative_closeness = np.nan_to_num(relative_closeness, nan=0.0)
+
+    # Add results to the dataframe
+    alternative_data['Closeness Coefficient'] = relative_closeness
+    alternative_data['Ranking'] = alternative_data['Closeness Coefficient'].rank(ascending=False, method='min').astype(int)
+    alternative_data['Conclusion'] = ''
+    for index, row in alternative_data.iterrows():
+        if row['Ranking'] == 1:
+            alternative_data.at[index, 'Conclusion'] = 'Selected alternative'
+        else:
+            alternative_data.at[index, 'Conclusion'] = f'Not selected, rank {row["Ranking"]}'
+    return alternative_data
+
+
+# pages/ahp.py
+
+# Function to calculate the priority index for the criteria or alternatives
+def ahp_attributes(ahp_df):
+    sum_array = np.array(ahp_df.sum(numeric_only=True))
+    cell_by_sum = ahp_df.div(sum_array, axis=1)
+    priority_df = pd.DataFrame(cell_by_sum.mean(axis=1), columns=['priority index'])
+    return priority_df
+
+
+# Function to check the consistency ratio; returns (consistency index, consistency ratio)
+def consistency_ratio(priority_index, ahp_df):
+    random_matrix = {1: 0, 2: 0, 3: 0.58, 4: 0.9, 5: 1.12, 6: 1.24, 7: 1.32,
+                     8: 1.41, 9: 1.45, 10: 1.49, 11: 1.51, 12: 1.48, 13: 1.56,
+                     14: 1.57, 15: 1.59, 16: 1.605, 17: 1.61, 18: 1.615, 19: 1.62, 20: 1.625}
+
+    consistency_df = ahp_df.multiply(priority_index['priority index'].values, axis=1)
+    consistency_df['sum_of_col'] = consistency_df.sum(axis=1)
+    lambda_max_df = consistency_df['sum_of_col'].div(priority_index['priority index'])
+    lambda_max = lambda_max_df.mean()
+    consistency_index = (lambda_max - len(ahp_df.index)) / (len(ahp_df.index) - 1)
+    consistency_ratio_value = consistency_index / random_matrix[len(ahp_df.index)]
+    return consistency_index, consistency_ratio_value
+
+
+# Function to weight the attribute priorities by the criteria priorities (Step 5 of the AHP page)
+def ahp_final_scores(ahp_df, attribute_dfs):
+    priority_index_attr = ahp_attributes(ahp_df)
+    attribute_priority_dfs = {criterion: ahp_attributes(attribute_df) for criterion, attribute_df in attribute_dfs.items()}
+    combined_df = pd.concat(attribute_priority_dfs, axis=1)
+    weighted_scores = combined_df.multiply(priority_index_attr['priority index'].values, axis=1)
+    weighted_scores['Final Score'] = weighted_scores.sum(axis=1)
+    return weighted_scores.sort_values(by='Final Score', ascending=False)
@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+
+from tests.problems import decision_problem
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
+
+
+# A 500 x 7 decision problem: (matrix, weights, criteria types)
+@pytest.fixture
+def problem(rng):
+    return decision_problem(rng, 500, 7)
+
+
+# A 120 x 7 problem with integer scores, so that alternatives tie on single criteria
+@pytest.fixture
+def small_problem(rng):
+    matrix, weights, criteria_types = decision_problem(rng, 120, 7)
+    return matrix.round(), weights, criteria_types
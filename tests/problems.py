@@ -0,0 +1,34 @@
+# Random decision problems shared by the tests
+import numpy as np
+import pandas as pd
+
+
+# Function to draw a positive decision matrix, weights summing to one and alternating
+# benefit/cost criteria
+def decision_problem(rng, n_alternatives, n_criteria):
+    matrix = rng.uniform(1, 100, size=(n_alternatives, n_criteria))
+    weights = rng.dirichlet(np.ones(n_criteria))
+    criteria_types = np.where(np.arange(n_criteria) % 2 == 0, 'benefit', 'cost')
+    return matrix, weights, criteria_types
+
+
+# Function to name the rows and columns of a decision matrix as the pages do by default
+def decision_frame(matrix, criteria_prefix='Criteria'):
+    return pd.DataFrame(matrix, index=[f'Alternative {i+1}' for i in range(matrix.shape[0])],
+                        columns=[f'{criteria_prefix} {j+1}' for j in range(matrix.shape[1])])
+
+
+# Function to lay a decision matrix out as the TOPSIS page passes it on: names in an 'index' column
+def topsis_frame(matrix):
+    return decision_frame(matrix, 'C').reset_index()
+
+
+# Function to build a reciprocal comparison matrix from a random priority vector with
+# multiplicative noise
+def comparison_matrix(rng, n, sigma=0.1):
+    priorities = rng.uniform(1, 9, size=n)
+    matrix = priorities[:, None] / priorities[None, :] * np.exp(rng.normal(0, sigma, size=(n, n)))
+    upper = np.triu_indices(n, k=1)
+    matrix[upper[1], upper[0]] = 1 / matrix[upper]
+    np.fill_diagonal(matrix, 1.0)
+    return matrix
@@ -0,0 +1,101 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dss.ahp import (EigenSolver, ahp_attributes, ahp_eigen, batch_power_iteration, consistency_check,
+                     consistency_ratio, is_consistent, random_index)
+from tests import baseline
+from tests.problems import comparison_matrix
+
+
+def _comparison_df(matrix):
+    names = [f'X{i+1}' for i in range(len(matrix))]
+    return pd.DataFrame(matrix, index=names, columns=names)
+
+
+@pytest.mark.parametrize('n', [2, 3, 7, 20])
+def test_ahp_attributes_matches_page(rng, n):
+    ahp_df = _comparison_df(comparison_matrix(rng, n))
+    pd.testing.assert_frame_equal(ahp_attributes(ahp_df), baseline.ahp_attributes(ahp_df), rtol=1e-12)
+
+
+@pytest.mark.parametrize('n', [3, 7, 20])
+def test_consistency_matches_page(rng, n):
+    ahp_df = _comparison_df(comparison_matrix(rng, n, sigma=0.3))
+    priority_index = baseline.ahp_attributes(ahp_df)
+    expected_index, expected_ratio = baseline.consistency_ratio(priority_index, ahp_df)
+    consistency_index, consistency_ratio_value = consistency_check(priority_index, ahp_df)
+    assert consistency_index == pytest.approx(expected_index, rel=1e-10, abs=1e-14)
+    assert consistency_ratio_value == pytest.approx(expected_ratio, rel=1e-10, abs=1e-14)
+    assert consistency_ratio(priority_index, ahp_df) == consistency_ratio_value
+
+
+def test_consistent_matrix_has_zero_consistency_ratio():
+    priorities = np.array([4.0, 2.0, 1.0])
+    ahp_df = _comparison_df(priorities[:, None] / priorities[None, :])
+    priority_index = ahp_attributes(ahp_df)
+    np.testing.assert_allclose(priority_index['priority index'], priorities / priorities.sum())
+    assert consistency_ratio(priority_index, ahp_df) == pytest.approx(0.0, abs=1e-12)
+    assert is_consistent(0.09) and not is_consistent(0.1)
+
+
+def test_random_index_extends_the_table_smoothly():
+    assert random_index(20) == 1.625
+    assert 1.6 < random_index(21) < random_index(40) < 1.77
+
+
+def test_eigen_solver_matches_numpy_eig(rng):
+    matrix = comparison_matrix(rng, 8)
+    eigenvalues, eigenvectors = np.linalg.eig(matrix)
+    principal = np.argmax(eigenvalues.real)
+    expected = np.abs(eigenvectors[:, principal].real)
+    result = EigenSolver().solve(matrix)
+    np.testing.assert_allclose(result.priorities, expected / expected.sum(), rtol=1e-8)
+    assert result.lambda_max == pytest.approx(eigenvalues.real[principal])
+    n = len(matrix)
+    assert result.consistency_ratio == pytest.approx((result.lambda_max - n) / (n - 1) / random_index(n))
+
+
+def test_eigen_solver_memoizes_and_warm_starts(rng):
+    matrix = comparison_matrix(rng, 6)
+    solver = EigenSolver()
+    first = solver.solve(matrix, slot='criteria')
+    assert solver.solve(matrix.copy(), slot='criteria') is first
+    assert (solver.hits, solver.misses) == (1, 1)
+    edited = matrix.copy()
+    edited[0, 1] *= 1.01
+    edited[1, 0] = 1 / edited[0, 1]
+    cold = EigenSolver().solve(edited)
+    warm = solver.solve(edited, slot='criteria')
+    np.testing.assert_allclose(warm.priorities, cold.priorities, atol=1e-10)
+    assert warm.iterations < cold.iterations
+    assert not warm.priorities.flags.writeable
+
+
+def test_ahp_eigen_uses_the_given_solver(rng):
+    matrix = comparison_matrix(rng, 4)
+    solver = EigenSolver()
+    ahp_eigen(matrix, solver=solver)
+    assert solver.misses == 1
+
+
+def test_eigen_solver_shared_by_threads(rng):
+    panel = [comparison_matrix(rng, 6, sigma=0.4) for _ in range(40)]
+    solved = [EigenSolver(maxsize=0).solve(matrix) for matrix in panel]
+    # A small cache that keeps evicting while the threads warm-start from shared slots
+    shared = EigenSolver(maxsize=8)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        threaded = list(executor.map(lambda k: shared.solve(panel[k % len(panel)], slot=k % 3), range(400)))
+    for k, result in enumerate(threaded):
+        np.testing.assert_allclose(result.priorities, solved[k % len(panel)].priorities, atol=1e-9)
+
+
+def test_batch_power_iteration_matches_eigen_solver(rng):
+    stack = np.stack([comparison_matrix(rng, 5, sigma=0.3) for _ in range(10)])
+    priorities, lambda_max = batch_power_iteration(stack)
+    for k, matrix in enumerate(stack):
+        result = EigenSolver().solve(matrix)
+        np.testing.assert_allclose(priorities[k], result.priorities, atol=1e-10)
+        assert lambda_max[k] == pytest.approx(result.lambda_max)
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+
+from dss.ahp import EigenSolver
+from dss.analysis import (AHP_PRIORITY_METHODS, TOPSIS_RESULTS_TITLE, ahp_analysis, priority_with_consistency,
+                          saw_analysis, topsis_analysis, wp_analysis)
+from dss.memo import Memo
+from tests import baseline
+from tests.problems import comparison_matrix, decision_frame
+
+
+def test_saw_analysis_matches_page(problem):
+    matrix, weights, criteria_types = problem
+    analysis = saw_analysis(decision_frame(matrix), weights, criteria_types)
+    expected_normalized, expected_scores = baseline.saw_method(matrix, weights, criteria_types)
+    np.testing.assert_allclose(analysis['Normalized Decision Matrix'], expected_normalized, rtol=1e-12)
+    expected = baseline.score_table(list(decision_frame(matrix).index), expected_scores)
+    result = analysis['Final Scores and Rankings']
+    np.testing.assert_array_equal(result['Alternative'], expected['Alternative'])
+    np.testing.assert_allclose(result['Final Score'], expected['Final Score'], rtol=1e-12)
+    np.testing.assert_array_equal(result['Rank'], expected['Rank'])
+
+
+def test_wp_analysis_matches_page(problem):
+    matrix, weights, criteria_types = problem
+    result = wp_analysis(decision_frame(matrix), weights, criteria_types)['Final Scores and Rankings']
+    expected = baseline.score_table(list(decision_frame(matrix).index),
+                                    baseline.wp_method(matrix, weights, criteria_types)[1])
+    np.testing.assert_array_equal(result['Alternative'], expected['Alternative'])
+    np.testing.assert_allclose(result['Final Score'], expected['Final Score'], rtol=1e-12)
+
+
+def test_memoized_analysis_equals_direct_analysis(problem):
+    matrix, weights, criteria_types = problem
+    memo = Memo()
+    direct = saw_analysis(decision_frame(matrix), weights, criteria_types)
+    for _ in range(2):
+        memoized = saw_analysis(decision_frame(matrix), weights, criteria_types, memo)
+        pd.testing.assert_frame_equal(memoized['Final Scores and Rankings'], direct['Final Scores and Rankings'])
+    assert memo.hits > 0
+
+
+def test_topsis_analysis_matches_page(problem):
+    matrix, weights, criteria_types = problem
+    is_benefit_criteria = criteria_types == 'benefit'
+    frame = decision_frame(matrix, 'C')
+    result = topsis_analysis(frame, weights, is_benefit_criteria)[TOPSIS_RESULTS_TITLE]
+    expected = baseline.topsis(frame.reset_index(), weights, is_benefit_criteria).set_index('index')
+    expected = expected.loc[result.index]
+    np.testing.assert_allclose(result['Closeness Coefficient'], expected['Closeness Coefficient'], rtol=1e-12)
+    np.testing.assert_array_equal(result['Ranking'], expected['Ranking'])
+    assert result['Ranking'].is_monotonic_increasing
+
+
+def _ahp_problem(rng, n_criteria=4, n_alternatives=5):
+    criteria = [f'Criterion {i+1}' for i in range(n_criteria)]
+    alternatives = [f'Alternative {i+1}' for i in range(n_alternatives)]
+    ahp_df = pd.DataFrame(comparison_matrix(rng, n_criteria), index=criteria, columns=criteria)
+    attribute_dfs = {criterion: pd.DataFrame(comparison_matrix(rng, n_alternatives), index=alternatives,
+                                             columns=alternatives) for criterion in criteria}
+    return ahp_df, attribute_dfs
+
+
+def test_ahp_analysis_matches_page(rng):
+    ahp_df, attribute_dfs = _ahp_problem(rng)
+    analysis = ahp_analysis(ahp_df, attribute_dfs)
+    expected = baseline.ahp_final_scores(ahp_df, attribute_dfs)
+    result = analysis['Final Scores for Alternatives']
+    assert list(result.index) == list(expected.index)
+    np.testing.assert_allclose(result['Final Score'], expected['Final Score'], rtol=1e-12)
+    expected_index, expected_ratio = baseline.consistency_ratio(baseline.ahp_attributes(ahp_df), ahp_df)
+    np.testing.assert_allclose(analysis['Consistency Check'].iloc[0], [expected_index, expected_ratio], rtol=1e-10)
+
+
+def test_eigenvector_priorities_use_the_given_solver(rng):
+    ahp_df, _ = _ahp_problem(rng)
+    solver = EigenSolver()
+    priority_df, _, consistency_ratio_value = priority_with_consistency(ahp_df, 'criteria', AHP_PRIORITY_METHODS[1],
+                                                                        solver)
+    assert solver.misses == 1
+    result = solver.solve(ahp_df.to_numpy())
+    np.testing.assert_array_equal(priority_df['priority index'], result.priorities)
+    assert consistency_ratio_value == result.consistency_ratio
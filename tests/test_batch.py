@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from dss.batch import batch_saw, batch_topsis, batch_wp, normalize_columns, rank_scores
+from dss.topsis import rank_descending
+from tests import baseline
+from tests.problems import topsis_frame
+
+
+@pytest.fixture
+def weight_matrix(rng, problem):
+    return rng.dirichlet(np.ones(problem[0].shape[1]), size=20)
+
+
+def test_normalize_columns_matches_page(problem):
+    matrix, _, criteria_types = problem
+    np.testing.assert_array_equal(normalize_columns(matrix, criteria_types),
+                                  baseline.normalize_matrix(matrix, criteria_types))
+
+
+def test_batch_saw_matches_page(problem, weight_matrix):
+    matrix, _, criteria_types = problem
+    expected = np.array([baseline.saw_method(matrix, w, criteria_types)[1] for w in weight_matrix])
+    scores, ranks = batch_saw(matrix, weight_matrix, criteria_types, chunk_size=7)
+    np.testing.assert_allclose(scores, expected, rtol=1e-12)
+    np.testing.assert_array_equal(ranks, rank_scores(expected))
+
+
+def test_batch_wp_matches_page(problem, weight_matrix):
+    matrix, _, criteria_types = problem
+    expected = np.array([baseline.wp_method(matrix, w, criteria_types)[1] for w in weight_matrix])
+    np.testing.assert_allclose(batch_wp(matrix, weight_matrix, criteria_types)[0], expected, rtol=1e-10)
+
+
+def test_batch_wp_keeps_zero_scores():
+    matrix = np.array([[0.0, 2.0], [1.0, 1.0]])
+    scores, _ = batch_wp(matrix, [[0.5, 0.5], [0.0, 1.0]], ['benefit', 'benefit'])
+    expected = [baseline.wp_method(matrix, w, ['benefit', 'benefit'])[1] for w in ([0.5, 0.5], [0.0, 1.0])]
+    np.testing.assert_allclose(scores, expected)
+
+
+def test_batch_topsis_matches_page(problem, weight_matrix):
+    matrix, _, criteria_types = problem
+    is_benefit_criteria = criteria_types == 'benefit'
+    expected = np.array([baseline.topsis(topsis_frame(matrix), w, is_benefit_criteria)['Closeness Coefficient']
+                         for w in weight_matrix])
+    np.testing.assert_allclose(batch_topsis(matrix, weight_matrix, is_benefit_criteria)[0], expected, rtol=1e-10)
+
+
+def test_batch_topsis_rejects_negative_weights(problem):
+    matrix, weights, criteria_types = problem
+    with pytest.raises(ValueError):
+        batch_topsis(matrix, -weights[None, :], criteria_types == 'benefit')
+
+
+def test_weights_of_the_wrong_width_are_rejected(problem):
+    matrix, weights, criteria_types = problem
+    with pytest.raises(ValueError):
+        batch_saw(matrix, weights[:-1], criteria_types)
+
+
+def test_rank_scores_ranks_each_scenario():
+    ranks = rank_scores(np.array([[0.1, 0.3, 0.2], [3.0, 2.0, 1.0]]))
+    np.testing.assert_array_equal(ranks, [[3, 1, 2], [1, 2, 3]])
+
+
+def test_rank_scores_give_ties_the_smallest_rank():
+    scores = np.array([[2.0, 5.0, 2.0, 1.0], [1.0, 1.0, 1.0, 1.0], [np.nan, 3.0, np.nan, 3.0]])
+    np.testing.assert_array_equal(rank_scores(scores), [[2, 1, 2, 4], [1, 1, 1, 1], [3, 1, 3, 1]])
+    for row in scores:
+        np.testing.assert_array_equal(rank_scores(row[None])[0], rank_descending(row)[0])
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from dss.compare import (average_ranks, borda_consensus, compare_methods, compare_scores, copeland_consensus,
+                         kendall_tau, rank_correlations, spearman_rho)
+from tests import baseline
+from tests.problems import topsis_frame
+
+
+def _page_scores(matrix, weights, criteria_types):
+    return {'saw': baseline.saw_method(matrix, weights, criteria_types)[1],
+            'wp': baseline.wp_method(matrix, weights, criteria_types)[1],
+            'topsis': baseline.topsis(topsis_frame(matrix), weights,
+                                      criteria_types == 'benefit')['Closeness Coefficient'].to_numpy()}
+
+
+def test_compare_scores_matches_pages(problem):
+    matrix, weights, criteria_types = problem
+    scores = compare_scores(matrix, weights, criteria_types)
+    for method, expected in _page_scores(matrix, weights, criteria_types).items():
+        np.testing.assert_allclose(scores[method], expected, rtol=1e-10)
+
+
+def test_compare_scores_matches_pages_with_zeros(problem):
+    # A zero benefit value leaves the positive-data shortcut for the normalized-matrix path
+    matrix, weights, criteria_types = problem
+    matrix = matrix.copy()
+    matrix[3, 0] = 0.0
+    scores = compare_scores(matrix, weights, criteria_types)
+    for method, expected in _page_scores(matrix, weights, criteria_types).items():
+        np.testing.assert_allclose(scores[method], expected, rtol=1e-10)
+
+
+def test_compare_scores_keeps_the_requested_methods(problem):
+    matrix, weights, criteria_types = problem
+    assert list(compare_scores(matrix, weights, criteria_types, ('topsis', 'saw'))) == ['topsis', 'saw']
+    with pytest.raises(ValueError):
+        compare_scores(matrix, weights, criteria_types, ('saw', 'vikor'))
+
+
+def test_kendall_tau_matches_pairwise_tau_b(rng):
+    x, y = rng.integers(0, 6, size=(2, 300))
+    pairs = [(np.sign(x[i] - x[j]), np.sign(y[i] - y[j])) for i in range(300) for j in range(i + 1, 300)]
+    concordant = sum(a * b for a, b in pairs)
+    expected = concordant / np.sqrt(sum(a != 0 for a, _ in pairs) * sum(b != 0 for _, b in pairs))
+    assert kendall_tau(x, y) == pytest.approx(expected)
+
+
+def test_spearman_rho_of_average_ranks():
+    np.testing.assert_array_equal(average_ranks([10, 20, 20, 5]), [2, 3.5, 3.5, 1])
+    assert spearman_rho([1, 2, 3, 4], [40, 30, 20, 10]) == pytest.approx(-1.0)
+
+
+def test_rank_correlations_are_symmetric(problem):
+    matrix, weights, criteria_types = problem
+    kendall, spearman = rank_correlations(compare_scores(matrix, weights, criteria_types))
+    for table in (kendall, spearman):
+        np.testing.assert_allclose(table, table.T)
+        np.testing.assert_allclose(np.diag(table), 1.0)
+
+
+def test_consensus_rules():
+    ranks = np.array([[1, 2, 3], [1, 3, 2], [2, 1, 3]])
+    points, consensus = borda_consensus(ranks)
+    np.testing.assert_array_equal(points, [5, 3, 1])
+    np.testing.assert_array_equal(consensus, [1, 2, 3])
+    points, consensus = copeland_consensus(ranks)
+    np.testing.assert_array_equal(points, [2, 0, -2])
+    np.testing.assert_array_equal(consensus, [1, 2, 3])
+
+
+def test_compare_methods_ranks_every_method(problem):
+    matrix, weights, criteria_types = problem
+    scores, ranks, _, consensus = compare_methods(matrix, weights, criteria_types, consensus='copeland')
+    assert ranks.shape == (3, len(matrix))
+    assert consensus.min() == 1
+    with pytest.raises(ValueError):
+        compare_methods(matrix, weights, criteria_types, consensus='plurality')
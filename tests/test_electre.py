@@ -0,0 +1,27 @@
+import numpy as np
+
+from dss.electre import electre_matrices, electre_method
+
+
+def test_electre_method_matches_the_full_outranking_matrix(small_problem):
+    matrix, weights, criteria_types = small_problem
+    concordance, discordance = electre_matrices(matrix, weights, criteria_types)
+    pairs = ~np.eye(len(matrix), dtype=bool)
+    outranking = (concordance >= concordance[pairs].mean()) & (discordance <= discordance[pairs].mean()) & pairs
+    outranks, outranked, net = electre_method(matrix, weights, criteria_types, block_cells=1000, n_jobs=3)
+    np.testing.assert_array_equal(outranks, outranking.sum(axis=1))
+    np.testing.assert_array_equal(outranked, outranking.sum(axis=0))
+    np.testing.assert_array_equal(net, outranks - outranked)
+
+
+def test_concordance_and_discordance_of_a_small_problem():
+    matrix = np.array([[3.0, 1.0], [1.0, 3.0], [2.0, 2.0]])
+    concordance, discordance = electre_matrices(matrix, [3.0, 1.0], ['benefit', 'benefit'])
+    np.testing.assert_allclose(concordance, [[0, 0.75, 0.75], [0.25, 0, 0.25], [0.25, 0.75, 0]])
+    np.testing.assert_allclose(discordance[0], [0, 1, 0.5])
+
+
+def test_a_dominating_alternative_outranks_everyone():
+    matrix = np.array([[5.0, 5.0], [1.0, 2.0], [2.0, 1.0]])
+    outranks, outranked, _ = electre_method(matrix, [0.5, 0.5], ['benefit', 'benefit'])
+    assert outranks[0] == 2 and outranked[0] == 0
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from dss.ahp import EigenSolver
+from dss.group_ahp import aggregate_priorities, evaluator_consistency, group_ahp, simulate_evaluators
+
+
+@pytest.fixture
+def panel():
+    return simulate_evaluators(40, 6, sigma=0.4, seed=0)
+
+
+def test_evaluator_consistency_matches_eigen_solver(panel):
+    priorities, ratios = evaluator_consistency(panel)
+    for k, matrix in enumerate(panel):
+        result = EigenSolver().solve(matrix)
+        np.testing.assert_allclose(priorities[k], result.priorities, atol=1e-9)
+        assert ratios[k] == pytest.approx(result.consistency_ratio, abs=1e-9)
+
+
+def test_aij_is_the_geometric_mean_of_the_included_matrices(panel):
+    group = group_ahp(panel, 'aij', exclude_inconsistent=True)
+    assert 0 < group.included.sum() < len(panel)
+    included = [matrix for matrix, keep in zip(panel, group.included) if keep]
+    expected = np.exp(np.mean([np.log(matrix) for matrix in included], axis=0))
+    np.testing.assert_allclose(group.aggregated_matrix, expected, rtol=1e-10)
+    np.testing.assert_allclose(group.aggregated_matrix * group.aggregated_matrix.T, 1.0)
+    np.testing.assert_allclose(group.priorities, EigenSolver().solve(expected).priorities, atol=1e-9)
+
+
+def test_aip_is_the_weighted_geometric_mean_of_the_priorities(panel):
+    weights = np.arange(1.0, len(panel) + 1)
+    group = group_ahp(panel, 'aip', evaluator_weights=weights)
+    priorities, _ = evaluator_consistency(panel)
+    expected = np.exp((weights / weights.sum()) @ np.log(priorities))
+    np.testing.assert_allclose(group.priorities, expected / expected.sum(), rtol=1e-10)
+    np.testing.assert_allclose(aggregate_priorities(priorities, weights), group.priorities)
+    assert group.aggregated_matrix is None
+
+
+def test_invalid_aggregation_input_is_rejected(panel):
+    with pytest.raises(ValueError):
+        group_ahp(panel, 'median')
+    with pytest.raises(ValueError):
+        group_ahp(panel, exclude_inconsistent=True, threshold=0.0)
+    with pytest.raises(ValueError, match='Evaluator weights'):
+        group_ahp(panel, evaluator_weights=np.ones(len(panel) + 1))
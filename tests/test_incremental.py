@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from dss.incremental import IncrementalRanking
+from tests import baseline
+
+K = 10
+
+
+def _reference(method, weights, criteria_types):
+    if method == 'saw':
+        return lambda matrix: baseline.saw_method(matrix, weights, criteria_types)[1]
+    return lambda matrix: baseline.wp_method(matrix, weights, criteria_types)[1]
+
+
+# Appends and updates rows in random order, comparing the top-k and the scores with a full
+# recompute along the way. Updates copy existing rows, so exact ties are compared by score:
+# rows scored one at a time may differ from the full recompute in the last bit and swap
+# places with their twins.
+@pytest.mark.parametrize('method', ['saw', 'wp'])
+def test_incremental_ranking_matches_full_recompute(rng, problem, method):
+    matrix, weights, criteria_types = problem
+    reference = _reference(method, weights, criteria_types)
+    ranking = IncrementalRanking(method, weights, criteria_types, k=K)
+    current = matrix[:50].copy()
+    ranking.append(current)
+    for step, i in enumerate(range(50, len(matrix), 5)):
+        if step % 2:
+            row = int(rng.integers(len(current)))
+            current[row] = matrix[rng.integers(len(matrix))]
+            ranking.update(row, current[row])
+        ranking.append(matrix[i:i + 5])
+        current = np.vstack([current, matrix[i:i + 5]])
+        expected = reference(current)
+        rows, scores = ranking.top_k()
+        order = np.argsort(-expected, kind='stable')[:K]
+        np.testing.assert_allclose(expected[rows], expected[order], rtol=1e-10)
+        np.testing.assert_allclose(scores, expected[order], rtol=1e-10)
+    np.testing.assert_allclose(ranking.scores(), reference(current), rtol=1e-10)
+
+
+def test_top_k_beyond_the_index(problem):
+    matrix, weights, criteria_types = problem
+    ranking = IncrementalRanking('saw', weights, criteria_types, k=3)
+    ranking.append(matrix)
+    expected = baseline.saw_method(matrix, weights, criteria_types)[1]
+    rows, scores = ranking.top_k(20)
+    np.testing.assert_array_equal(rows, np.argsort(-expected, kind='stable')[:20])
+    np.testing.assert_allclose(scores, expected[rows], rtol=1e-12)
+
+
+def test_rank_gives_ties_the_smallest_rank():
+    ranking = IncrementalRanking('saw', [1.0], ['benefit'], k=2)
+    ranking.append([[3.0], [5.0], [3.0], [1.0]])
+    assert [ranking.rank(i) for i in range(4)] == [2, 1, 2, 4]
+
+
+def test_rows_inside_the_column_ranges_do_not_rescore_everything(problem):
+    matrix, weights, criteria_types = problem
+    ranking = IncrementalRanking('saw', weights, criteria_types)
+    ranking.append(matrix)
+    ranking.top_k()
+    ranking.append((matrix.max(axis=0) + matrix.min(axis=0)) / 2)
+    ranking.update(0, matrix[1])
+    ranking.top_k()
+    assert ranking.full_rescores == 0
+
+
+def test_invalid_input_is_rejected(problem):
+    _, weights, criteria_types = problem
+    with pytest.raises(ValueError):
+        IncrementalRanking('vikor', weights, criteria_types)
+    with pytest.raises(ValueError, match='TOPSIS'):
+        IncrementalRanking('topsis', weights, criteria_types)
+    ranking = IncrementalRanking('saw', weights, criteria_types)
+    with pytest.raises(ValueError):
+        ranking.append(np.ones((2, len(weights) + 1)))
+    with pytest.raises(IndexError):
+        ranking.update(0, np.ones(len(weights)))
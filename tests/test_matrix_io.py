@@ -0,0 +1,90 @@
+import io
+import mmap
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dss.matrix_io import (empty_matrix, export_table, load_comparison_stack, load_judgments, load_matrix, load_npy,
+                           validate_comparison_stack, validate_matrix)
+from tests.problems import comparison_matrix
+
+
+def test_csv_with_names(tmp_path):
+    path = tmp_path / 'matrix.csv'
+    path.write_text('name,price,quality\nA,10,3\nB,20,5\n')
+    frame = load_matrix(str(path))
+    assert list(frame.index) == ['A', 'B'] and list(frame.columns) == ['price', 'quality']
+    np.testing.assert_array_equal(frame.to_numpy(), [[10, 3], [20, 5]])
+    assert (frame.dtypes == np.float64).all()
+
+
+def test_npy_is_memory_mapped(tmp_path, problem):
+    path = tmp_path / 'matrix.npy'
+    np.save(path, problem[0])
+    assert isinstance(load_npy(str(path)), np.memmap)
+    frame = load_matrix(str(path))
+    np.testing.assert_array_equal(frame.to_numpy(), problem[0])
+    assert frame.index[0] == 'Alternative 1' and frame.columns[-1] == 'Criteria 7'
+    # The validated frame still reads from the file mapping rather than a copy in RAM
+    base = frame.to_numpy()
+    while isinstance(base, np.ndarray):
+        base = base.base
+    assert isinstance(base, mmap.mmap)
+
+
+def test_uploaded_file_object():
+    upload = io.BytesIO(b'a,b\n1,2\n3,4\n')
+    upload.name = 'upload.csv'
+    np.testing.assert_array_equal(load_matrix(upload).to_numpy(), [[1, 2], [3, 4]])
+
+
+def test_invalid_matrices_are_rejected():
+    with pytest.raises(ValueError, match='empty'):
+        validate_matrix(pd.DataFrame())
+    with pytest.raises(ValueError, match='shape'):
+        validate_matrix(empty_matrix(2, 3), shape=(3, 3))
+    with pytest.raises(ValueError, match='Non-numeric'):
+        validate_matrix(pd.DataFrame({'a': ['x', 'y']}))
+    with pytest.raises(ValueError, match='missing'):
+        validate_matrix(pd.DataFrame({'a': [1.0, np.nan]}))
+    with pytest.raises(ValueError, match='Unsupported'):
+        load_matrix('matrix.txt')
+
+
+def test_comparison_stack(tmp_path, rng):
+    stack = np.stack([comparison_matrix(rng, 4) for _ in range(3)])
+    path = tmp_path / 'stack.npy'
+    np.save(path, stack)
+    np.testing.assert_array_equal(load_comparison_stack(str(path)), stack)
+    with pytest.raises(ValueError):
+        validate_comparison_stack(stack[:, :3])
+    with pytest.raises(ValueError):
+        validate_comparison_stack(-stack)
+    # Reciprocals rounded to two decimals are accepted
+    validate_comparison_stack(stack.round(2))
+    with pytest.raises(ValueError, match='diagonal'):
+        validate_comparison_stack(stack * 2)
+    broken = stack.copy()
+    broken[1, 0, 2] = broken[1, 2, 0]
+    with pytest.raises(ValueError, match=r'matrix 2 is not reciprocal: entry \(1, 3\)'):
+        validate_comparison_stack(broken)
+
+
+def test_judgments(tmp_path):
+    path = tmp_path / 'judgments.csv'
+    path.write_text('First,Second,Judgment\nA,B,3\nB,C,0.5\n')
+    judgments = load_judgments(str(path))
+    assert list(judgments.columns) == ['criterion', 'first', 'second', 'judgment']
+    assert (judgments['criterion'] == 'Criterion 1').all()
+    path.write_text('first,second,judgment\nA,B,0\n')
+    with pytest.raises(ValueError, match='positive'):
+        load_judgments(str(path))
+
+
+def test_export_round_trips(problem):
+    frame = empty_matrix(3, 2, value=1.5)
+    assert export_table(frame, 'csv').decode().splitlines()[0] == 'Alternative,Criteria 1,Criteria 2'
+    np.testing.assert_array_equal(np.load(io.BytesIO(export_table(frame, 'npy'))), frame.to_numpy())
+    with pytest.raises(ValueError):
+        export_table(frame, 'json')
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dss.memo import Memo, content_key, normalize_matrix_cached, parse_row
+from tests import baseline
+
+
+def test_normalize_matrix_cached_matches_page(problem):
+    matrix, _, criteria_types = problem
+    np.testing.assert_array_equal(normalize_matrix_cached(Memo(), matrix, criteria_types),
+                                  baseline.normalize_matrix(matrix, criteria_types))
+
+
+def test_only_changed_columns_are_renormalized(problem):
+    matrix, _, criteria_types = problem
+    memo = Memo()
+    normalize_matrix_cached(memo, matrix, criteria_types)
+    edited = matrix.copy()
+    edited[0, 2] += 1
+    normalized = normalize_matrix_cached(memo, edited, criteria_types)
+    assert memo.misses == matrix.shape[1] + 1
+    np.testing.assert_array_equal(normalized, baseline.normalize_matrix(edited, criteria_types))
+
+
+def test_memo_returns_read_only_arrays():
+    memo = Memo()
+    result = memo(np.cumsum, np.arange(5))
+    assert memo(np.cumsum, np.arange(5)) is result
+    assert not result.flags.writeable
+    assert memo.stats() == {'hits': 1, 'misses': 1, 'size': 1, 'bytes': 40, 'hit_rate': 0.5}
+
+
+def test_memo_evicts_the_least_recently_used_entries_by_size():
+    memo = Memo(max_bytes=2000)
+    for size in (100, 101, 100, 102):
+        memo(np.zeros, size)
+    # 800 + 808 + 816 bytes do not fit, so the least recently used array (101) went
+    assert memo.nbytes == 1616 and (memo.hits, memo.misses) == (1, 3)
+    memo(np.zeros, 101)
+    assert (memo.hits, memo.misses) == (1, 4)
+    # A result larger than the budget is returned but not kept
+    memo(np.zeros, 1000)
+    assert memo.stats()['size'] == 2
+
+
+def test_revisions_key_the_columns_without_hashing(problem):
+    matrix, _, criteria_types = problem
+    memo = Memo()
+    revisions = [('grid', j) for j in range(matrix.shape[1])]
+    normalize_matrix_cached(memo, matrix, criteria_types, revisions)
+    normalized = normalize_matrix_cached(memo, matrix, criteria_types, revisions)
+    assert memo.hits == matrix.shape[1]
+    np.testing.assert_array_equal(normalized, baseline.normalize_matrix(matrix, criteria_types))
+    edited = matrix.copy()
+    edited[0, 2] += 1
+    revisions[2] = ('grid', 2, ((0, edited[0, 2]),))
+    normalized = normalize_matrix_cached(memo, edited, criteria_types, revisions)
+    assert memo.misses == matrix.shape[1] + 1
+    np.testing.assert_array_equal(normalized, baseline.normalize_matrix(edited, criteria_types))
+
+
+def test_content_key_distinguishes_values_and_types():
+    frame = pd.DataFrame({'a': [1.0, 2.0]}, index=['x', 'y'])
+    assert content_key(frame) == content_key(frame.copy())
+    assert content_key(frame) != content_key(frame.rename(index={'x': 'z'}))
+    assert content_key(np.arange(3)) != content_key(np.arange(3.0))
+    assert content_key([1, 2]) != content_key((1, 2))
+    assert content_key({'a': 1}) != content_key({'a': 2})
+
+
+def test_parse_row():
+    np.testing.assert_array_equal(parse_row('1, 2.5,3'), [1.0, 2.5, 3.0])
+    with pytest.raises(ValueError):
+        parse_row('1,two')
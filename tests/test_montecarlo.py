@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from dss.montecarlo import ahp_rank_stability, rank_counts, rank_stability, sample_weights
+from tests.problems import comparison_matrix
+
+
+def test_rank_counts_tallies_each_alternative_and_rank():
+    counts = rank_counts(np.array([[1, 2, 3], [2, 1, 3], [1, 2, 3]]))
+    np.testing.assert_array_equal(counts, [[2, 1, 0], [1, 2, 0], [0, 0, 3]])
+
+
+def test_dirichlet_samples_are_centred_on_the_weights(rng):
+    weights = np.array([2.0, 1.0, 1.0])
+    samples = sample_weights(rng, 20_000, weights, concentration=50.0)
+    np.testing.assert_allclose(samples.sum(axis=1), 1.0)
+    np.testing.assert_allclose(samples.mean(axis=0), weights / weights.sum(), atol=0.01)
+
+
+def test_uniform_samples_stay_in_their_intervals(rng):
+    samples = sample_weights(rng, 1000, lower=[0.1, 0.2], upper=[0.3, 0.4])
+    assert ((samples >= [0.1, 0.2]) & (samples <= [0.3, 0.4])).all()
+
+
+@pytest.mark.parametrize('method', ['saw', 'wp', 'topsis'])
+def test_rank_probabilities_are_distributions(rng, method):
+    matrix = rng.uniform(1, 10, size=(6, 3))
+    probabilities = rank_stability(method, matrix, ['benefit', 'cost', 'benefit'], [0.5, 0.3, 0.2], n_samples=2000,
+                                   n_workers=1)
+    np.testing.assert_allclose(probabilities.sum(axis=0), 1.0)
+    np.testing.assert_allclose(probabilities.sum(axis=1), 1.0)
+
+
+def test_a_dominating_alternative_is_always_first():
+    matrix = np.array([[9.0, 9.0], [1.0, 2.0], [2.0, 1.0]])
+    probabilities = rank_stability('saw', matrix, ['benefit', 'benefit'], [0.5, 0.5], n_samples=1000, n_workers=1)
+    assert probabilities[0, 0] == 1.0
+
+
+def test_rank_stability_is_reproducible_for_a_seed(rng):
+    matrix = rng.uniform(1, 10, size=(5, 3))
+    runs = [rank_stability('saw', matrix, ['benefit'] * 3, [0.4, 0.3, 0.3], n_samples=500, seed=7, n_workers=1)
+            for _ in range(2)]
+    np.testing.assert_array_equal(*runs)
+
+
+def test_ahp_rank_stability_without_noise_keeps_the_ranking(rng):
+    criteria_matrix = comparison_matrix(rng, 3, sigma=0.0)
+    alternative_priorities = np.array([[0.6, 0.5, 0.7], [0.3, 0.3, 0.2], [0.1, 0.2, 0.1]])
+    probabilities = ahp_rank_stability(criteria_matrix, alternative_priorities, sigma=1e-9, n_samples=200,
+                                       n_workers=1)
+    np.testing.assert_array_equal(probabilities, np.eye(3))
+
+
+def test_ahp_rank_stability_uses_the_priority_method(rng):
+    from dss.ahp import priority_vectors
+
+    # An inconsistent matrix: alternatives 2 and 3 swap places between the two priority methods
+    criteria_matrix = np.array([[1.0, 2.0, 9.0], [0.5, 1.0, 0.2], [1 / 9, 5.0, 1.0]])
+    alternative_priorities = np.array([[0.5, 0.2, 0.3], [0.3, 0.6, 0.1], [0.2, 0.2, 0.6]])
+    eigenvalues, eigenvectors = np.linalg.eig(criteria_matrix)
+    eigenvector = np.abs(eigenvectors[:, np.argmax(eigenvalues.real)].real)
+    expected = {'eigenvector': [0, 1, 2], 'column_average': [0, 2, 1]}
+    for method, weights in (('eigenvector', eigenvector / eigenvector.sum()),
+                            ('column_average', priority_vectors(criteria_matrix))):
+        assert list(np.argsort(-(alternative_priorities @ weights))) == expected[method]
+        probabilities = ahp_rank_stability(criteria_matrix, alternative_priorities, sigma=1e-9, n_samples=50,
+                                           n_workers=1, priority_method=method)
+        np.testing.assert_array_equal(probabilities[expected[method]], np.eye(3))
+    with pytest.raises(ValueError):
+        ahp_rank_stability(criteria_matrix, alternative_priorities, priority_method='median')
@@ -0,0 +1,65 @@
+import json
+
+from dss.profiling import Profiler, active_profiler, stage, to_json_lines, to_prometheus
+
+
+def test_stages_are_recorded_only_while_profiling():
+    with stage('ignored'):
+        pass
+    with Profiler('page') as profiler:
+        assert active_profiler() is profiler
+        with stage('outer'):
+            with stage('inner'):
+                pass
+        with stage('inner'):
+            pass
+    assert active_profiler() is None
+    assert [record['stage'] for record in profiler.records] == ['inner', 'outer', 'inner']
+    summary = {total['stage']: total for total in profiler.summary()}
+    assert summary['inner']['calls'] == 2 and summary['outer']['peak_bytes'] is None
+
+
+def test_memory_tracing_sees_nested_peaks():
+    with Profiler('page', trace_memory=True) as profiler:
+        with stage('outer'):
+            with stage('inner'):
+                block = bytearray(4 << 20)
+                del block
+    peaks = {record['stage']: record['peak_bytes'] for record in profiler.records}
+    assert peaks['inner'] >= 4 << 20 and peaks['outer'] >= peaks['inner']
+
+
+def test_cprofile_stats():
+    with Profiler('page', use_cprofile=True) as profiler:
+        sorted(range(1000))
+    assert 'function calls' in profiler.cprofile_stats()
+
+
+def test_exports():
+    with Profiler('my "page"') as profiler:
+        with stage('solve'):
+            pass
+    lines = to_json_lines(profiler.records).splitlines()
+    assert json.loads(lines[0])['stage'] == 'solve'
+    text = to_prometheus(profiler)
+    assert 'dss_stage_calls_total{page="my \\"page\\"",stage="solve"} 1' in text
+    assert 'peak_bytes' not in text
+
+
+def test_only_one_profiler_traces_memory_at_a_time():
+    import tracemalloc
+
+    first = Profiler('first', trace_memory=True).start()
+    second = Profiler('second', trace_memory=True).start()
+    with second.stage('solve'):
+        pass
+    assert first.tracing_memory and not second.tracing_memory
+    assert second.records[0]['peak_bytes'] is None
+    # Stopping the other profiler leaves the owner's tracing running
+    second.stop()
+    assert tracemalloc.is_tracing()
+    first.stop()
+    assert not tracemalloc.is_tracing()
+    third = Profiler('third', trace_memory=True).start()
+    assert third.tracing_memory
+    third.stop()
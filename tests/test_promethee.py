@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from dss.promethee import oriented_matrix, preference_parameters, promethee_flows, unit_weights
+
+FUNCTIONS = np.array(['linear', 'usual', 'gaussian'] * 2 + ['linear'])
+
+
+# Function to compute the net flows from the full (n x n x m) preference tensor
+def _tensor_net_flows(matrix, weights, criteria_types, q, p):
+    oriented = np.where(criteria_types == 'cost', -matrix, matrix)
+    differences = oriented[:, None, :] - oriented[None, :, :]
+    gaussian = 1 - np.exp(-np.maximum(differences, 0) ** 2 / (2 * matrix.std(axis=0) ** 2))
+    linear = np.clip((differences - q) / (p - q), 0, 1)
+    preferences = np.where(FUNCTIONS == 'usual', differences > 0, np.where(FUNCTIONS == 'gaussian', gaussian, linear))
+    tensor = preferences @ (weights / weights.sum())
+    return (tensor.sum(axis=1) - tensor.sum(axis=0)) / (len(matrix) - 1)
+
+
+@pytest.mark.parametrize('method, n_jobs', [('auto', 1), ('pairwise', 1), ('pairwise', 3)])
+def test_net_flows_match_the_preference_tensor(small_problem, method, n_jobs):
+    matrix, weights, criteria_types = small_problem
+    q, p = np.full(7, 1.0), np.full(7, 3.0)
+    net = promethee_flows(matrix, weights, criteria_types, FUNCTIONS, q, p, method=method, block_cells=1000,
+                          n_jobs=n_jobs)[2]
+    np.testing.assert_allclose(net, _tensor_net_flows(matrix, weights, criteria_types, q, p), rtol=1e-10, atol=1e-12)
+
+
+def test_flows_are_consistent(small_problem):
+    matrix, weights, criteria_types = small_problem
+    positive, negative, net = promethee_flows(matrix, weights, criteria_types)
+    np.testing.assert_allclose(net, positive - negative)
+    assert net.sum() == pytest.approx(0.0, abs=1e-9)
+
+
+def test_cost_criteria_are_negated():
+    np.testing.assert_array_equal(oriented_matrix([[1.0, 2.0]], ['benefit', 'cost']), [[1.0, -2.0]])
+
+
+def test_invalid_parameters_are_rejected():
+    matrix = np.array([[1.0, 2.0], [2.0, 1.0]])
+    with pytest.raises(ValueError):
+        unit_weights([1.0, -1.0], 2)
+    with pytest.raises(ValueError):
+        preference_parameters(matrix, ['linear', 'linear'], q=[2.0, 2.0], p=[1.0, 1.0])
+    with pytest.raises(ValueError):
+        preference_parameters(matrix, ['usual', 'step'])
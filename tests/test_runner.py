@@ -0,0 +1,110 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dss.runner import discover_problems, run_batch, score_problem
+from tests import baseline
+from tests.problems import comparison_matrix, topsis_frame
+
+
+def _write(path, problem):
+    path.write_text(json.dumps(problem))
+    return path
+
+
+def _read_output(path):
+    if str(path).endswith('.parquet'):
+        return pd.read_parquet(path)
+    return pd.read_csv(path, float_precision='round_trip')
+
+
+@pytest.fixture
+def problems(tmp_path, small_problem):
+    matrix, weights, criteria_types = small_problem
+    directory = tmp_path / 'problems'
+    directory.mkdir()
+    for method in ('saw', 'wp', 'topsis'):
+        _write(directory / f'{method}.json', {'method': method, 'matrix': matrix.tolist(), 'weights': weights.tolist(),
+                                              'criteria_types': criteria_types.tolist()})
+    return directory
+
+
+@pytest.mark.parametrize('extension', ['csv', 'parquet'])
+def test_run_batch_matches_pages(tmp_path, problems, small_problem, extension):
+    if extension == 'parquet':
+        pytest.importorskip('pyarrow')
+    matrix, weights, criteria_types = small_problem
+    output = tmp_path / f'results.{extension}'
+    summary, errors = run_batch(str(problems), str(output), workers=0, chunk_size=1)
+    assert not errors and summary['problems'] == 3
+    batch = _read_output(output).set_index(['problem', 'alternative'])
+    names = [f'Alternative {i+1}' for i in range(len(matrix))]
+    for method, page in (('saw', baseline.saw_method), ('wp', baseline.wp_method)):
+        expected = pd.Series(page(matrix, weights, criteria_types)[1], index=names)
+        np.testing.assert_allclose(batch.loc[f'{method}.json', 'score'].loc[names], expected, rtol=1e-12)
+    expected = baseline.topsis(topsis_frame(matrix), weights, criteria_types == 'benefit').set_index('index')
+    topsis = batch.loc['topsis.json'].loc[expected.index]
+    np.testing.assert_allclose(topsis['score'], expected['Closeness Coefficient'], rtol=1e-12)
+    np.testing.assert_array_equal(topsis['rank'], expected['Ranking'])
+    assert not (tmp_path / f'results.{extension}.partial').exists()
+
+
+def test_ahp_problem_matches_page(tmp_path, rng):
+    criteria_matrix = comparison_matrix(rng, 3)
+    alternative_matrices = [comparison_matrix(rng, 4) for _ in range(3)]
+    path = _write(tmp_path / 'ahp.json', {'method': 'ahp', 'criteria_matrix': criteria_matrix.tolist(),
+                                          'alternative_matrices': [m.tolist() for m in alternative_matrices]})
+    rows = score_problem(str(path), 'ahp.json')
+    criteria = [f'Criterion {i+1}' for i in range(3)]
+    alternatives = [f'Alternative {i+1}' for i in range(4)]
+    expected = baseline.ahp_final_scores(
+        pd.DataFrame(criteria_matrix, index=criteria, columns=criteria),
+        {criterion: pd.DataFrame(matrix, index=alternatives, columns=alternatives)
+         for criterion, matrix in zip(criteria, alternative_matrices)})
+    assert list(rows['alternative']) == list(expected.index)
+    np.testing.assert_allclose(rows['score'], expected['Final Score'], rtol=1e-12)
+    np.testing.assert_array_equal(rows['rank'], [1, 2, 3, 4])
+
+
+def test_rerun_after_a_failure_only_scores_the_failed_problem(tmp_path, problems, small_problem):
+    matrix, weights, _ = small_problem
+    _write(problems / 'wp.json', {'method': 'wp', 'matrix': matrix.tolist(), 'weights': weights[:-1].tolist()})
+    output = tmp_path / 'retry.csv'
+    _, first_errors = run_batch(str(problems), str(output), workers=0, chunk_size=1)
+    assert list(first_errors) == ['wp.json']
+    _write(problems / 'wp.json', {'method': 'wp', 'matrix': matrix.tolist(), 'weights': weights.tolist()})
+    summary, errors = run_batch(str(problems), str(output), workers=0, chunk_size=1)
+    assert not errors and summary['problems'] == 1 and summary['skipped'] == 2
+    assert sorted(_read_output(output)['problem'].unique()) == ['saw.json', 'topsis.json', 'wp.json']
+
+
+def test_invalid_problems_are_recorded_as_failures(tmp_path, problems):
+    (problems / 'list.json').write_text('[1, 2]')
+    _write(problems / 'zeros.json', {'method': 'saw', 'matrix': [[0, 0], [0, 0]], 'weights': [0.5, 0.5]})
+    _write(problems / 'ahp.json', {'method': 'ahp', 'criteria_matrix': [[1, 2], [0.5, 1]],
+                                   'alternative_matrices': [[[1, 0], [0, 1]], [[1, 3], [1 / 3, 1]]]})
+    output = tmp_path / 'results.csv'
+    summary, errors = run_batch(str(problems), str(output), workers=0, chunk_size=1)
+    assert sorted(errors) == ['ahp.json', 'list.json', 'zeros.json']
+    assert 'JSON object' in errors['list.json']
+    assert 'positive maximum' in errors['zeros.json']
+    assert 'Criterion 1 is invalid' in errors['ahp.json']
+    assert sorted(_read_output(output)['problem'].unique()) == ['saw.json', 'topsis.json', 'wp.json']
+
+
+def test_process_pool_matches_in_process(tmp_path, problems):
+    run_batch(str(problems), str(tmp_path / 'serial.csv'), workers=0)
+    run_batch(str(problems), str(tmp_path / 'pool.csv'), workers=2, chunk_size=1)
+    serial = _read_output(tmp_path / 'serial.csv').sort_values(['problem', 'alternative'], ignore_index=True)
+    pool = _read_output(tmp_path / 'pool.csv').sort_values(['problem', 'alternative'], ignore_index=True)
+    pd.testing.assert_frame_equal(pool, serial)
+
+
+def test_discover_problems_is_sorted_and_recursive(tmp_path):
+    for name in ('b.json', 'a.JSON', 'nested/c.json', 'notes.txt'):
+        (tmp_path / name).parent.mkdir(exist_ok=True)
+        (tmp_path / name).write_text('{}')
+    assert [path[len(str(tmp_path)) + 1:] for path in discover_problems(str(tmp_path))] == [
+        'a.JSON', 'b.json', 'nested/c.json']
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from dss.sensitivity import all_pairs, rank_reversal_thresholds, weight_sensitivity
+from tests import baseline
+from tests.problems import topsis_frame
+
+
+def _page_score(method, matrix, criteria_types):
+    if method == 'saw':
+        return lambda weights: baseline.saw_method(matrix, weights, criteria_types)[1]
+    return lambda weights: baseline.topsis(topsis_frame(matrix), weights,
+                                           criteria_types == 'benefit')['Closeness Coefficient'].to_numpy()
+
+
+# Each finite threshold is checked by re-scoring just before and just after it
+@pytest.mark.parametrize('method', ['saw', 'topsis'])
+def test_thresholds_are_where_the_best_alternative_changes(small_problem, method):
+    matrix, weights, criteria_types = small_problem
+    score = _page_score(method, matrix, criteria_types)
+    sensitivity = weight_sensitivity(method, matrix, weights, criteria_types)
+    assert sensitivity.best == np.argmax(score(weights))
+    crossings = 0
+    for k in range(len(weights)):
+        for change, new_best in ((sensitivity.decrease[k], sensitivity.decrease_by[k]),
+                                 (sensitivity.increase[k], sensitivity.increase_by[k])):
+            if np.isfinite(change):
+                before, after = weights.copy(), weights.copy()
+                before[k] += change * (1 - 1e-6)
+                after[k] += change * (1 + 1e-6)
+                assert np.argmax(score(before)) == sensitivity.best
+                assert np.argmax(score(after)) == new_best
+                crossings += 1
+    assert crossings
+
+
+def test_saw_pair_thresholds_swap_the_pair(small_problem):
+    matrix, weights, criteria_types = small_problem
+    matrix = matrix[:12]
+    thresholds = rank_reversal_thresholds('saw', matrix, weights, criteria_types)
+    first, second = all_pairs(len(matrix))
+    before = baseline.saw_method(matrix, weights, criteria_types)[1]
+    i, k = np.argwhere(np.isfinite(thresholds))[0]
+    changed = weights.copy()
+    changed[k] += thresholds[i, k] * (1 + 1e-6)
+    after = baseline.saw_method(matrix, changed, criteria_types)[1]
+    assert np.sign(before[first[i]] - before[second[i]]) != np.sign(after[first[i]] - after[second[i]])
+
+
+def test_unknown_method_and_bad_weights_are_rejected(small_problem):
+    matrix, weights, criteria_types = small_problem
+    with pytest.raises(ValueError):
+        weight_sensitivity('wp', matrix, weights, criteria_types)
+    with pytest.raises(ValueError):
+        weight_sensitivity('saw', matrix, -weights, criteria_types)
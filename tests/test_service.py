@@ -0,0 +1,136 @@
+import asyncio
+import json
+
+import numpy as np
+import pytest
+
+from dss.service import RequestError, ScoringService, parse_problem, score_batch
+from tests import baseline
+from tests.problems import comparison_matrix, topsis_frame
+
+
+# Function to send one request to the ASGI service in process; returns (status, body)
+def _request(method, body, content_type='application/json', http_method='POST'):
+    messages = [{'type': 'http.request', 'body': body}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {'type': 'http', 'method': http_method, 'path': f'/{method}', 'query_string': b'',
+             'headers': [(b'content-type', content_type.encode())]}
+    service = ScoringService(n_workers=0)
+    asyncio.run(service(scope, receive, send))
+    service.shutdown()
+    return sent[0]['status'], sent[1]['body']
+
+
+def _arrow_stream(table):
+    import pyarrow as pa
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _body(matrix, weights, criteria_types):
+    return json.dumps({'matrix': np.asarray(matrix).tolist(), 'weights': np.asarray(weights).tolist(),
+                       'criteria_types': np.asarray(criteria_types).tolist()}).encode()
+
+
+@pytest.mark.parametrize('method', ['saw', 'wp', 'topsis'])
+def test_scores_match_pages(small_problem, method):
+    matrix, weights, criteria_types = small_problem
+    status, body = _request(method, _body(matrix, weights, criteria_types))
+    assert status == 200
+    if method == 'topsis':
+        expected = baseline.topsis(topsis_frame(matrix), weights, criteria_types == 'benefit')
+        expected_scores, expected_ranks = expected['Closeness Coefficient'], expected['Ranking']
+    else:
+        expected_scores = (baseline.saw_method if method == 'saw' else baseline.wp_method)(
+            matrix, weights, criteria_types)[1]
+        expected_ranks = None
+    result = json.loads(body)
+    np.testing.assert_allclose(result['scores'], expected_scores, rtol=1e-12)
+    if expected_ranks is not None:
+        np.testing.assert_array_equal(result['ranks'], expected_ranks)
+
+
+def test_ahp_matches_page(rng):
+    import pandas as pd
+
+    matrix = comparison_matrix(rng, 5)
+    status, body = _request('ahp', json.dumps({'matrix': matrix.tolist()}).encode())
+    assert status == 200
+    ahp_df = pd.DataFrame(matrix)
+    priority_index = baseline.ahp_attributes(ahp_df)
+    result = json.loads(body)
+    np.testing.assert_allclose(result['priorities'], priority_index['priority index'], rtol=1e-12)
+    assert result['consistency_ratio'] == pytest.approx(baseline.consistency_ratio(priority_index, ahp_df)[1])
+
+
+def test_batched_problems_are_scored_independently(rng, small_problem):
+    matrix, _, criteria_types = small_problem
+    weights = rng.dirichlet(np.ones(matrix.shape[1]), size=4)
+    matrices = np.stack([matrix, matrix[::-1], matrix * 2, matrix + 1])
+    results = score_batch('saw', matrices, weights, tuple(criteria_types))
+    for k, (scores, _) in enumerate(results):
+        np.testing.assert_allclose(scores, baseline.saw_method(matrices[k], weights[k], criteria_types)[1], rtol=1e-12)
+
+
+def test_a_list_of_problems_gets_a_list_of_results(small_problem):
+    matrix, weights, criteria_types = small_problem
+    problem = json.loads(_body(matrix, weights, criteria_types))
+    status, body = _request('saw', json.dumps([problem, problem]).encode())
+    assert status == 200 and len(json.loads(body)) == 2
+
+
+def test_malformed_problems_are_client_errors(small_problem):
+    matrix, weights, criteria_types = small_problem
+    body = json.dumps({'matrix': matrix.tolist(), 'weights': weights.tolist(), 'criteria_types': 3}).encode()
+    assert _request('saw', body)[0] == 400
+    assert _request('saw', b'{not json')[0] == 400
+    assert _request('saw', _body(matrix, weights[:-1], criteria_types))[0] == 400
+    assert _request('vikor', _body(matrix, weights, criteria_types))[0] == 404
+    assert _request('saw', b'', http_method='GET')[0] == 405
+    with pytest.raises(RequestError):
+        parse_problem('ahp', {'matrix': [[1.0, 2.0]]})
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+def test_degenerate_problems_are_rejected_instead_of_returning_nan():
+    status, body = _request('saw', _body([[0, 1], [0, 2]], [0.5, 0.5], ['benefit', 'cost']))
+    assert status == 400 and 'positive maximum' in json.loads(body)['error']
+    status, body = _request('wp', _body([[-1, 1], [2, 2]], [0.5, 0.5], ['benefit', 'cost']))
+    assert status == 400 and 'not finite' in json.loads(body)['error']
+
+
+def test_batched_topsis_matches_page(rng, small_problem):
+    matrix, _, criteria_types = small_problem
+    weights = rng.dirichlet(np.ones(matrix.shape[1]), size=3)
+    matrices = np.stack([matrix, matrix[::-1], matrix * 2])
+    for k, (scores, ranks) in enumerate(score_batch('topsis', matrices, weights, tuple(criteria_types))):
+        expected = baseline.topsis(topsis_frame(matrices[k]), weights[k], criteria_types == 'benefit')
+        np.testing.assert_allclose(scores, expected['Closeness Coefficient'], rtol=1e-12)
+        np.testing.assert_array_equal(ranks, expected['Ranking'])
+
+
+def test_arrow_problem(small_problem):
+    pa = pytest.importorskip('pyarrow')
+    matrix, weights, criteria_types = small_problem
+    table = pa.table({f'c{j}': matrix[:, j] for j in range(matrix.shape[1])}).replace_schema_metadata(
+        {'dss': json.dumps({'weights': weights.tolist(), 'criteria_types': criteria_types.tolist()})})
+    status, body = _request('saw', _arrow_stream(table), 'application/vnd.apache.arrow.stream')
+    assert status == 200
+    np.testing.assert_allclose(json.loads(body)['scores'], baseline.saw_method(matrix, weights, criteria_types)[1],
+                               rtol=1e-12)
+
+
+def test_arrow_metadata_must_be_an_object(small_problem):
+    pa = pytest.importorskip('pyarrow')
+    table = pa.table({'c1': small_problem[0][:, 0]}).replace_schema_metadata({'dss': '[1, 2]'})
+    assert _request('saw', _arrow_stream(table), 'application/vnd.apache.arrow.stream')[0] == 400
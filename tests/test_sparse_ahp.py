@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from dss.sparse_ahp import (check_judgments, connected_components, incomplete_priorities, simulate_judgments,
+                            suggest_comparisons)
+from tests.problems import comparison_matrix
+
+
+def test_complete_judgments_give_the_row_geometric_mean(rng):
+    matrix = comparison_matrix(rng, 8)
+    upper = np.triu_indices(len(matrix), k=1)
+    geometric_mean = np.exp(np.log(matrix).mean(axis=1))
+    result = incomplete_priorities(len(matrix), *upper, matrix[upper])
+    np.testing.assert_allclose(result.priorities, geometric_mean / geometric_mean.sum(), rtol=1e-8)
+
+
+def test_incomplete_priorities_match_dense_least_squares():
+    first, second, values, _ = simulate_judgments(150, extra=2, sigma=0.3, seed=0)
+    incidence = np.zeros((len(values), 150))
+    incidence[np.arange(len(values)), first] = 1.0
+    incidence[np.arange(len(values)), second] = -1.0
+    expected = np.linalg.lstsq(incidence, np.log(values), rcond=None)[0]
+    result = incomplete_priorities(150, first, second, values)
+    np.testing.assert_allclose(result.log_priorities, expected - expected.mean(), atol=1e-7)
+    np.testing.assert_allclose(result.residuals, np.log(values) - incidence @ result.log_priorities, atol=1e-7)
+
+
+def test_a_spanning_tree_is_perfectly_consistent():
+    first, second = np.arange(1, 6), np.zeros(5, dtype=np.int64)
+    result = incomplete_priorities(6, first, second, np.arange(2.0, 7.0))
+    assert result.consistency_index == 0.0
+    np.testing.assert_allclose(result.priorities[1:] / result.priorities[0], np.arange(2.0, 7.0))
+
+
+def test_suggestions_pick_the_largest_missing_resistance():
+    first, second, _, _ = simulate_judgments(150, extra=2, sigma=0.3, seed=0)
+    incidence = np.zeros((len(first), 150))
+    incidence[np.arange(len(first)), first] = 1.0
+    incidence[np.arange(len(first)), second] = -1.0
+    pseudo_inverse = np.linalg.pinv(incidence.T @ incidence)
+    resistances = np.diag(pseudo_inverse)[:, None] + np.diag(pseudo_inverse)[None, :] - 2 * pseudo_inverse
+    missing = np.ones((150, 150), dtype=bool)
+    missing[first, second] = missing[second, first] = False
+    _, _, resistance = suggest_comparisons(150, first, second, count=1)
+    assert resistance[0] == pytest.approx(resistances[np.triu(missing, k=1)].max())
+
+
+def test_suggestions_are_new_distinct_pairs():
+    first, second, _, _ = simulate_judgments(40, extra=1, seed=1)
+    asked_first, asked_second, resistance = suggest_comparisons(40, first, second, count=15)
+    asked = set(zip(asked_first.tolist(), asked_second.tolist()))
+    observed = set(zip(first.tolist(), second.tolist())) | set(zip(second.tolist(), first.tolist()))
+    assert len(asked) == 15 and not asked & observed
+    assert (np.diff(resistance) <= 1e-12).all()
+
+
+def test_invalid_judgments_are_rejected():
+    with pytest.raises(ValueError, match='unconnected'):
+        check_judgments(4, [0, 2], [1, 3], [2.0, 3.0])
+    with pytest.raises(ValueError):
+        check_judgments(3, [0, 1], [1, 1], [2.0, 3.0])
+    with pytest.raises(ValueError):
+        check_judgments(3, [0, 1], [1, 2], [2.0, -3.0])
+    np.testing.assert_array_equal(connected_components(5, np.array([0, 3]), np.array([1, 4])), [0, 0, 2, 3, 3])
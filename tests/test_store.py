@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from dss.store import PACKAGE_SOURCES, ResultStore, source_fingerprint
+from tests import baseline
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ResultStore(str(tmp_path / 'store'))
+    yield store
+    store.close()
+
+
+def test_round_trip_through_a_second_store(tmp_path, store, problem):
+    matrix, weights, criteria_types = problem
+    compute = lambda: baseline.saw_method(matrix, weights, criteria_types)
+    stored = store.fetch('saw', compute, matrix, weights, criteria_types)
+    # A second store on the same directory reads the memory-mapped arrays back from disk
+    reopened = ResultStore(store.root)
+    reloaded = reopened.get(reopened.key('saw', matrix, weights, criteria_types))
+    reopened.close()
+    assert reloaded is not None
+    for expected, result in zip(stored, reloaded):
+        np.testing.assert_array_equal(result, expected)
+    np.testing.assert_array_equal(reloaded[1], compute()[1])
+
+
+def test_fetch_computes_once(store, problem):
+    matrix, weights, criteria_types = problem
+    calls = []
+    compute = lambda: calls.append(1) or baseline.saw_method(matrix, weights, criteria_types)[1]
+    for _ in range(3):
+        store.fetch('saw', compute, matrix, weights, criteria_types)
+    assert len(calls) == 1
+    assert store.stats()['entries'] == 1
+
+
+def test_history_is_kept_per_owner(store, problem):
+    matrix, weights, criteria_types = problem
+    saw = lambda: baseline.saw_method(matrix, weights, criteria_types)
+    wp = lambda: baseline.wp_method(matrix, weights, criteria_types)
+    store.fetch('saw', saw, matrix, weights, criteria_types, label='saw', owner='alice')
+    store.fetch('wp', wp, matrix, weights, criteria_types, label='wp', owner='bob')
+    store.fetch('saw', saw, matrix, weights, criteria_types, label='saw', owner='bob')
+    assert [entry['method'] for entry in store.history('alice')] == ['saw']
+    assert sorted(entry['method'] for entry in store.history('bob')) == ['saw', 'wp']
+    assert [entry['method'] for entry in store.history('bob', 'wp')] == ['wp']
+    assert store.history('carol') == []
+
+
+def test_least_recently_used_results_are_evicted(tmp_path):
+    store = ResultStore(str(tmp_path / 'store'), max_bytes=300_000)
+    arrays = [np.full(20_000, float(i)) for i in range(3)]
+    keys = [store.key('test', i) for i in range(3)]
+    for key, array in zip(keys, arrays):
+        store.put(key, array, 'test')
+    assert keys[0] not in store and keys[2] in store
+    store.close()
+
+
+def test_key_changes_with_the_source(tmp_path):
+    # Editing a source file changes its fingerprint, and with it every result key
+    source = tmp_path / 'scoring.py'
+    fingerprints = []
+    for text in ('SCALE = 1\n', 'SCALE = 10\n'):
+        source.write_text(text)
+        fingerprints.append(source_fingerprint(str(source), *PACKAGE_SOURCES))
+    assert fingerprints[0] != fingerprints[1]
+
+
+def test_results_are_not_shared_between_callers(store):
+    import pandas as pd
+
+    key = store.key('test', 1)
+    store.put(key, {'table': pd.DataFrame({'score': [1.0, 2.0]}), 'scores': np.arange(3.0)}, 'test')
+    first, second = store.get(key), store.get(key)
+    assert first is not second
+    first['table'].loc[0, 'score'] = 10.0
+    del first['scores']
+    assert second['table'].loc[0, 'score'] == 1.0 and store.get(key)['table'].loc[0, 'score'] == 1.0
+    with pytest.raises(ValueError):
+        second['scores'][0] = 10.0
+
+
+def test_store_directory_is_private(tmp_path):
+    import os
+    import stat
+
+    store = ResultStore(str(tmp_path / 'private'))
+    store.close()
+    assert stat.S_IMODE(os.stat(tmp_path / 'private').st_mode) == 0o700
+    shared = tmp_path / 'shared'
+    shared.mkdir()
+    shared.chmod(0o777)
+    with pytest.raises(PermissionError):
+        ResultStore(str(shared))
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dss.streaming import column_statistics, stream_saw, stream_topsis, stream_wp, top_indices
+from tests import baseline
+from tests.problems import topsis_frame
+
+
+def _top_rows(scores, k):
+    return np.argsort(-scores, kind='stable')[:k]
+
+
+def test_stream_saw_matches_page(problem):
+    matrix, weights, criteria_types = problem
+    rows, scores = stream_saw(matrix, weights, criteria_types, k=10, chunk_size=64)
+    expected = baseline.saw_method(matrix, weights, criteria_types)[1]
+    np.testing.assert_array_equal(rows, _top_rows(expected, 10))
+    np.testing.assert_allclose(scores, expected[rows], rtol=1e-12)
+
+
+def test_stream_wp_matches_page(problem):
+    matrix, weights, criteria_types = problem
+    rows, scores = stream_wp(matrix, weights, criteria_types, k=10, chunk_size=64)
+    expected = baseline.wp_method(matrix, weights, criteria_types)[1]
+    np.testing.assert_array_equal(rows, _top_rows(expected, 10))
+    np.testing.assert_allclose(scores, expected[rows], rtol=1e-12)
+
+
+def test_stream_topsis_matches_page(problem):
+    matrix, weights, criteria_types = problem
+    is_benefit_criteria = criteria_types == 'benefit'
+    rows, scores = stream_topsis(matrix, weights, is_benefit_criteria, k=10, chunk_size=64)
+    expected = baseline.topsis(topsis_frame(matrix), weights, is_benefit_criteria)['Closeness Coefficient'].to_numpy()
+    np.testing.assert_array_equal(rows, _top_rows(expected, 10))
+    np.testing.assert_allclose(scores, expected[rows], rtol=1e-12)
+
+
+def test_ties_keep_the_lower_row_like_a_stable_sort(rng):
+    # Few distinct values, so many rows tie at the k-th score within and across chunks
+    tied = rng.integers(1, 4, size=(20_000, 2)).astype(np.float64)
+    criteria_types = np.array(['benefit', 'cost'])
+    rows, _ = stream_saw(tied, [0.5, 0.5], criteria_types, k=100, chunk_size=5000)
+    np.testing.assert_array_equal(rows, _top_rows(baseline.saw_method(tied, [0.5, 0.5], criteria_types)[1], 100))
+
+
+def test_csv_source_matches_in_memory(tmp_path, problem):
+    matrix, weights, criteria_types = problem
+    path = tmp_path / 'matrix.csv'
+    pd.DataFrame(matrix).to_csv(path, index=False)
+    expected = stream_saw(matrix, weights, criteria_types, k=5)
+    from_file = stream_saw(str(path), weights, criteria_types, k=5, chunk_size=100)
+    np.testing.assert_array_equal(from_file[0], expected[0])
+    np.testing.assert_allclose(from_file[1], expected[1], rtol=1e-12)
+
+
+def test_column_statistics_over_chunks(problem):
+    matrix = problem[0]
+    stats = column_statistics(matrix, chunk_size=33)
+    np.testing.assert_array_equal(stats['max'], matrix.max(axis=0))
+    np.testing.assert_array_equal(stats['min'], matrix.min(axis=0))
+    np.testing.assert_allclose(stats['sum_of_squares'], (matrix ** 2).sum(axis=0))
+    assert stats['rows'] == len(matrix)
+
+
+def test_empty_matrix_is_rejected():
+    with pytest.raises(ValueError):
+        column_statistics(np.empty((0, 3)))
+
+
+def test_top_indices_ranks_nan_last():
+    np.testing.assert_array_equal(top_indices(np.array([np.nan, 1.0, 3.0, 1.0]), 3), [2, 1, 3])
+
+
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+def test_nan_scores_rank_last_across_chunks():
+    # A zero cost value is the column minimum, so its row scores 0 / 0 = NaN
+    matrix = np.array([[1.0, 0.0], [2.0, 1.0], [1.5, 0.0], [3.0, 2.0]])
+    rows, scores = stream_saw(matrix, [0.5, 0.5], ['benefit', 'cost'], k=3, chunk_size=1)
+    np.testing.assert_array_equal(rows, [3, 1, 0])
+    np.testing.assert_allclose(scores, [0.5, 1 / 3, np.nan])
@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+
+from dss.topsis import rank_descending, topsis, topsis_report, topsis_scores
+from tests import baseline
+from tests.problems import topsis_frame
+
+
+def test_topsis_matches_page(problem):
+    matrix, weights, criteria_types = problem
+    is_benefit_criteria = criteria_types == 'benefit'
+    result = topsis(topsis_frame(matrix), weights, is_benefit_criteria)
+    expected = baseline.topsis(topsis_frame(matrix), weights, is_benefit_criteria)
+    np.testing.assert_allclose(result['Closeness Coefficient'], expected['Closeness Coefficient'], rtol=1e-12)
+    np.testing.assert_array_equal(result['Ranking'], expected['Ranking'])
+    np.testing.assert_array_equal(result['Conclusion'], expected['Conclusion'])
+
+
+def test_topsis_report_steps_match_page(problem):
+    matrix, weights, criteria_types = problem
+    _, steps = topsis_report(topsis_frame(matrix), weights, criteria_types == 'benefit')
+    steps = dict(steps)
+    normalized = baseline.normalize_matrix_topsis(topsis_frame(matrix).iloc[:, 1:])
+    np.testing.assert_allclose(steps['Normalized Matrix'], normalized, rtol=1e-12)
+    np.testing.assert_allclose(steps['Weighted Matrix'], normalized * weights, rtol=1e-12)
+
+
+def test_topsis_scores_matches_page(problem):
+    matrix, weights, criteria_types = problem
+    is_benefit_criteria = criteria_types == 'benefit'
+    expected = baseline.topsis(topsis_frame(matrix), weights, is_benefit_criteria)['Closeness Coefficient']
+    np.testing.assert_allclose(topsis_scores(matrix, weights, is_benefit_criteria), expected, rtol=1e-12)
+    np.testing.assert_allclose(topsis_scores(matrix, weights, is_benefit_criteria, dtype=np.float32), expected,
+                               atol=1e-5)
+
+
+def test_topsis_scores_overwrites_input_only_when_asked(problem):
+    matrix, weights, criteria_types = problem
+    original = matrix.copy()
+    scores = topsis_scores(matrix, weights, criteria_types == 'benefit')
+    np.testing.assert_array_equal(matrix, original)
+    np.testing.assert_array_equal(topsis_scores(matrix, weights, criteria_types == 'benefit', overwrite_input=True),
+                                  scores)
+
+
+def test_identical_alternatives_share_the_first_rank():
+    matrix = np.array([[1.0, 2.0], [1.0, 2.0], [3.0, 1.0]])
+    result = topsis(topsis_frame(matrix), [0.5, 0.5], [True, True])
+    expected = baseline.topsis(topsis_frame(matrix), [0.5, 0.5], [True, True])
+    np.testing.assert_array_equal(result['Ranking'], expected['Ranking'])
+
+
+def test_rank_descending_gives_ties_the_smallest_rank(rng):
+    scores = rng.integers(0, 5, size=200).astype(np.float64)
+    ranks, order = rank_descending(scores)
+    np.testing.assert_array_equal(ranks, pd.Series(scores).rank(ascending=False, method='min').astype(int))
+    np.testing.assert_array_equal(order, np.argsort(-scores, kind='stable'))
+
+
+def test_rank_descending_puts_nan_last():
+    ranks, _ = rank_descending(np.array([np.nan, 2.0, 3.0, np.nan]))
+    np.testing.assert_array_equal(ranks, [3, 2, 1, 3])
+
@@ -0,0 +1,47 @@
+import pytest
+
+pytest.importorskip('streamlit')
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+
+# Function to run a script that collects a decision matrix and shows its shape and total
+def matrix_script():
+    import streamlit as st
+
+    from dss.ui import matrix_editor
+
+    frame = matrix_editor('test', 3, 2, value=2.0)
+    st.write(f'{frame.shape} {frame.to_numpy().sum()} {list(frame.index)}')
+
+
+# Function to run a script that collects a comparison matrix and shows its entries
+def comparison_script():
+    import streamlit as st
+
+    from dss.ui import comparison_inputs
+
+    matrix = comparison_inputs('test', ['A', 'B', 'C'], 'Comparisons')
+    st.write(str(matrix.to_numpy().round(4).tolist()))
+
+
+def test_matrix_editor_returns_the_default_grid():
+    app = AppTest.from_function(matrix_script).run()
+    assert not app.exception
+    assert app.markdown[-1].value == "(3, 2) 12.0 ['Alternative 1', 'Alternative 2', 'Alternative 3']"
+    # One revision token per criteria column, distinct between the columns
+    revisions = app.session_state['test_revisions']
+    assert len(revisions) == 2 and revisions[0] != revisions[1]
+
+
+def test_comparison_inputs_mirror_reciprocals_on_submit():
+    app = AppTest.from_function(comparison_script).run()
+    assert app.markdown[-1].value == str([[1.0] * 3] * 3)
+    # The test client reports expanders as closed on every run, so open the section by its key
+    app.session_state['test_section'] = True
+    app = app.run()
+    app.number_input(key='test_0_1').set_value(4.0)
+    app.button[0].click()
+    app.session_state['test_section'] = True
+    app = app.run()
+    assert not app.exception
+    assert app.markdown[-1].value == str([[1.0, 4.0, 1.0], [0.25, 1.0, 1.0], [1.0, 1.0, 1.0]])
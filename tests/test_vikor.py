@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from dss.vikor import compromise_solutions, regret_matrix, vikor_method
+
+
+def test_vikor_matches_the_regret_loop(small_problem):
+    matrix, weights, criteria_types = small_problem
+    oriented = np.where(criteria_types == 'cost', -matrix, matrix)
+    regret = (oriented.max(axis=0) - oriented) / (oriented.max(axis=0) - oriented.min(axis=0)) * (weights / weights.sum())
+    utility, worst_regret, compromise = vikor_method(matrix, weights, criteria_types)
+    np.testing.assert_allclose(utility, regret.sum(axis=1), rtol=1e-12)
+    np.testing.assert_allclose(worst_regret, regret.max(axis=1), rtol=1e-12)
+    rescaled_utility = (utility - utility.min()) / (utility.max() - utility.min())
+    rescaled_regret = (worst_regret - worst_regret.min()) / (worst_regret.max() - worst_regret.min())
+    np.testing.assert_allclose(compromise, 0.5 * rescaled_utility + 0.5 * rescaled_regret, rtol=1e-12)
+
+
+def test_equal_columns_have_no_regret():
+    np.testing.assert_array_equal(regret_matrix(np.array([[1.0, 4.0], [1.0, 2.0]]), ['benefit', 'cost']),
+                                  [[0.0, 1.0], [0.0, 0.0]])
+
+
+def test_compromise_solutions():
+    # Clear winner, best by S as well: accepted alone
+    np.testing.assert_array_equal(compromise_solutions(np.array([0.1, 0.5, 0.9]), np.array([0.1, 0.5, 0.9]),
+                                                       np.array([0.0, 0.6, 1.0])), [0])
+    # No acceptable advantage: every alternative within 1 / (n - 1) of the best
+    np.testing.assert_array_equal(compromise_solutions(np.array([0.2, 0.1, 0.9]), np.array([0.2, 0.1, 0.9]),
+                                                       np.array([0.0, 0.3, 1.0])), [0, 1])
+
+
+def test_strategy_weight_out_of_range_is_rejected(small_problem):
+    with pytest.raises(ValueError):
+        vikor_method(*small_problem, v=1.5)
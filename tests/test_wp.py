@@ -0,0 +1,28 @@
+import numpy as np
+
+from dss.saw import normalize_matrix
+from dss.wp import normalize_matrix_wp, wp_method, wp_scores
+from tests import baseline
+
+
+def test_normalize_matrix_wp_matches_page(problem):
+    matrix, _, criteria_types = problem
+    np.testing.assert_array_equal(normalize_matrix_wp(matrix, criteria_types),
+                                  baseline.normalize_matrix_wp(matrix, criteria_types))
+
+
+def test_wp_method_matches_page(problem):
+    matrix, weights, criteria_types = problem
+    normalized, scores = wp_method(matrix, weights, criteria_types)
+    expected_normalized, expected_scores = baseline.wp_method(matrix, weights, criteria_types)
+    np.testing.assert_array_equal(normalized, expected_normalized)
+    np.testing.assert_allclose(scores, expected_scores, rtol=1e-12)
+
+
+def test_stacked_matrices_are_scored_one_by_one(rng, problem):
+    matrix, _, criteria_types = problem
+    stack = np.stack([matrix, matrix[::-1] * 2])
+    weights = rng.dirichlet(np.ones(matrix.shape[1]), size=len(stack))
+    scores = wp_scores(normalize_matrix(stack, criteria_types), weights)
+    for k in range(len(stack)):
+        np.testing.assert_allclose(scores[k], baseline.wp_method(stack[k], weights[k], criteria_types)[1], rtol=1e-12)